@@ -1,3 +1,3 @@
 __version__ = "10.0.11"
 
-from .plugin import register
+from .plugin import load_configuration, register
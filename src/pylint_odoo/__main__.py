@@ -0,0 +1,54 @@
+"""pylint with the pylint-odoo plugin loaded
+
+    pylint-odoo [pylint options] {ADDONS-PATH}/*
+
+Keep the linter in memory serving the files to lint of the clients in a Unix socket
+(e.g. for editors or pre-commit) with the pylint options of the server
+
+    pylint-odoo --serve --socket=/tmp/pylint-odoo.sock [pylint options]
+    pylint-odoo --socket=/tmp/pylint-odoo.sock path/to/file.py
+
+Check only the manifest files without checking the python files
+
+    pylint-odoo --manifests-only [pylint options] {ADDONS-PATH}/*
+"""
+
+import argparse
+import sys
+
+from pylint.lint import Run
+
+from . import manifest_linter, server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="pylint-odoo",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="The other arguments are passed to pylint",
+    )
+    parser.add_argument("--serve", action="store_true", help="Run the server in the Unix socket of --socket")
+    parser.add_argument("--socket", help="Path of the Unix socket of the server to send the files to lint")
+    parser.add_argument("--manifests-only", action="store_true", help="Check only the manifest files")
+    args, pylint_args = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+    if args.serve:
+        if not args.socket:
+            parser.error("--serve requires --socket")
+        server.serve(args.socket, pylint_args)
+        return 0
+    if args.socket:
+        try:
+            output, status = server.send_request(args.socket, pylint_args)
+        except OSError as socket_exc:
+            print(f"The server of {args.socket} is not running: {socket_exc}", file=sys.stderr)
+            return server.ERROR_STATUS
+        sys.stdout.write(output)
+        return status
+    run_class = manifest_linter.ManifestRun if args.manifests_only else Run
+    # pylint exits with its own status (e.g. --fail-under or --exit-zero)
+    run_class(["--load-plugins=pylint_odoo", *pylint_args])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
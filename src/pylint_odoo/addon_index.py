@@ -0,0 +1,215 @@
+import ast
+import os
+
+from astroid import nodes
+
+from . import misc
+
+# Entries of a sub-directory that make it the root of other repository or odoo module
+NESTED_ROOT_NAMES = frozenset([".git", *misc.MANIFEST_FILES])
+
+# Directories not scanned at any level (e.g. VCS metadata or javascript packages)
+# and directories relative to the root of the module not scanned (e.g. vendored libraries)
+# since they can have thousands of files not checked. Their files are checked in the filesystem
+SKIPPED_DIR_NAMES = frozenset([".git", ".hg", ".svn", "node_modules"])
+SKIPPED_DIR_PATHS = frozenset([os.path.join("static", "lib")])
+
+
+def literal_eval_node(node):
+    """Same as ast.literal_eval(node.as_string()) but evaluating the astroid node directly
+    without generating its source code to be parsed again"""
+    if isinstance(node, nodes.Const):
+        return node.value
+    if isinstance(node, nodes.List):
+        return [literal_eval_node(elt) for elt in node.elts]
+    if isinstance(node, nodes.Tuple):
+        return tuple(literal_eval_node(elt) for elt in node.elts)
+    if isinstance(node, nodes.Set):
+        try:
+            return {literal_eval_node(elt) for elt in node.elts}
+        except TypeError as type_exc:
+            raise ValueError(f"malformed node or string: {node!r}") from type_exc
+    if isinstance(node, nodes.Dict):
+        try:
+            return {literal_eval_node(key): literal_eval_node(value) for key, value in node.items}
+        except TypeError as type_exc:
+            raise ValueError(f"malformed node or string: {node!r}") from type_exc
+    if (
+        isinstance(node, nodes.UnaryOp)
+        and node.op in ("+", "-")
+        and isinstance(node.operand, nodes.Const)
+        and type(node.operand.value) in (int, float, complex)
+    ):
+        return +node.operand.value if node.op == "+" else -node.operand.value
+    raise ValueError(f"malformed node or string: {node!r}")
+
+
+class Manifest:
+    """Manifest of an odoo module parsed lazily only once
+
+    The data is evaluated from the astroid Dict node if it was already built
+    (e.g. linting the manifest file) or from the source of the file otherwise
+    """
+
+    def __init__(self, path, mtime=None, node=None):
+        self.path = path
+        self.mtime = mtime
+        self.module_name = os.path.basename(os.path.dirname(path))
+        self.from_node = node is not None
+        self._node = node
+        self._parsed = False
+        self._data = None
+
+    @property
+    def data(self):
+        """Dictionary of the manifest or None if it is not a valid literal"""
+        if not self._parsed:
+            self._data = self._parse()
+            self._parsed = True
+            self._node = None
+        return self._data
+
+    def _parse(self):
+        try:
+            if self._node is not None:
+                data = literal_eval_node(self._node)
+            else:
+                with open(self.path, encoding="UTF-8") as f_manifest:
+                    data = ast.literal_eval(f_manifest.read())
+        except (OSError, SyntaxError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+
+class Addon:
+    """Files of an odoo module found scanning its directory once
+
+    The directories of other repositories or odoo modules nested in the module,
+    the VCS and vendored directories (SKIPPED_DIR_NAMES and SKIPPED_DIR_PATHS)
+    and the directories linked are not scanned so the files inside them are checked
+    in the filesystem directly
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.dirs = []
+        self.files = set()
+        self.unscanned_dirs = set()
+        self.migrations = ()
+        self._scan()
+
+    def _scan(self):
+        pending_dirs = [""]
+        while pending_dirs:
+            reldir = pending_dirs.pop()
+            try:
+                with os.scandir(os.path.join(self.root, reldir)) as entries:
+                    entries = list(entries)
+            except OSError:
+                self.unscanned_dirs.add(reldir)
+                continue
+            if reldir and any(entry.name in NESTED_ROOT_NAMES for entry in entries):
+                self.unscanned_dirs.add(reldir)
+                continue
+            self.dirs.append(reldir)
+            for entry in entries:
+                relpath = os.path.join(reldir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in SKIPPED_DIR_NAMES or relpath in SKIPPED_DIR_PATHS:
+                        self.unscanned_dirs.add(relpath)
+                    else:
+                        pending_dirs.append(relpath)
+                elif entry.is_symlink() and entry.is_dir():
+                    self.unscanned_dirs.add(relpath)
+                elif entry.is_file():
+                    self.files.add(relpath)
+        migrations_path = os.path.join(self.root, "migrations")
+        try:
+            with os.scandir(migrations_path) as entries:
+                self.migrations = tuple(entry.name for entry in entries if entry.is_dir())
+        except OSError:
+            pass
+
+    def isfile(self, relpath):
+        """Same as os.path.isfile for a path relative to the root of the module"""
+        norm_relpath = os.path.normpath(relpath)
+        if os.path.isabs(norm_relpath) or norm_relpath.split(os.sep, 1)[0] == os.pardir:
+            return os.path.isfile(os.path.join(self.root, relpath))
+        parent_path = os.path.dirname(norm_relpath)
+        while parent_path:
+            if parent_path in self.unscanned_dirs:
+                return os.path.isfile(os.path.join(self.root, relpath))
+            parent_path = os.path.dirname(parent_path)
+        return norm_relpath in self.files
+
+    def count_py_files(self):
+        """Number of python files of the module that could define classes (neither __init__.py nor the manifest)
+        or None if it is unknown since a directory that could have python files was not scanned
+        (e.g. linked or nested), unlike the VCS and vendored directories
+        """
+        if any(
+            os.path.basename(reldir) not in SKIPPED_DIR_NAMES and reldir not in SKIPPED_DIR_PATHS
+            for reldir in self.unscanned_dirs
+        ):
+            return None
+        return sum(
+            relpath.endswith(".py") and os.path.basename(relpath) not in ("__init__.py", *misc.MANIFEST_FILES)
+            for relpath in self.files
+        )
+
+
+class AddonIndex:
+    """Odoo modules scanned once per run to avoid checking the filesystem for each node
+
+    An odoo module is scanned the first time it is queried by its root directory
+    (e.g. for the manifest file) or by one of its directories (e.g. for the python files)
+    """
+
+    def __init__(self):
+        self._addons = {}
+        self._manifest_paths = {}
+        self._manifests = {}
+
+    def get_addon(self, root):
+        """Get the module with the root directory "root" scanning it only the first time"""
+        try:
+            return self._addons[root]
+        except KeyError:
+            addon = self._addons[root] = Addon(root)
+            return addon
+
+    def get_manifest_path(self, dirpath):
+        """Same as misc.walk_up for the manifest files limited to misc.top_path
+        but resolving all the directories of the module found at once"""
+        try:
+            return self._manifest_paths[dirpath]
+        except KeyError:
+            pass
+        manifest_path = misc.walk_up(dirpath, tuple(misc.MANIFEST_FILES), misc.top_path(dirpath))
+        self._manifest_paths[dirpath] = manifest_path
+        if manifest_path:
+            addon = self.get_addon(os.path.dirname(manifest_path))
+            for reldir in addon.dirs:
+                self._manifest_paths.setdefault(os.path.normpath(os.path.join(addon.root, reldir)), manifest_path)
+        return manifest_path
+
+    def refresh(self):
+        """Forget the modules scanned to find the files added or removed since then
+        e.g. between the requests of a long-running server (pylint-odoo --serve)
+        The manifests are kept since they are parsed again only if they are modified"""
+        self._addons = {}
+        self._manifest_paths = {}
+
+    def get_manifest(self, manifest_path, node=None):
+        """Get the manifest parsed only once while the file is not modified
+
+        :param node: astroid Dict node of the manifest to avoid parsing the file again
+        """
+        try:
+            mtime = os.stat(manifest_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        manifest = self._manifests.get(manifest_path)
+        if manifest is None or manifest.mtime != mtime or (node is not None and not manifest.from_node):
+            manifest = self._manifests[manifest_path] = Manifest(manifest_path, mtime, node)
+        return manifest
@@ -60,15 +60,25 @@ def is_executable(node):
     return False
 
 
-def apply_augmentations(linter):
+def apply_augmentations(linter, profiler=None):
     """Apply suppression rules."""
 
+    def timed(predicate, msg):
+        """Time the predicate if the profiler is enabled (--odoolint-profile)"""
+        if profiler is None:
+            return predicate
+        return profiler.wrap(predicate, f"augmentations.{predicate.__name__}({msg})", (msg,), check_enabled=True)
+
     # W0104 - pointless-statement
     # manifest file have a valid pointless-statement dict
-    suppress_message(linter, BasicChecker.visit_expr, "pointless-statement", is_manifest_file)
+    suppress_message(
+        linter, BasicChecker.visit_expr, "pointless-statement", timed(is_manifest_file, "pointless-statement")
+    )
 
     # C0103 - invalid-name and W0613 - unused-argument for migrations/
-    suppress_message(linter, NameChecker.visit_module, "invalid-name", is_migration_path)
-    suppress_message(linter, NameChecker.visit_module, "invalid-name", is_executable)
-    suppress_message(linter, NameChecker.visit_functiondef, "invalid-name", is_migration_path)
-    suppress_message(linter, VariablesChecker.leave_functiondef, "unused-argument", is_migration_path)
+    suppress_message(linter, NameChecker.visit_module, "invalid-name", timed(is_migration_path, "invalid-name"))
+    suppress_message(linter, NameChecker.visit_module, "invalid-name", timed(is_executable, "invalid-name"))
+    suppress_message(linter, NameChecker.visit_functiondef, "invalid-name", timed(is_migration_path, "invalid-name"))
+    suppress_message(
+        linter, VariablesChecker.leave_functiondef, "unused-argument", timed(is_migration_path, "unused-argument")
+    )
@@ -0,0 +1,160 @@
+import ast
+import os
+import subprocess
+import warnings
+
+from . import misc
+from .addon_index import AddonIndex
+
+
+def git_changed_paths(top, base_ref):
+    """Get the absolute paths of the files changed in the working tree since "base_ref"
+    including the untracked files, reading only the local git repository of "top"
+    """
+    changed_paths = set()
+    for git_args in (
+        ["diff", "--name-only", "--no-renames", "-z", base_ref, "--"],
+        ["ls-files", "--others", "--exclude-standard", "-z"],
+    ):
+        output = subprocess.run(
+            ["git", "-C", top, *git_args], capture_output=True, check=True, text=True, encoding="UTF-8"
+        ).stdout
+        changed_paths.update(os.path.join(top, relpath) for relpath in output.split("\0") if relpath)
+    return changed_paths
+
+
+def git_show(top, base_ref, path):
+    """Get the content of the file "path" of the git repository "top" in "base_ref"
+    or None if the file did not exist then"""
+    relpath = os.path.relpath(path, top).replace(os.sep, "/")
+    result = subprocess.run(
+        ["git", "-C", top, "show", f"{base_ref}:{relpath}"],
+        capture_output=True,
+        check=False,
+        text=True,
+        encoding="UTF-8",
+    )
+    return None if result.returncode else result.stdout
+
+
+class ChangedFiles:
+    """Lint only the python files changed since a git reference (--odoolint-changed-since)
+
+    The files whose messages depend on the files changed are linted too:
+     - The manifest of the modules with any file changed
+     - The python files inheriting the same models in the modules with a python file changed
+     - All the python files of the modules whose manifest "depends" changed
+    """
+
+    def __init__(self, linter, addon_index=None):
+        self.linter = linter
+        self.addon_index = addon_index or AddonIndex()
+        self._paths_by_top = {}
+        self._should_analyze_file = linter.should_analyze_file
+
+    @property
+    def base_ref(self):
+        return getattr(self.linter.config, "odoolint_changed_since", "")
+
+    def install(self):
+        """Filter the files to lint of pylint"""
+        self.linter.should_analyze_file = self.should_analyze_file
+
+    def should_analyze_file(self, modname, path, is_argument=False):
+        if not self._should_analyze_file(modname, path, is_argument=is_argument):
+            return False
+        if not self.base_ref or not path.endswith(".py"):
+            return True
+        real_path = os.path.realpath(path)
+        paths = self.get_paths(misc.top_path(os.path.dirname(real_path)))
+        return paths is None or real_path in paths
+
+    def get_paths(self, top):
+        """Get the real paths of the python files to lint for the git repository "top"
+        or None if the files changed could not be computed"""
+        try:
+            return self._paths_by_top[top]
+        except KeyError:
+            pass
+        try:
+            changed_paths = git_changed_paths(top, self.base_ref)
+        except (OSError, subprocess.CalledProcessError) as git_exc:
+            warnings.warn(
+                f"It was not possible to get the files changed since {self.base_ref!r} for {top}. "
+                f"All the files are checked. {getattr(git_exc, 'stderr', None) or git_exc}",
+                UserWarning,
+                stacklevel=2,
+            )
+            self._paths_by_top[top] = None
+            return None
+        paths = set()
+        inherits_by_manifest = {}
+        depends_changed_manifests = set()
+        for changed_path in changed_paths:
+            real_path = os.path.realpath(changed_path)
+            manifest_path = self.addon_index.get_manifest_path(os.path.dirname(real_path))
+            if manifest_path:
+                paths.add(manifest_path)
+            if real_path == manifest_path and self._depends_changed(top, changed_path, manifest_path):
+                depends_changed_manifests.add(manifest_path)
+            if not real_path.endswith(".py") or not os.path.isfile(real_path):
+                continue
+            paths.add(real_path)
+            if manifest_path:
+                inherits_by_manifest.setdefault(manifest_path, set()).update(self._get_inherits(real_path))
+        for manifest_path, inherits in inherits_by_manifest.items():
+            if not inherits:
+                continue
+            addon = self.addon_index.get_addon(os.path.dirname(manifest_path))
+            for relpath in addon.files:
+                addon_path = os.path.join(addon.root, relpath)
+                if relpath.endswith(".py") and addon_path not in paths and inherits & self._get_inherits(addon_path):
+                    paths.add(addon_path)
+        for manifest_path in depends_changed_manifests:
+            addon = self.addon_index.get_addon(os.path.dirname(manifest_path))
+            paths.update(os.path.join(addon.root, relpath) for relpath in addon.files if relpath.endswith(".py"))
+        self._paths_by_top[top] = paths
+        return paths
+
+    def _depends_changed(self, top, changed_path, manifest_path):
+        """Check if the "depends" of the manifest changed since the base reference
+        (e.g. for missing-model-dependency in the python files not changed)"""
+        manifest_src = git_show(top, self.base_ref, changed_path)
+        if manifest_src is None:
+            return True
+        try:
+            old_data = ast.literal_eval(manifest_src)
+        except (SyntaxError, ValueError):
+            return True
+        new_data = self.addon_index.get_manifest(manifest_path).data
+        if not isinstance(old_data, dict) or new_data is None:
+            return True
+        return old_data.get("depends") != new_data.get("depends")
+
+    @staticmethod
+    def _get_inherits(path):
+        """Get the models inherited by the classes of the python file
+        for both the string and the list forms of _inherit"""
+        try:
+            with open(path, encoding="UTF-8") as f_py:
+                module = ast.parse(f_py.read(), path)
+        except (OSError, SyntaxError, ValueError):
+            return set()
+        inherits = set()
+        for class_node in ast.walk(module):
+            if not isinstance(class_node, ast.ClassDef):
+                continue
+            for stmt in class_node.body:
+                if not isinstance(stmt, ast.Assign) or not any(
+                    isinstance(target, ast.Name) and target.id == "_inherit" for target in stmt.targets
+                ):
+                    continue
+                try:
+                    value = ast.literal_eval(stmt.value)
+                except (TypeError, ValueError):
+                    continue
+                if isinstance(value, str):
+                    inherits.add(value)
+                elif isinstance(value, (list, tuple)):
+                    inherits.update(model for model in value if isinstance(model, str))
+        return inherits
@@ -1,26 +1,14 @@
 import re
-from contextlib import contextmanager
 from typing import Literal
-from unittest.mock import patch
 
 from astroid import builder, exceptions as astroid_exceptions, nodes
 from pylint.checkers import logging, utils
 
-from .. import misc
+from .. import misc, placeholders
 from .odoo_addons import OdooAddons
 from .odoo_base_checker import OdooBaseChecker
 
 
-@contextmanager
-def config_logging_modules(linter, modules):
-    original_logging_modules = linter.config.logging_modules
-    linter.config.logging_modules = modules
-    try:
-        yield
-    finally:
-        linter.config.logging_modules = original_logging_modules
-
-
 def transform_msgs(msgs):
     """Transform all the 'logging' messages and code to 'translation'
     from:
@@ -48,6 +36,14 @@ ODOO_MSGS = transform_msgs(logging.MSGS)
 # from the pylint AST walker when all of them are disabled, e.g. "translation-not-lazy"
 TRANSLATION_MSGS = tuple(msg_attrs[1] for msg_attrs in ODOO_MSGS.values())
 
+# Translation methods whose format string is checked similar to
+# pylint.checkers.logging.CHECKED_CONVENIENCE_FUNCTIONS
+CHECKED_TRANSLATION_FUNCTIONS = frozenset({"_"})
+
+# Logging convenience function checked by pylint the same way as the translation functions
+# since its format string is the first argument too e.g. _logger.info(format, *format_args)
+LOGGING_EQUIVALENT_FUNCTION = "info"
+
 
 class CustomLoggingChecker(OdooBaseChecker, logging.LoggingChecker):
     name = "odoolint"
@@ -80,8 +76,31 @@ class CustomLoggingChecker(OdooBaseChecker, logging.LoggingChecker):
             name = OdooAddons.get_func_name(node.func)
         if name not in misc.TRANSLATION_METHODS:
             return
-        with config_logging_modules(self.linter, ("odoo",)):
-            self._check_log_method(node, name)
+        self._check_log_method(node, name)
+
+    @staticmethod
+    def _copy_position(node, new_node):
+        node_attrs = ["lineno", "col_offset", "parent", "end_lineno", "end_col_offset", "position", "fromlineno"]
+        for node_attr in node_attrs:
+            setattr(new_node, node_attr, getattr(node, node_attr, None))
+
+    @staticmethod
+    def _get_last_arg_replaceable(tl_call):
+        """Check the last item of the translation call is a positional argument
+        that can be replaced by a new node built directly from the existing ones
+        e.g. _("...", arg) but not _("...", *args) or _("...", key=arg)"""
+        return tl_call.args and not tl_call.keywords and not isinstance(tl_call.args[-1], nodes.Starred)
+
+    def _build_tl_call(self, node, tl_call, last_arg):
+        """Build a new translation call node replacing the last argument of "tl_call"
+        re-using the existing nodes without changing their parents"""
+        new_node = nodes.Call(
+            node.lineno, node.col_offset, node.parent, end_lineno=node.end_lineno, end_col_offset=node.end_col_offset
+        )
+        new_node.postinit(func=tl_call.func, args=[*tl_call.args[:-1], last_arg], keywords=[])
+        last_arg.parent = new_node
+        self._copy_position(node, new_node)
+        return new_node
 
     def transform_formatcall2tlcall(self, node):
         """Transform no detectable node:
@@ -93,15 +112,37 @@ class CustomLoggingChecker(OdooBaseChecker, logging.LoggingChecker):
             isinstance(node, nodes.Call) and isinstance(node.func, nodes.Attribute) and node.func.attrname == "format"
         ):
             return
+        tl_call = node.func.expr
         if not (
-            isinstance(node.func.expr, nodes.Call)
-            and OdooAddons.get_func_name(node.func.expr.func) in misc.TRANSLATION_METHODS
+            isinstance(tl_call, nodes.Call) and OdooAddons.get_func_name(tl_call.func) in misc.TRANSLATION_METHODS
         ):
             # A plain '...'.format() can never be a translation call so the
-            # expensive re-parse of the source code below is skipped
+            # transformation below is skipped
             return
 
-        format_expr = node.func.expr.as_string()
+        if self._get_last_arg_replaceable(tl_call):
+            # node = self.env._('{param1}').format(param1='hello')
+            # new_node = self.env._('{param1}'.format(param1='hello'))
+            # new_node.args[0] = '{param1}'.format(param1='hello')
+            format_call = nodes.Call(
+                node.lineno, node.col_offset, None, end_lineno=node.end_lineno, end_col_offset=node.end_col_offset
+            )
+            format_attr = nodes.Attribute(
+                "format",
+                node.func.lineno,
+                node.func.col_offset,
+                format_call,
+                end_lineno=node.func.end_lineno,
+                end_col_offset=node.func.end_col_offset,
+            )
+            format_attr.postinit(expr=tl_call.args[-1])
+            format_call.postinit(func=format_attr, args=node.args, keywords=node.keywords)
+            # The new format call already has the position of the original node
+            # and the other arguments are the original nodes so their position is kept
+            return self._build_tl_call(node, tl_call, format_call)
+
+        # Starred or keyword arguments
+        format_expr = tl_call.as_string()
 
         args_str = ", ".join(arg.as_string() for arg in node.args)
         kwargs_str = ", ".join(f"{kw.arg}={kw.value.as_string()}" for kw in node.keywords)
@@ -111,16 +152,10 @@ class CustomLoggingChecker(OdooBaseChecker, logging.LoggingChecker):
             new_node = builder.extract_node(new_code)
         except astroid_exceptions.AstroidSyntaxError:
             return
-        # node = self.env._('{param1}').format(param1='hello')
-        # new_node = self.env._('{param1}'.format(param1='hello'))
-        # new_node.args[0] = '{param1}'.format(param1='hello')
         if not new_node.args:
             return
-        node_attrs = ["lineno", "col_offset", "parent", "end_lineno", "end_col_offset", "position", "fromlineno"]
-        for node_attr in node_attrs:
-            setattr(new_node, node_attr, getattr(node, node_attr, None))
-            # Help to preserve the lineno of the first arg used from pylint/checkers/logging.py::_check_log_method
-            setattr(new_node.args[0], node_attr, getattr(node, node_attr, None))
+        self._copy_position(node, new_node)
+        self._copy_position(node, new_node.args[0])
         return new_node
 
     def transform_binop2call(self, node):
@@ -129,14 +164,26 @@ class CustomLoggingChecker(OdooBaseChecker, logging.LoggingChecker):
         To detectable one:
            _("lazy detectable: %s" % es_err.error)
         """
-        new_code = f"{node.left.as_string()[:-1]} {node.op} {node.right.as_string()})"
+        tl_call = node.left
+        if self._get_last_arg_replaceable(tl_call):
+            binop = nodes.BinOp(
+                node.op,
+                node.lineno,
+                node.col_offset,
+                None,
+                end_lineno=node.end_lineno,
+                end_col_offset=node.end_col_offset,
+            )
+            binop.postinit(left=tl_call.args[-1], right=node.right)
+            return self._build_tl_call(node, tl_call, binop)
+
+        # Starred or keyword arguments
+        new_code = f"{tl_call.as_string()[:-1]} {node.op} {node.right.as_string()})"
         try:
             new_node = builder.extract_node(new_code)
         except astroid_exceptions.AstroidSyntaxError:
             return
-        node_attrs = ["lineno", "col_offset", "parent", "end_lineno", "end_col_offset", "position", "fromlineno"]
-        for node_attr in node_attrs:
-            setattr(new_node, node_attr, getattr(node, node_attr, None))
+        self._copy_position(node, new_node)
         return new_node
 
     @utils.only_required_for_messages(*TRANSLATION_MSGS)
@@ -147,11 +194,21 @@ class CustomLoggingChecker(OdooBaseChecker, logging.LoggingChecker):
         if new_node:
             self.visit_call(new_node)
 
-    def _check_log_method(self, *args, **kwargs):
-        with patch("pylint.checkers.logging.CHECKED_CONVENIENCE_FUNCTIONS", {"_"}):
-            super()._check_log_method(*args, **kwargs)
+    def _check_log_method(self, node: nodes.Call, name: str) -> None:
+        """Check the format string of the translation calls _(format, *format_args)
+        with pylint/checkers/logging.py::_check_log_method passing the name of an equivalent
+        logging convenience function instead of patching its globals for each call
+        """
+        if name in CHECKED_TRANSLATION_FUNCTIONS:
+            super()._check_log_method(node, LOGGING_EQUIVALENT_FUNCTION)
 
     def _check_format_string(self, node: nodes.Call, format_arg: Literal[0, 1]) -> None:
+        """Check the format string of the translation call matches its arguments
+
+        The placeholders parsed for the same string from the shared cache skip the calls
+        without anything to report, the rest are checked by
+        pylint/checkers/logging.py::_check_format_string to emit its own messages
+        """
         num_args = logging._count_supplied_tokens(node.args[format_arg + 1 :])
         # Custom revert for https://github.com/pylint-dev/pylint/commit/c23674554a7fac2fbb390cb67
         # since translation returns a string so it is a valid case for translation but not for logging
@@ -159,4 +216,15 @@ class CustomLoggingChecker(OdooBaseChecker, logging.LoggingChecker):
             # If no args were supplied the string is not interpolated and can contain
             # formatting characters - it's used verbatim. Don't check any further.
             return
-        return super()._check_format_string(node=node, format_arg=format_arg)
+        format_string = node.args[format_arg].value
+        if isinstance(format_string, bytes):
+            format_string = format_string.decode()
+        if isinstance(format_string, str):
+            required_num_args, has_keyword_args, unsupported_char_index, truncated = (
+                placeholders.parse_logging_format_string(format_string, self._format_style)
+            )
+            if has_keyword_args or (
+                unsupported_char_index is None and not truncated and num_args == required_num_args
+            ):
+                return
+        super()._check_format_string(node, format_arg)
@@ -101,16 +101,19 @@ import ast
 import itertools
 import os
 import re
-import string
 import warnings
 from collections import Counter, defaultdict
 from urllib.parse import urlparse
 
 from astroid import nodes
 from pylint.checkers import BaseChecker, utils
+from pylint.constants import WarningScope
 from pylint.lint import PyLinter
 
-from .. import misc
+from .. import misc, placeholders
+from ..addon_index import AddonIndex
+from ..dependency_graph import DependencyGraph
+from ..model_registry import ModelRegistry
 from .odoo_base_checker import OdooBaseChecker
 
 CHECK_DESCRIPTION = (
@@ -185,6 +188,11 @@ ODOO_MSGS = {
         "manifest-summary-multiline",
         CHECK_DESCRIPTION,
     ),
+    "C8121": (
+        'Depends "%s" is redundant since it is a dependency of "%s" too',
+        "manifest-redundant-depends",
+        CHECK_DESCRIPTION,
+    ),
     "E8101": (
         "The author key in the manifest file must be a string (with comma separated values)",
         "manifest-author-string",
@@ -253,6 +261,11 @@ ODOO_MSGS = {
         "translation-injection",
         CHECK_DESCRIPTION,
     ),
+    "E8152": (
+        "Circular dependency between the odoo modules: %s",
+        "manifest-circular-dependency",
+        CHECK_DESCRIPTION,
+    ),
     "F8101": ('File "%s": "%s" not found.', "resource-not-exist", CHECK_DESCRIPTION),
     "R8101": (
         "`odoo.exceptions.Warning` is a deprecated alias to `odoo.exceptions.UserError` "
@@ -358,8 +371,24 @@ ODOO_MSGS = {
         "deprecated-self-cr",
         CHECK_DESCRIPTION,
     ),
+    "W8166": (
+        'Odoo module "%s" imported but it is not in the depends of the manifest (directly or transitively)',
+        "missing-manifest-dependency",
+        CHECK_DESCRIPTION,
+    ),
+    "W8167": (
+        'Model "%s" inherited but its odoo module "%s" is not in the depends of the manifest (directly or transitively)',
+        "missing-model-dependency",
+        CHECK_DESCRIPTION,
+        # Added at the end of the run from the model registry without the node of the class
+        {"scope": WarningScope.LINE},
+    ),
 }
 
+# Messages computed from the model registry at the end of the run. The class records
+# of the registry are collected (and sent by the workers) only if one of them is enabled
+MODEL_REGISTRY_MSGS = ("missing-model-dependency",)
+
 DFTL_MANIFEST_REQUIRED_KEYS = ["license"]
 DFTL_MANIFEST_REQUIRED_KEYS_APP = ["currency", "images", "license", "support"]
 DFTL_ODOO_REQUIRED_FILES = []
@@ -433,6 +462,7 @@ DFTL_CURSOR_EXPR = [
     "self.cr",  # controllers and test
     "self.env.cr",
 ]
+SQL_EXECUTE_METHODS = frozenset({"execute", "executemany"})
 DFTL_ODOO_EXCEPTIONS = [
     # Extracted from odoo/exceptions.py of 16.0 and master
     "AccessDenied",
@@ -487,22 +517,40 @@ DFTL_DEPRECATED_ODOO_MODEL_METHODS = {"16.0": {"fields_view_get"}}
 
 DFTL_MANIFEST_KEYS_VALUES_TRUE = ["active", "installable"]
 
-# Regex used from https://github.com/translate/translate/blob/9de0d72437/translate/filters/checks.py#L50-L62  # noqa
-PRINTF_PATTERN = re.compile(
-    r"""
-        %(                          # initial %
-        (?P<boost_ord>\d+)%         # boost::format style variable order, like %1%
-        |
-              (?:(?P<ord>\d+)\$|    # variable order, like %1$s
-              \((?P<key>\w+)\))?    # Python style variables, like %(var)s
-        (?P<fullvar>
-            [+#-]*                  # flags
-            (?:\d+)?                # width
-            (?:\.\d+)?              # precision
-            (hh\|h\|l\|ll)?         # length formatting
-            (?P<type>[\w@]))        # type (%s, %d, etc.)
-        )""",
-    re.VERBOSE,
+# Sub-checks of "OdooAddons.visit_call" indexed by the name of the callee
+# e.g. "commit" for "self.env.cr.commit()" or None to run them for any callee
+# (callee_names, method_name, messages)
+CALL_CHECKS = (
+    (("print",), "_check_print_used", ("print-used",)),
+    (
+        None,
+        "_check_field_definition",
+        (
+            "attribute-string-redundant",
+            "inheritable-method-lambda",
+            "inheritable-method-string",
+            "method-compute",
+            "method-inverse",
+            "method-search",
+            "no-write-in-compute",
+            "renamed-field-parameter",
+            "translation-field",
+        ),
+    ),
+    (("commit",), "_check_invalid_commit", ("invalid-commit",)),
+    (("with_context",), "_check_context_overridden", ("context-overridden",)),
+    (("message_post",), "_check_message_post_translation", ("translation-required",)),
+    (("format",), "_check_translation_injection", ("translation-injection",)),
+    (
+        misc.TRANSLATION_METHODS,
+        "_check_translation_call",
+        ("prefer-env-translation", "translation-contains-variable", "translation-positional-used"),
+    ),
+    (SQL_EXECUTE_METHODS, "_check_sql_injection", ("sql-injection",)),
+    (None, "_check_external_request_timeout", ("external-request-timeout",)),
+    (None, "_check_bad_builtin_groupby", ("bad-builtin-groupby",)),
+    (("search", "search_read"), "_check_no_search_all", ("no-search-all",)),
+    (None, "_check_super_method_mismatch", ("super-method-mismatch",)),
 )
 
 
@@ -526,7 +574,8 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                 "type": "csv",
                 "metavar": "<comma separated values>",
                 "default": DFTL_CURSOR_EXPR,
-                "help": "List of cursor expr separated by a comma.",
+                "help": "List of cursor expr separated by a comma."
+                " Used by invalid-commit and to know the cursors whose queries are checked by sql-injection.",
             },
         ),
         (
@@ -735,6 +784,51 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                 "help": "List of categories allowed in manifest file for apps, separated by a comma.",
             },
         ),
+        (
+            "odoolint-cache-dir",
+            {
+                "type": "string",
+                "metavar": "<directory>",
+                "default": "",
+                "help": "Directory to cache the odoolint messages of each module. "
+                "The modules without changes (source, depends, plugin, pylint and astroid versions and options) "
+                "are not checked again but their cached messages are emitted instead. "
+                "Changes in the modules imported by a module (e.g. helpers of other packages) "
+                "do not invalidate its entry so clear the directory after changing them. "
+                "Empty value disables the cache.",
+            },
+        ),
+        (
+            "odoolint-profile",
+            {
+                "type": "string",
+                "metavar": "<path.json>",
+                "default": "",
+                "help": "Path of the JSON file to save the calls, cumulative time and slowest nodes "
+                "of each odoolint check and message. Empty value disables the profiling.",
+            },
+        ),
+        (
+            "odoolint-changed-since",
+            {
+                "type": "string",
+                "metavar": "<git reference>",
+                "default": "",
+                "help": "Check only the python files changed since the git reference (e.g. origin/main) "
+                "and the files whose messages depend on them: the manifests of the modules changed and "
+                "the files inheriting the same models. Empty value checks all the files.",
+            },
+        ),
+        (
+            "odoolint-jobs-by-addon",
+            {
+                "type": "yn",
+                "metavar": "<y or n>",
+                "default": False,
+                "help": "Send the files to the processes of the parallel mode (--jobs) in batches "
+                "of the same odoo module balanced by size instead of file by file.",
+            },
+        ),
     )
 
     checks_maxmin_odoo_version = {
@@ -748,19 +842,52 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         "deprecated-self-cr": {"odoo_minversion": "19.0"},
     }
 
-    def __init__(self, linter: PyLinter):
-        super().__init__(linter)
+    def __init__(self, linter: PyLinter, result_cache=None, addon_index=None, profiler=None, dependency_graph=None):
+        super().__init__(linter, result_cache, profiler)
+        self.addon_index = addon_index or AddonIndex()
+        self.dependency_graph = dependency_graph or DependencyGraph(self.addon_index)
         self._deprecated_odoo_methods = set()
         self.deprecated_field_parameters = {}
         self._odoo_inherit_items = defaultdict(set)
+        self._module_inherit_items = []
+        # Records of the odoo model classes for the model registry
+        # collected only if a message using it is enabled (computed by open())
+        self._collect_class_records = False
+        self._class_records = []
+        self._module_class_records = []
+        self.model_registry = ModelRegistry()
+        # Odoo model class and computes of the class being visited
+        self.class_odoo_models = False
+        self.odoo_computes = set()
+        self._call_checks_by_name = {}
+        self._call_checks_any = []
+        self._cursor_exprs = frozenset(DFTL_CURSOR_EXPR)
+        self._is_test_file = False
+        # (node, attribute name) of the analysis cached in the nodes of the current module
+        self._cached_nodes = []
+        # Options of the manifest checks compiled by open() only when they change
+        self._manifest_options_key = None
+        self._manifest_version_format_parsed = None
+        self._manifest_version_rgx = None
+        self._license_allowed = frozenset()
+        self._category_allowed = frozenset()
+        self._category_allowed_app = frozenset()
+        self._development_status_allowed = frozenset()
+        self._manifest_keys_values_true = frozenset()
+        self._manifest_required_authors = frozenset()
 
     def close(self):
         """Final process get all cached values and add messages"""
+        super().close()
         if self.linter.config.jobs > 1 and not self.linter.config.from_stdin:
             # In parallel mode (--jobs) close() is called once per file inside each
             # worker so the aggregated values are incomplete here. The messages are
             # added by reduce_map_data in the main process instead
             return
+        if self.result_cache is not None and self.result_cache.enabled:
+            # The modules replayed from the cache only have the serialized records
+            self.reduce_map_data(self.linter, [self.get_map_data()])
+            return
         for (_manifest_path, odoo_class_inherit), inh_nodes in self._odoo_inherit_items.items():
             # Skip _inherit='other.model' _name='model.name' because is valid
             inh_nodes = {
@@ -779,53 +906,162 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                 "consider-merging-classes-inherited", node=first_node, args=(odoo_class_inherit, ", ".join(path_nodes))
             )
         self._odoo_inherit_items = defaultdict(set)
+        self._build_model_registry(self._class_records)
+        self._class_records = []
+
+    @staticmethod
+    def _get_inherit_records(inherit_items):
+        """Serialize the (manifest_path, odoo_class_inherit), inh_node items"""
+        records = []
+        for (manifest_path, odoo_class_inherit), inh_node in inherit_items:
+            # Skip _inherit='other.model' _name='model.name' because is valid
+            if getattr(inh_node.parent, "odoo_attribute_name", None):
+                continue
+            records.append(
+                (
+                    manifest_path,
+                    odoo_class_inherit,
+                    inh_node.root().name,
+                    inh_node.root().file,
+                    inh_node.lineno,
+                    inh_node.col_offset,
+                )
+            )
+        return records
+
+    def _can_be_merged(self, manifest_path):
+        """Check if other python file of the module could inherit the same model
+        based only on the files of the module scanned once by worker"""
+        py_files_count = self.addon_index.get_addon(os.path.dirname(manifest_path)).count_py_files()
+        return py_files_count is None or py_files_count > 1
+
+    def _get_inherit_payload(self, records, class_records=()):
+        """Compact the inherit records grouped by (manifest_path, odoo_class_inherit)
+        using integer ids for the paths and module names repeated in the records
+
+        The groups with only one record are dropped if the module has no other python file
+        that could inherit the same model, so they never emit a message.
+        The class records of the model registry are added in "classes" using the same
+        path ids and module names
+        """
+        paths = {}
+        modnames = {}
+        groups = defaultdict(list)
+        for manifest_path, odoo_class_inherit, modname, node_path, lineno, col_offset in records:
+            manifest_id = paths.setdefault(manifest_path, len(paths))
+            path_id = paths.setdefault(node_path, len(paths))
+            modnames[path_id] = modname
+            groups[(manifest_id, odoo_class_inherit)].append((path_id, lineno, col_offset))
+        classes = []
+        for addon, modname, node_path, *class_record in class_records:
+            path_id = paths.setdefault(node_path, len(paths))
+            modnames[path_id] = modname
+            classes.append((addon, path_id, *class_record))
+        path_names = list(paths)
+        groups = {
+            (manifest_id, odoo_class_inherit): group_records
+            for (manifest_id, odoo_class_inherit), group_records in groups.items()
+            if len(group_records) > 1 or self._can_be_merged(path_names[manifest_id])
+        }
+        if not groups and not classes:
+            return None
+        payload = {"paths": path_names, "modnames": modnames, "groups": groups}
+        if classes:
+            payload["classes"] = classes
+        return payload
 
     def get_map_data(self):
         """Serialize the inherit items collected for the current file in a worker
         to be merged in the main process when running in parallel mode (--jobs)"""
-        data = []
-        for (manifest_path, odoo_class_inherit), inh_nodes in self._odoo_inherit_items.items():
-            for inh_node in inh_nodes:
-                # Skip _inherit='other.model' _name='model.name' because is valid
-                if getattr(inh_node.parent, "odoo_attribute_name", None):
-                    continue
-                data.append(
-                    (
-                        manifest_path,
-                        odoo_class_inherit,
-                        inh_node.root().name,
-                        inh_node.root().file,
-                        inh_node.lineno,
-                        inh_node.col_offset,
-                    )
-                )
+        records = self._get_inherit_records(
+            (key, inh_node) for key, inh_nodes in self._odoo_inherit_items.items() for inh_node in inh_nodes
+        )
+        class_records = self._class_records
+        if self.result_cache is not None:
+            records.extend(self.result_cache.pop_replayed_map_records())
+            class_records.extend(self.result_cache.pop_replayed_class_records())
         self._odoo_inherit_items = defaultdict(set)
-        return data or None
+        self._class_records = []
+        return self._get_inherit_payload(records, class_records) if records or class_records else None
 
     def reduce_map_data(self, linter, data):
         """Merge the inherit items of all the workers and add the messages
         skipped by close() in parallel mode (--jobs)"""
+        # Interned ids of the paths and module names of all the payloads
+        paths = {}
+        modnames = {}
         inherit_items = defaultdict(set)
-        for records in data:
-            for manifest_path, odoo_class_inherit, modname, node_path, lineno, col_offset in records:
-                inherit_items[(manifest_path, odoo_class_inherit)].add((node_path, lineno, col_offset, modname))
-        for (_manifest_path, odoo_class_inherit), records in inherit_items.items():
+        class_records = []
+        for payload in data:
+            if not payload:
+                continue
+            class_records.extend(
+                (addon, payload["modnames"][path_id], payload["paths"][path_id], *class_record)
+                for addon, path_id, *class_record in payload.get("classes", ())
+            )
+            path_ids = [paths.setdefault(path, len(paths)) for path in payload["paths"]]
+            for path_id, modname in payload["modnames"].items():
+                modnames[path_ids[path_id]] = modname
+            for (manifest_id, odoo_class_inherit), group_records in payload["groups"].items():
+                inherit_items[(path_ids[manifest_id], odoo_class_inherit)].update(
+                    (path_ids[path_id], lineno, col_offset) for path_id, lineno, col_offset in group_records
+                )
+        path_names = list(paths)
+        for (_manifest_id, odoo_class_inherit), records in inherit_items.items():
             if len(records) <= 1:
                 continue
             # deterministic order of the output
-            records = sorted(records)
-            first_path, first_lineno, first_col_offset, first_modname = records.pop()
+            records = sorted(
+                (path_names[path_id], lineno, col_offset, path_id) for path_id, lineno, col_offset in records
+            )
+            first_path, first_lineno, first_col_offset, first_path_id = records.pop()
             path_records = [
                 "%s:%d:%d" % (os.path.relpath(node_path, os.getcwd()), lineno, col_offset)
-                for node_path, lineno, col_offset, _modname in records
+                for node_path, lineno, col_offset, _path_id in records
             ]
-            linter.set_current_module(first_modname, first_path)
+            misc.set_checked_module(linter, modnames[first_path_id], first_path)
             self.add_message(
                 "consider-merging-classes-inherited",
                 line=first_lineno,
                 col_offset=first_col_offset,
                 args=(odoo_class_inherit, ", ".join(path_records)),
             )
+        self._build_model_registry(class_records)
+
+    def _build_model_registry(self, class_records):
+        """Build the model registry of the run and add the messages needing the models of all the modules"""
+        self.model_registry = ModelRegistry(class_records)
+        if self.linter.is_message_enabled("missing-model-dependency"):
+            self._check_model_dependencies(class_records)
+
+    def _check_model_dependencies(self, class_records):
+        """Check the models inherited are defined by the odoo module or by its depends
+        (missing-model-dependency)
+        Only the models defined by the odoo modules of the run in the same addons directory are known
+        """
+        # deterministic order of the output
+        for addon, modname, node_path, lineno, _odoo_name, odoo_inherits, _fields, _methods in sorted(
+            class_records, key=lambda class_record: (class_record[2], class_record[3])
+        ):
+            manifest_path = self.addon_index.get_manifest_path(os.path.dirname(node_path))
+            if not manifest_path:
+                continue
+            module_root = os.path.dirname(manifest_path)
+            addons_dir = os.path.dirname(module_root)
+            for odoo_inherit in odoo_inherits:
+                defining_addons = self.model_registry.get_defining_addons(odoo_inherit)
+                if not defining_addons or addon in defining_addons:
+                    continue
+                depends = self.dependency_graph.get_closure(module_root)
+                missing_addons = sorted(
+                    defining_addon
+                    for defining_addon in defining_addons
+                    if self.dependency_graph.get_module_root(addons_dir, defining_addon)
+                )
+                if not missing_addons or not depends.isdisjoint(defining_addons):
+                    continue
+                misc.set_checked_module(self.linter, modname, node_path)
+                self.add_message("missing-model-dependency", line=lineno, args=(odoo_inherit, missing_addons[0]))
 
     def visit_module(self, node):
         """Initizalize the cache to save the original library name
@@ -835,10 +1071,23 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         All these methods are these "visit_*" methods are called from pylint API
         """
         self._from_imports = {}
+        self._module_inherit_items = []
+        self._module_class_records = []
+        # sql-injection is not checked in test files, probably not accessible
+        self._is_test_file = os.path.basename(self.linter.current_file).startswith("test_")
 
     def leave_module(self, node):
         """Clear variables"""
         self._from_imports = {}
+        for cached_node, attr_name in self._cached_nodes:
+            delattr(cached_node, attr_name)
+        self._cached_nodes = []
+        if self.result_cache is not None and self._module_inherit_items:
+            self.result_cache.record_map_data(self._get_inherit_records(self._module_inherit_items))
+        if self.result_cache is not None and self._module_class_records:
+            self.result_cache.record_class_records(self._module_class_records)
+        self._module_inherit_items = []
+        self._module_class_records = []
 
     def _get_max_valid_odoo_versions(self):
         odoo_versions = [misc.version_parse(odoo_version) for odoo_version in self.linter.config.valid_odoo_versions]
@@ -851,6 +1100,10 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
     def open(self):
         super().open()
         self.deprecated_field_parameters = self.colon_list_to_dict(self.linter.config.deprecated_field_parameters)
+        self._call_checks_by_name, self._call_checks_any = self._get_call_checks()
+        self._cursor_exprs = frozenset(self.linter.config.cursor_expr)
+        self._collect_class_records = any(self.linter.is_message_enabled(msg) for msg in MODEL_REGISTRY_MSGS)
+        self._compile_manifest_options()
 
         if self.linter.config.deprecated_odoo_model_methods:
             deprecated_model_methods = ast.literal_eval(self.linter.config.deprecated_odoo_model_methods)
@@ -870,6 +1123,36 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             if misc.version_parse(version) <= max_valid_version:
                 self._deprecated_odoo_methods.update(checks)
 
+    def _compile_manifest_options(self):
+        """Compile the regex and the sets of the options used by visit_dict for each manifest
+        only if they changed since the last time, since open() is called for each file
+        in the workers of the parallel mode (--jobs) and for each request of the server"""
+        config = self.linter.config
+        options_key = (
+            config.manifest_version_format,
+            tuple(config.valid_odoo_versions),
+            tuple(config.license_allowed),
+            tuple(config.category_allowed),
+            tuple(config.category_allowed_app),
+            tuple(config.development_status_allowed),
+            tuple(config.manifest_keys_values_true),
+            tuple(config.manifest_required_authors),
+        )
+        if options_key == self._manifest_options_key:
+            return
+        self._manifest_options_key = options_key
+        valid_odoo_versions = "|".join(map(re.escape, config.valid_odoo_versions))
+        self._manifest_version_format_parsed = config.manifest_version_format.format(
+            valid_odoo_versions=valid_odoo_versions
+        )
+        self._manifest_version_rgx = re.compile(self._manifest_version_format_parsed)
+        self._license_allowed = frozenset(config.license_allowed)
+        self._category_allowed = frozenset(config.category_allowed)
+        self._category_allowed_app = frozenset(config.category_allowed_app)
+        self._development_status_allowed = frozenset(config.development_status_allowed)
+        self._manifest_keys_values_true = frozenset(config.manifest_keys_values_true)
+        self._manifest_required_authors = frozenset(config.manifest_required_authors)
+
     def colon_list_to_dict(self, colon_list):
         """Converts a colon list to a dictionary.
 
@@ -982,23 +1265,18 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
     def _check_sql_injection_risky(self, node):
         # Inspired from OCA/pylint-odoo project
         # Thanks @moylop260 (Moises Lopez) & @nilshamerlinck (Nils Hamerlinck)
-        current_file_bname = os.path.basename(self.linter.current_file)
+        # The cheapest checks first, the analysis of the query is the last stage
         if not (
+            # ignore in test files, probably not accessible
+            not self._is_test_file
             # .execute() or .executemany()
-            isinstance(node, nodes.Call)
-            and node.args
             and isinstance(node.func, nodes.Attribute)
-            and node.func.attrname in ("execute", "executemany")
-            and
-            # cursor expr (see above)
-            self.get_cursor_name(node.func) in DFTL_CURSOR_EXPR
-            and
+            and node.func.attrname in SQL_EXECUTE_METHODS
             # cr.execute("select * from %s" % foo, [bar]) -> probably a good reason
             # for string formatting
-            len(node.args) <= 1
-            and
-            # ignore in test files, probably not accessible
-            not current_file_bname.startswith("test_")
+            and len(node.args) == 1
+            # cursor expr (see above)
+            and self.get_cursor_name(node.func) in self._cursor_exprs
         ):
             return False
         first_arg = node.args[0]
@@ -1018,11 +1296,52 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             while current and not isinstance(current.parent, nodes.FunctionDef):
                 current = current.parent
             if current:
-                parent = current.parent
                 # 2) check how was the variable built
-                for assign_node in parent.nodes_of_class(nodes.Assign):
-                    if assign_node.targets[0].as_string() == node.as_string():
-                        yield assign_node.value
+                yield from self._get_function_assignations(current.parent).get(node.as_string(), ())
+
+    def _get_function_assignations(self, function):
+        """Index the values assigned in the function by the string of the first target
+        built the first time and cached in the function node until leave_module
+        """
+        assignations = getattr(function, "odoo_assignations", None)
+        if assignations is None:
+            assignations = defaultdict(list)
+            for assign_node in function.nodes_of_class(nodes.Assign):
+                assignations[assign_node.targets[0].as_string()].append(assign_node.value)
+            function.odoo_assignations = assignations = dict(assignations)
+            self._cached_nodes.append((function, "odoo_assignations"))
+        return assignations
+
+    def _get_function_info(self, function):
+        """Collect the super calls, the attributes of super() used, the returns and the write calls
+        of the function traversing it only once, cached in the function node until leave_module
+
+        The returns of the nested functions and classes are not considered
+        :return: Dict with the keys "super" (bool), "super_attrnames" (list), "return" (bool) and "write_calls" (list)
+        """
+        info = getattr(function, "odoo_function_info", None)
+        if info is not None:
+            return info
+        info = {"super": False, "super_attrnames": [], "return": False, "write_calls": []}
+        # (node, is inside a nested function or class) in the same order than nodes_of_class
+        stack = [(child, False) for child in reversed(list(function.get_children()))]
+        while stack:
+            node, nested = stack.pop()
+            if isinstance(node, nodes.Call):
+                if isinstance(node.func, nodes.Name) and node.func.name == "super":
+                    info["super"] = True
+                elif self.get_func_name(node.func) == "write":
+                    info["write_calls"].append(node)
+            elif isinstance(node, nodes.Attribute):
+                if hasattr(node.expr, "func") and self.get_func_name(node.expr.func) == "super":
+                    info["super_attrnames"].append(node.attrname)
+            elif isinstance(node, nodes.Return) and not nested:
+                info["return"] = True
+            nested = nested or isinstance(node, (nodes.FunctionDef, nodes.ClassDef))
+            stack.extend((child, nested) for child in reversed(list(node.get_children())))
+        function.odoo_function_info = info
+        self._cached_nodes.append((function, "odoo_function_info"))
+        return info
 
     def _get_str_value(self, node):
         """Check if the node is str (constant) and get value or f-string get values"""
@@ -1113,102 +1432,126 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         "translation-required",
     )
     def visit_call(self, node):
-        if (
-            isinstance(node.func, nodes.Name)
-            and node.func.name == "print"
-            and self.linter.is_message_enabled("print-used", node.lineno)
-        ):
+        func_name = self.get_func_name(node.func)
+        for check_call in self._call_checks_by_name.get(func_name, ()):
+            check_call(node, func_name)
+        for check_call in self._call_checks_any:
+            check_call(node, func_name)
+
+    def _get_call_checks(self):
+        """Index the "visit_call" sub-checks with at least one message enabled by the name of the callee
+        :return: Tuple with the dict of sub-checks by callee name and the list of sub-checks for any callee
+        """
+        call_checks_by_name = defaultdict(list)
+        call_checks_any = []
+        for callee_names, method_name, msgs in CALL_CHECKS:
+            if not any(self.linter.is_message_enabled(msg) and self.is_odoo_message_enabled(msg) for msg in msgs):
+                continue
+            check_call = getattr(self, method_name)
+            if self.profiler is not None and self.profiler.enabled:
+                check_call = self.profiler.wrap(check_call, f"{type(self).__name__}.{method_name}", msgs)
+            if callee_names is None:
+                call_checks_any.append(check_call)
+                continue
+            for callee_name in callee_names:
+                call_checks_by_name[callee_name].append(check_call)
+        return dict(call_checks_by_name), call_checks_any
+
+    def _check_print_used(self, node, func_name):
+        if isinstance(node.func, nodes.Name) and self.linter.is_message_enabled("print-used", node.lineno):
             infer_node = utils.safe_infer(node.func)
             if utils.is_builtin_object(infer_node) and infer_node.name == "print":
                 self.add_message("print-used", node=node)
-        if (
+
+    def _check_field_definition(self, node, func_name):
+        if not (
             isinstance(node.parent, nodes.Assign)
             and isinstance(node.parent.parent, nodes.ClassDef)
             and "fields" == self.get_func_lib(node.func)
         ):
-            if self.linter.is_message_enabled("attribute-string-redundant", node.lineno):
-                field_name = ""
-                if node.parent.targets and isinstance(node.parent.targets[0], nodes.AssignName):
-                    field_name = node.parent.targets[0].name.removesuffix("_ids").removesuffix("_id").replace("_", " ")
-                is_related = any(kw.arg == "related" for kw in (node.keywords or []))
-                if not is_related and self._get_field_arg_string(node) == field_name.title():
-                    # Check this 'name = fields.Char("name")'
-                    # Check this 'name = fields.Char(string="name")'
-                    self.add_message("attribute-string-redundant", node=node)
-            for argument in self.join_node_args_kwargs(node):
-                argument_aux = argument
-                if isinstance(argument, nodes.Keyword):
-                    argument_aux = argument.value
-                    deprecated = self.deprecated_field_parameters
-                    value = self._get_str_value(argument_aux)
-                    if (
-                        argument.arg in ["compute", "search", "inverse"]
-                        and value is not None
-                        and not value.startswith("_" + argument.arg + "_")
-                    ):
-                        self.add_message("method-" + argument.arg, node=argument_aux)
-                    elif argument.arg in deprecated:
+            return
+        if self.linter.is_message_enabled("attribute-string-redundant", node.lineno):
+            field_name = ""
+            if node.parent.targets and isinstance(node.parent.targets[0], nodes.AssignName):
+                field_name = node.parent.targets[0].name.removesuffix("_ids").removesuffix("_id").replace("_", " ")
+            is_related = any(kw.arg == "related" for kw in (node.keywords or []))
+            if not is_related and self._get_field_arg_string(node) == field_name.title():
+                # Check this 'name = fields.Char("name")'
+                # Check this 'name = fields.Char(string="name")'
+                self.add_message("attribute-string-redundant", node=node)
+        for argument in self.join_node_args_kwargs(node):
+            argument_aux = argument
+            if isinstance(argument, nodes.Keyword):
+                argument_aux = argument.value
+                deprecated = self.deprecated_field_parameters
+                value = self._get_str_value(argument_aux)
+                if (
+                    argument.arg in ["compute", "search", "inverse"]
+                    and value is not None
+                    and not value.startswith("_" + argument.arg + "_")
+                ):
+                    self.add_message("method-" + argument.arg, node=argument_aux)
+                elif argument.arg in deprecated:
+                    self.add_message(
+                        "renamed-field-parameter", node=node, args=(argument.arg, deprecated[argument.arg])
+                    )
+                # no write in compute method
+                if (
+                    argument.arg == "compute"
+                    and isinstance(argument.value, (nodes.Const, nodes.Name))
+                    and self.linter.is_message_enabled("no-write-in-compute", argument.lineno)
+                ):
+                    method_name = (
+                        argument.value.value
+                        if isinstance(argument.value, nodes.Const)
+                        else argument.value.name if isinstance(argument.value, nodes.Name) else None
+                    )
+                    if method_name and self.class_odoo_models:
+                        self.odoo_computes.add(method_name)
+                if (
+                    argument.arg in ["compute", "search", "inverse"]
+                    and isinstance(argument.value, nodes.Name)
+                    and self.linter.is_message_enabled("inheritable-method-string", node.lineno)
+                ):
+                    # Check if the value is a method of the class
+                    infered = utils.safe_infer(argument.value)
+                    if isinstance(infered, nodes.FunctionDef) and infered.is_method():
+                        self.add_message("inheritable-method-string", node=argument.value, args=(argument.value.name,))
+                if (
+                    argument.arg in ["default", "domain"]
+                    and isinstance(argument.value, nodes.Name)
+                    and self.linter.is_message_enabled("inheritable-method-lambda", node.lineno)
+                ):
+                    # Check if the value is a method of the class
+                    infered = utils.safe_infer(argument.value)
+                    if isinstance(infered, nodes.FunctionDef) and infered.is_method():
                         self.add_message(
-                            "renamed-field-parameter", node=node, args=(argument.arg, deprecated[argument.arg])
-                        )
-                    # no write in compute method
-                    if (
-                        argument.arg == "compute"
-                        and isinstance(argument.value, (nodes.Const, nodes.Name))
-                        and self.linter.is_message_enabled("no-write-in-compute", argument.lineno)
-                    ):
-                        method_name = (
-                            argument.value.value
-                            if isinstance(argument.value, nodes.Const)
-                            else argument.value.name if isinstance(argument.value, nodes.Name) else None
+                            "inheritable-method-lambda",
+                            node=argument.value,
+                            args=(
+                                argument.arg,
+                                argument.value.name,
+                            ),
                         )
-                        if method_name and self.class_odoo_models:
-                            self.odoo_computes.add(method_name)
-                    if (
-                        argument.arg in ["compute", "search", "inverse"]
-                        and isinstance(argument.value, nodes.Name)
-                        and self.linter.is_message_enabled("inheritable-method-string", node.lineno)
-                    ):
-                        # Check if the value is a method of the class
-                        infered = utils.safe_infer(argument.value)
-                        if isinstance(infered, nodes.FunctionDef) and infered.is_method():
-                            self.add_message(
-                                "inheritable-method-string", node=argument.value, args=(argument.value.name,)
-                            )
-                    if (
-                        argument.arg in ["default", "domain"]
-                        and isinstance(argument.value, nodes.Name)
-                        and self.linter.is_message_enabled("inheritable-method-lambda", node.lineno)
-                    ):
-                        # Check if the value is a method of the class
-                        infered = utils.safe_infer(argument.value)
-                        if isinstance(infered, nodes.FunctionDef) and infered.is_method():
-                            self.add_message(
-                                "inheritable-method-lambda",
-                                node=argument.value,
-                                args=(
-                                    argument.arg,
-                                    argument.value.name,
-                                ),
-                            )
 
-                if (
-                    isinstance(argument_aux, nodes.Call)
-                    and self.get_func_name(argument_aux.func) in misc.TRANSLATION_METHODS
-                ):
-                    self.add_message("translation-field", node=argument_aux)
+            if (
+                isinstance(argument_aux, nodes.Call)
+                and self.get_func_name(argument_aux.func) in misc.TRANSLATION_METHODS
+            ):
+                self.add_message("translation-field", node=argument_aux)
+
+    def _check_invalid_commit(self, node, func_name):
         # Check cr.commit()
         if (
             isinstance(node.func, nodes.Attribute)
-            and node.func.attrname == "commit"
             and self.linter.is_message_enabled("invalid-commit", node.lineno)
             and self.get_cursor_name(node.func) in self.linter.config.cursor_expr
         ):
             self.add_message("invalid-commit", node=node)
 
+    def _check_context_overridden(self, node, func_name):
         if (
             isinstance(node.func, nodes.Attribute)
-            and node.func.attrname == "with_context"
             and not node.keywords
             and node.args
             and self.linter.is_message_enabled("context-overridden", node.lineno)
@@ -1220,60 +1563,61 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             # So, if only one args is received it is overridden
             self.add_message("context-overridden", node=node, args=(node.args[0].as_string(),))
 
+    def _check_message_post_translation(self, node, func_name):
         # Call the message_post()
-        if (
+        if not (
             isinstance(node.func, nodes.Attribute)
-            and node.func.attrname == "message_post"
             and self.linter.is_message_enabled("translation-required", node.lineno)
             and os.path.basename(os.path.normpath(os.path.dirname(self.linter.current_file))) != "tests"
         ):
-            for arg in itertools.chain(node.args, node.keywords or []):
-                if isinstance(arg, nodes.Keyword):
-                    keyword = arg.arg
-                    value = arg.value
-                else:
-                    keyword = ""
-                    value = arg
-                if keyword and keyword not in ("subject", "body"):
-                    continue
-                as_string = ""
-                # case: message_post(body='String')
-                if isinstance(value, (nodes.Const, nodes.JoinedStr)):
-                    as_string = value.as_string()
-                # case: message_post(body='String %s' % (...))
-                elif (
-                    isinstance(value, nodes.BinOp)
-                    and value.op == "%"
-                    and isinstance(value.left, (nodes.Const, nodes.JoinedStr))
-                    # The right part is translatable only if it's a
-                    # function or a list of functions
-                    and not (
-                        isinstance(value.right, (nodes.Call, nodes.Tuple, nodes.List))
-                        and all(isinstance(child, nodes.Call) for child in getattr(value.right, "elts", []))
-                    )
-                ):
-                    as_string = value.left.as_string()
-                # case: message_post(body='String {...}'.format(...))
-                elif (
-                    isinstance(value, nodes.Call)
-                    and isinstance(value.func, nodes.Attribute)
-                    and isinstance(value.func.expr, (nodes.Const, nodes.JoinedStr))
-                    and value.func.attrname == "format"
-                ):
-                    as_string = value.func.expr.as_string()
-                if as_string:
-                    keyword = keyword and "%s=" % keyword
-                    tl_method = "_"
-                    max_valid_odoo_version = self._get_max_valid_odoo_versions()
-                    if max_valid_odoo_version is None or max_valid_odoo_version >= (18, 0):
-                        tl_method = "self.env._"
-                    self.add_message(
-                        "translation-required", node=node, args=("message_post", keyword, tl_method, as_string)
-                    )
+            return
+        for arg in itertools.chain(node.args, node.keywords or []):
+            if isinstance(arg, nodes.Keyword):
+                keyword = arg.arg
+                value = arg.value
+            else:
+                keyword = ""
+                value = arg
+            if keyword and keyword not in ("subject", "body"):
+                continue
+            as_string = ""
+            # case: message_post(body='String')
+            if isinstance(value, (nodes.Const, nodes.JoinedStr)):
+                as_string = value.as_string()
+            # case: message_post(body='String %s' % (...))
+            elif (
+                isinstance(value, nodes.BinOp)
+                and value.op == "%"
+                and isinstance(value.left, (nodes.Const, nodes.JoinedStr))
+                # The right part is translatable only if it's a
+                # function or a list of functions
+                and not (
+                    isinstance(value.right, (nodes.Call, nodes.Tuple, nodes.List))
+                    and all(isinstance(child, nodes.Call) for child in getattr(value.right, "elts", []))
+                )
+            ):
+                as_string = value.left.as_string()
+            # case: message_post(body='String {...}'.format(...))
+            elif (
+                isinstance(value, nodes.Call)
+                and isinstance(value.func, nodes.Attribute)
+                and isinstance(value.func.expr, (nodes.Const, nodes.JoinedStr))
+                and value.func.attrname == "format"
+            ):
+                as_string = value.func.expr.as_string()
+            if as_string:
+                keyword = keyword and "%s=" % keyword
+                tl_method = "_"
+                max_valid_odoo_version = self._get_max_valid_odoo_versions()
+                if max_valid_odoo_version is None or max_valid_odoo_version >= (18, 0):
+                    tl_method = "self.env._"
+                self.add_message(
+                    "translation-required", node=node, args=("message_post", keyword, tl_method, as_string)
+                )
 
+    def _check_translation_injection(self, node, func_name):
         if (
             isinstance(node.func, nodes.Attribute)
-            and node.func.attrname == "format"
             and isinstance(node.func.expr, nodes.Call)
             and self.linter.is_message_enabled("translation-injection", node.lineno)
             and self.get_func_name(node.func.expr.func) in misc.TRANSLATION_METHODS
@@ -1283,54 +1627,55 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             # not to be confused with _(''.format(...)) is called before to translate
             self.add_message("translation-injection", node=node)
 
+    def _check_translation_call(self, node, func_name):
         # Call _(...) with variables into the term to be translated
-        if node.args and self.get_func_name(node.func) in misc.TRANSLATION_METHODS:
-            # "_" -> isinstance(node.func, nodes.Name)
-            # "self.env._" -> isinstance(node.func, nodes.Attribute)
-            if isinstance(node.func, nodes.Name) and node.func.name in misc.TRANSLATION_METHODS:
-                self.add_message("prefer-env-translation", node=node)
-
-            arg = node.args[0]
-            if self.linter.is_message_enabled(
-                "translation-contains-variable", node.lineno
-            ) and self.is_odoo_message_enabled("translation-contains-variable"):
-                wrong = ""
-                right = ""
-                # case: _('...' % (variables))
-                if isinstance(arg, nodes.BinOp) and arg.op == "%":
-                    wrong = "%s %% %s" % (arg.left.as_string(), arg.right.as_string())
-                    right = "_(%s) %% %s" % (arg.left.as_string(), arg.right.as_string())
-                # Case: _('...'.format(variables))
-                elif (
-                    isinstance(arg, nodes.Call)
-                    and isinstance(arg.func, nodes.Attribute)
-                    and isinstance(arg.func.expr, nodes.Const)
-                    and arg.func.attrname == "format"
-                ):
-                    wrong = arg.as_string()
-                    params_as_string = ", ".join(
-                        [x.as_string() for x in itertools.chain(arg.args, arg.keywords or [])]
-                    )
-                    right = "_(%s).format(%s)" % (arg.func.expr.as_string(), params_as_string)
-                if wrong and right:
-                    self.add_message("translation-contains-variable", node=node, args=(wrong, right))
-
-            # translation-positional-used: Check "string to translate"
-            # to check "%s %s..." used where the position can't be changed
-            if self.linter.is_message_enabled("translation-positional-used", node.lineno):
-                str2translate = arg.as_string()
-                printf_args = self._get_printf_str_args_kwargs(str2translate)
-                format_args = self._get_format_str_args_kwargs(str2translate)[0]
-                if isinstance(printf_args, tuple) and len(printf_args) >= 2 or len(format_args) >= 2:
-                    # Return tuple for %s and dict for %(varname)s
-                    # Check just the following cases "%s %s..."
-                    self.add_message("translation-positional-used", node=node, args=(str2translate,))
+        if not node.args:
+            return
+        # "_" -> isinstance(node.func, nodes.Name)
+        # "self.env._" -> isinstance(node.func, nodes.Attribute)
+        if isinstance(node.func, nodes.Name):
+            self.add_message("prefer-env-translation", node=node)
 
+        arg = node.args[0]
+        if self.linter.is_message_enabled(
+            "translation-contains-variable", node.lineno
+        ) and self.is_odoo_message_enabled("translation-contains-variable"):
+            wrong = ""
+            right = ""
+            # case: _('...' % (variables))
+            if isinstance(arg, nodes.BinOp) and arg.op == "%":
+                wrong = "%s %% %s" % (arg.left.as_string(), arg.right.as_string())
+                right = "_(%s) %% %s" % (arg.left.as_string(), arg.right.as_string())
+            # Case: _('...'.format(variables))
+            elif (
+                isinstance(arg, nodes.Call)
+                and isinstance(arg.func, nodes.Attribute)
+                and isinstance(arg.func.expr, nodes.Const)
+                and arg.func.attrname == "format"
+            ):
+                wrong = arg.as_string()
+                params_as_string = ", ".join([x.as_string() for x in itertools.chain(arg.args, arg.keywords or [])])
+                right = "_(%s).format(%s)" % (arg.func.expr.as_string(), params_as_string)
+            if wrong and right:
+                self.add_message("translation-contains-variable", node=node, args=(wrong, right))
+
+        # translation-positional-used: Check "string to translate"
+        # to check "%s %s..." used where the position can't be changed
+        if self.linter.is_message_enabled("translation-positional-used", node.lineno):
+            str2translate = arg.as_string()
+            printf_args = placeholders.get_printf_str_args_kwargs(str2translate)
+            format_args = placeholders.get_format_str_args_kwargs(str2translate)[0]
+            if isinstance(printf_args, tuple) and len(printf_args) >= 2 or len(format_args) >= 2:
+                # Return tuple for %s and dict for %(varname)s
+                # Check just the following cases "%s %s..."
+                self.add_message("translation-positional-used", node=node, args=(str2translate,))
+
+    def _check_sql_injection(self, node, func_name):
         # SQL Injection
         if self.linter.is_message_enabled("sql-injection", node.lineno) and self._check_sql_injection_risky(node):
             self.add_message("sql-injection", node=node)
 
-        # external-request-timeout
+    def _check_external_request_timeout(self, node, func_name):
         if self.linter.is_message_enabled("external-request-timeout", node.lineno):
             lib_original_func_name = self._static_func_infer_name(node)
             if lib_original_func_name in self.linter.config.external_request_timeout_methods:
@@ -1341,69 +1686,78 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                         break
                 else:
                     self.add_message("external-request-timeout", node=node, args=(lib_original_func_name,))
-        if self.linter.is_message_enabled("bad-builtin-groupby", node.lineno) and (
-            func_as_string := node.func.as_string()
-        ).endswith("groupby"):
-            if func_as_string == "itertools.groupby":
+
+    def _check_bad_builtin_groupby(self, node, func_name):
+        # The source of a Name or Attribute callee ends with its name so the
+        # callees not ending with "groupby" are discarded without "as_string"
+        if not func_name.endswith("groupby") or not self.linter.is_message_enabled("bad-builtin-groupby", node.lineno):
+            return
+        func_as_string = node.func.as_string()
+        if func_as_string == "itertools.groupby":
+            self.add_message("bad-builtin-groupby", node=node)
+        elif not func_as_string.endswith("tools.groupby"):
+            # infer node is heavy so discarding cases early to improve perf
+            infer_node = utils.safe_infer(node.func)
+            if infer_node and infer_node.qname() == "itertools.groupby":
                 self.add_message("bad-builtin-groupby", node=node)
-            elif not func_as_string.endswith("tools.groupby"):
-                # infer node is heavy so discarding cases early to improve perf
-                infer_node = utils.safe_infer(node.func)
-                if infer_node and infer_node.qname() == "itertools.groupby":
-                    self.add_message("bad-builtin-groupby", node=node)
-        if (
+
+    def _check_no_search_all(self, node, func_name):
+        if not (
             (node.args or node.keywords)
-            and self.get_func_name(node.func) in ("search", "search_read")
             and self.linter.is_message_enabled("no-search-all", node.lineno)
             # only odoo valid structure class -> def -> search()
             and isinstance((scope := node.scope()), nodes.FunctionDef)
             and isinstance(scope.parent, nodes.ClassDef)
             and self.get_odoo_models_class(scope.parent)
         ):
-            if node.args:
-                domain = node.args[0]
-            else:
-                domain = next((kw.value for kw in node.keywords if kw.arg == "domain"), None)
-            if domain:
-                empty_domain = False
-                if isinstance(domain, nodes.List) and not domain.elts:
-                    # search([])
-                    # search(domain=[])
-                    empty_domain = True
-                elif isinstance(domain, nodes.Name):
-                    # domain=[]; search(domain)
-                    # domain=[]; search(domain=domain)
-
-                    domain_assignation = utils.safe_infer(domain)
+            return
+        if node.args:
+            domain = node.args[0]
+        else:
+            domain = next((kw.value for kw in node.keywords if kw.arg == "domain"), None)
+        if not domain:
+            return
+        empty_domain = False
+        if isinstance(domain, nodes.List) and not domain.elts:
+            # search([])
+            # search(domain=[])
+            empty_domain = True
+        elif isinstance(domain, nodes.Name):
+            # domain=[]; search(domain)
+            # domain=[]; search(domain=domain)
+
+            domain_assignation = utils.safe_infer(domain)
+            if (
+                domain_assignation is not None
+                and isinstance(domain_assignation, nodes.List)
+                # empty list. Infer consider domain += ... with values not needed look for nodes.AugAssign
+                and not domain_assignation.elts
+                # assigned the domain in the same method than search call
+                and domain_assignation.scope() == node.scope()
+            ):
+                empty_domain = True
+                for subnode in node.scope().nodes_of_class(nodes.Call):
                     if (
-                        domain_assignation is not None
-                        and isinstance(domain_assignation, nodes.List)
-                        # empty list. Infer consider domain += ... with values not needed look for nodes.AugAssign
-                        and not domain_assignation.elts
-                        # assigned the domain in the same method than search call
-                        and domain_assignation.scope() == node.scope()
+                        # only get nodes between assignation domain=... to use in search(domain)
+                        # not consider DOMAIN_EMPTY global variables in order to avoid
+                        # looking for in the whole code since it could be slow and complex
+                        # to detect an "append"
+                        domain_assignation.lineno <= subnode.lineno <= node.lineno
+                        and self.get_func_lib(subnode.func) == domain.name
+                        and self.get_func_name(subnode.func) in ("append", "extend", "insert")
                     ):
-                        empty_domain = True
-                        for subnode in node.scope().nodes_of_class(nodes.Call):
-                            if (
-                                # only get nodes between assignation domain=... to use in search(domain)
-                                # not consider DOMAIN_EMPTY global variables in order to avoid
-                                # looking for in the whole code since it could be slow and complex
-                                # to detect an "append"
-                                domain_assignation.lineno <= subnode.lineno <= node.lineno
-                                and self.get_func_lib(subnode.func) == domain.name
-                                and self.get_func_name(subnode.func) in ("append", "extend", "insert")
-                            ):
-                                # Consider domain.append(), domain.extend(), domain.insert()
-                                empty_domain = False
-                                break
-                limit_or_count = (
-                    any(kw.arg in ("limit", "count") for kw in node.keywords)
-                    or len(node.args) >= 3
-                    or (self.get_func_name(node.func) == "search" and len(node.args) >= 5)
-                )
-                if empty_domain and not limit_or_count:
-                    self.add_message("no-search-all", node=node, args=(self.get_func_name(node.func),))
+                        # Consider domain.append(), domain.extend(), domain.insert()
+                        empty_domain = False
+                        break
+        limit_or_count = (
+            any(kw.arg in ("limit", "count") for kw in node.keywords)
+            or len(node.args) >= 3
+            or (func_name == "search" and len(node.args) >= 5)
+        )
+        if empty_domain and not limit_or_count:
+            self.add_message("no-search-all", node=node, args=(func_name,))
+
+    def _check_super_method_mismatch(self, node, func_name):
         if (
             isinstance(node.func, nodes.Attribute)
             and isinstance(node.func.expr, nodes.Call)
@@ -1415,10 +1769,9 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             and isinstance(frame.parent.frame(), nodes.ClassDef)
             and isinstance(func.parent, nodes.Call)
         ):
-            meth_called = self.get_func_name(node.func)
             meth_defined = frame.name
-            if meth_called != meth_defined and "queue" not in meth_defined and "cache" not in meth_defined:
-                self.add_message("super-method-mismatch", node=node, args=(meth_called, meth_defined))
+            if func_name != meth_defined and "queue" not in meth_defined and "cache" not in meth_defined:
+                self.add_message("super-method-mismatch", node=node, args=(func_name, meth_defined))
 
     @utils.only_required_for_messages(
         "category-allowed-app",
@@ -1428,10 +1781,12 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         "license-allowed",
         "manifest-author-string",
         "manifest-behind-migrations",
+        "manifest-circular-dependency",
         "manifest-data-duplicated",
         "manifest-deprecated-key",
         "manifest-external-assets",
         "manifest-maintainers-list",
+        "manifest-redundant-depends",
         "manifest-required-author",
         "manifest-required-key-app",
         "manifest-required-key",
@@ -1449,10 +1804,9 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             node.parent, nodes.Expr
         ):
             return
-        try:
-            manifest_dict = ast.literal_eval(node.as_string())
-        except ValueError:
-            # There is code that the node is formed but literal_eval raises error
+        manifest_dict = self.addon_index.get_manifest(self.linter.current_file, node).data
+        if manifest_dict is None:
+            # There is code that the node is formed but it is not a literal
             # e.g. {"key": "" or ""}
             return
         manifest_keys_nodes = {
@@ -1467,7 +1821,7 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             # Check author required
             authors = {auth.strip() for auth in author.split(",")}
 
-            required_authors = set(self.linter.config.manifest_required_authors)
+            required_authors = self._manifest_required_authors
             if not authors & required_authors:
                 # None of the required authors is present in the manifest
                 # Authors will be printed as 'author1', 'author2', ...
@@ -1498,15 +1852,15 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
 
         # Check license allowed
         license_str = manifest_dict.get("license", None)
-        if license_str and license_str not in self.linter.config.license_allowed:
+        if license_str and license_str not in self._license_allowed:
             self.add_message("license-allowed", node=manifest_keys_nodes.get("license") or node, args=(license_str,))
 
         # Check category allowed
         category_str = manifest_dict.get("category")
         if (
             category_str
-            and self.linter.config.category_allowed
-            and category_str not in self.linter.config.category_allowed
+            and self._category_allowed
+            and category_str not in self._category_allowed
             and "price" not in manifest_dict
         ):
             self.add_message(
@@ -1526,11 +1880,10 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             )
 
         # Check manifest-behind-migrations
-        migrations_path = os.path.join(os.path.dirname(self.linter.current_file), "migrations")
-        if self.linter.is_message_enabled("manifest-behind-migrations") and os.path.isdir(migrations_path):
-            for migration_path in sorted(os.listdir(migrations_path), reverse=True):
-                if not os.path.isdir(os.path.join(migrations_path, migration_path)):
-                    continue
+        dirname = os.path.dirname(self.linter.current_file)
+        addon = self.addon_index.get_addon(dirname)
+        if self.linter.is_message_enabled("manifest-behind-migrations"):
+            for migration_path in sorted(addon.migrations, reverse=True):
                 try:
                     migration_path_v = misc.version2tuple(migration_path)
                     version_format_v = misc.version2tuple(version_format)
@@ -1544,7 +1897,6 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
 
         # Check if resource exist
         # Check manifest-data-duplicated
-        dirname = os.path.dirname(self.linter.current_file)
         for key in set(misc.MANIFEST_DATA_KEYS) & set(manifest_dict.keys()):
             list_node = node.getitem(manifest_keys_nodes.get(key))
             fname_str_nodes = defaultdict(list)
@@ -1563,14 +1915,17 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                         node=fname_str_node,
                         args=(resource, lines_str, key),
                     )
-                if os.path.isfile(os.path.join(dirname, resource)):
+                if addon.isfile(resource):
                     continue
                 self.add_message("resource-not-exist", node=fname_str_node, args=(key, resource))
                 # Check missing readme
 
-        if not any(os.path.isfile(os.path.join(dirname, readme)) for readme in misc.README_FILES):
+        if not any(addon.isfile(readme) for readme in misc.README_FILES):
             self.add_message("missing-readme", args=(self.linter.config.readme_template_url,), node=node)
 
+        # Check the depends of the module with the depends of the other modules
+        self._check_manifest_depends(node, manifest_keys_nodes.get("depends"), dirname)
+
         # Check if the website is valid URI
         website = manifest_dict.get("website") or ""
         msg = ""
@@ -1592,7 +1947,7 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
 
         # Check valid development_status values
         dev_status = manifest_dict.get("development_status")
-        if dev_status and dev_status not in self.linter.config.development_status_allowed:
+        if dev_status and dev_status not in self._development_status_allowed:
             valid_status = ", ".join(self.linter.config.development_status_allowed)
             self.add_message(
                 "development-status-allowed",
@@ -1638,8 +1993,7 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                     )
 
             for subpath in self.linter.config.odoo_required_files:
-                required_path = os.path.join(dirname, subpath)
-                if not os.path.isfile(required_path):
+                if not addon.isfile(subpath):
                     required_relative_path = os.path.join(os.path.basename(dirname), subpath)
                     self.add_message(
                         "missing-odoo-file",
@@ -1648,8 +2002,7 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                     )
 
             for subpath in self.linter.config.odoo_required_files_app:
-                required_path = os.path.join(dirname, subpath)
-                if not os.path.isfile(required_path):
+                if not addon.isfile(subpath):
                     required_relative_path = os.path.join(os.path.basename(dirname), subpath)
                     self.add_message(
                         "missing-odoo-file-app",
@@ -1658,11 +2011,7 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                     )
 
             # Check category allowed for apps
-            if (
-                category_str
-                and self.linter.config.category_allowed_app
-                and category_str not in self.linter.config.category_allowed_app
-            ):
+            if category_str and self._category_allowed_app and category_str not in self._category_allowed_app:
                 self.add_message(
                     "category-allowed-app",
                     node=manifest_keys_nodes.get("category") or node,
@@ -1670,8 +2019,8 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                 )
         if self.linter.is_message_enabled("manifest-superfluous-key"):
             for key, value in manifest_dict.items():
-                if (not value and key not in self.linter.config.manifest_keys_values_true) or (
-                    value and key in self.linter.config.manifest_keys_values_true
+                if (not value and key not in self._manifest_keys_values_true) or (
+                    value and key in self._manifest_keys_values_true
                 ):
                     self.add_message(
                         "manifest-superfluous-key",
@@ -1693,6 +2042,27 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                         if isinstance(entry, nodes.Const) and is_external_url(entry.value):
                             self.add_message("manifest-external-assets", node=element, args=(entry.value,))
 
+    def _check_manifest_depends(self, node, depends_key_node, module_root):
+        if not depends_key_node:
+            return
+        depends_node = node.getitem(depends_key_node)
+        if self.linter.is_message_enabled("manifest-circular-dependency") and (
+            cycle := self.dependency_graph.get_cycle(module_root)
+        ):
+            self.add_message("manifest-circular-dependency", node=depends_node, args=(", ".join(cycle),))
+        if self.linter.is_message_enabled("manifest-redundant-depends"):
+            depend_nodes = {
+                depend_node.value: depend_node
+                for depend_node in getattr(depends_node, "elts", [])
+                if isinstance(depend_node, nodes.Const)
+            }
+            for depend, via_depend in self.dependency_graph.get_redundant_depends(module_root):
+                self.add_message(
+                    "manifest-redundant-depends",
+                    node=depend_nodes.get(depend) or depends_node,
+                    args=(depend, via_depend),
+                )
+
     def check_deprecated_odoo_method(self, node: nodes.NodeNG) -> bool:
         """Verify the given method is not marked as deprecated under the set Odoo versions.
         :param node: Function definition to be checked
@@ -1725,16 +2095,12 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             self.add_message("deprecated-odoo-model-method", node=node, args=(node.name,))
         if self.is_odoo_message_enabled("deprecated-name-get") and node.name == "name_get":
             self.add_message("deprecated-name-get", node=node)
-        if node.name in self.linter.config.method_required_super and self.linter.is_message_enabled(
-            "method-required-super", node.lineno
+        if (
+            node.name in self.linter.config.method_required_super
+            and self.linter.is_message_enabled("method-required-super", node.lineno)
+            and not self._get_function_info(node)["super"]
         ):
-            calls = [
-                call_func.func.name
-                for call_func in node.nodes_of_class((nodes.Call,))
-                if isinstance(call_func.func, nodes.Name)
-            ]
-            if "super" not in calls:
-                self.add_message("method-required-super", node=node, args=(node.name,))
+            self.add_message("method-required-super", node=node, args=(node.name,))
 
         check_override = bool(
             self.linter.config.prohibited_method_override or DFTL_PROHIBITED_OVERRIDE_METHODS
@@ -1744,30 +2110,23 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
             # Both of them need to traverse the whole method looking for "super()"
             return
 
-        there_is_super = False
-        for stmt in node.nodes_of_class(nodes.Call):
-            func = stmt.func
-            if isinstance(func, nodes.Name) and func.name == "super":
-                there_is_super = True
-                break
+        function_info = self._get_function_info(node)
+        there_is_super = function_info["super"]
 
         # Verify if super attributes are prohibited methods to override
         # check_override already discards the case where both lists are empty
         if check_override and (there_is_super or DFTL_PROHIBITED_OVERRIDE_METHODS):
-            for attr in node.nodes_of_class(nodes.Attribute):
-                if attr.attrname != node.name or not hasattr(attr.expr, "func"):
-                    continue
-                func_name = self.get_func_name(attr.expr.func)
-                if func_name == "super" and (
-                    attr.attrname in self.linter.config.prohibited_method_override
-                    or attr.attrname in DFTL_PROHIBITED_OVERRIDE_METHODS
+            for attrname in function_info["super_attrnames"]:
+                if attrname == node.name and (
+                    attrname in self.linter.config.prohibited_method_override
+                    or attrname in DFTL_PROHIBITED_OVERRIDE_METHODS
                 ):
-                    self.add_message("prohibited-method-override", node=node, args=(attr.attrname,))
+                    self.add_message("prohibited-method-override", node=node, args=(attrname,))
 
         if (
             check_missing_return
             and there_is_super
-            and not any(node.nodes_of_class(nodes.Return, skip_klass=(nodes.FunctionDef, nodes.ClassDef)))
+            and not function_info["return"]
             and not node.is_generator()
             and node.name not in self.linter.config.no_missing_return
         ):
@@ -1776,6 +2135,7 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
     @utils.only_required_for_messages(
         "context-overridden",
         "external-request-timeout",
+        "missing-manifest-dependency",
         "odoo-addons-relative-import",
         "test-folder-imported",
     )
@@ -1787,6 +2147,7 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
     @utils.only_required_for_messages(
         "context-overridden",
         "external-request-timeout",
+        "missing-manifest-dependency",
         "odoo-addons-relative-import",
         "odoo-exception-warning",
         "test-folder-imported",
@@ -1838,10 +2199,10 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
                 # Skip _name='model.name' _inherit='other.model' because is valid
                 # Skip pylint magic disable comment for consider-merging-classes-inherited
                 return
-            node_dirpath = os.path.dirname(node.root().file)
-            manifest_path = misc.walk_up(node_dirpath, tuple(misc.MANIFEST_FILES), misc.top_path(node_dirpath))
+            manifest_path = self.addon_index.get_manifest_path(os.path.dirname(node.root().file))
             if manifest_path:
                 self._odoo_inherit_items[(manifest_path, odoo_class_inherit)].add(node)
+                self._module_inherit_items.append(((manifest_path, odoo_class_inherit), node))
 
     @staticmethod
     def get_func_name(node):
@@ -1927,11 +2288,7 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         return cursor_name
 
     def formatversion(self, version_string):
-        valid_odoo_versions = self.linter.config.valid_odoo_versions
-        valid_odoo_versions = "|".join(map(re.escape, valid_odoo_versions))
-        manifest_version_format = self.linter.config.manifest_version_format
-        manifest_version_format_parsed = manifest_version_format.format(valid_odoo_versions=valid_odoo_versions)
-        return re.match(manifest_version_format_parsed, version_string), manifest_version_format_parsed
+        return self._manifest_version_rgx.match(version_string), self._manifest_version_format_parsed
 
     def join_node_args_kwargs(self, node):
         """Method to join args and keywords
@@ -1941,68 +2298,6 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         args = (getattr(node, "args", None) or []) + (getattr(node, "keywords", None) or [])
         return args
 
-    @staticmethod
-    def _get_format_str_args_kwargs(format_str):
-        """Get dummy args and kwargs of a format string
-        e.g. format_str = '{} {} {variable}'
-            dummy args = (0, 0)
-            kwargs = {'variable': 0}
-        return args, kwargs
-        Motivation to use format_str.format(*args, **kwargs)
-        and validate if it was parsed correctly
-        """
-        format_str_args = []
-        format_str_kwargs = {}
-        placeholders = []
-        for line in format_str.splitlines():
-            try:
-                placeholders.extend(name for _, name, _, _ in string.Formatter().parse(line) if name is not None)
-            except ValueError:
-                continue
-            for placeholder in placeholders:
-                if not placeholder:
-                    # unnumbered "{} {}"
-                    # append 0 to use max(0, 0, ...) == 0
-                    # and identify that all args are unnumbered vs numbered
-                    format_str_args.append(0)
-                elif placeholder.isdigit():
-                    # numbered "{0} {1} {2} {0}"
-                    # append +1 to use max(1, 2) and know the quantity of args
-                    # and identify that the args are numbered
-                    format_str_args.append(int(placeholder) + 1)
-                else:
-                    # named "{var0} {var1} {var2} {var0}"
-                    format_str_kwargs[placeholder] = 0
-        if format_str_args:
-            format_str_args = range(len(format_str_args)) if not max(format_str_args) else range(max(format_str_args))
-        return format_str_args, format_str_kwargs
-
-    @staticmethod
-    def _get_printf_str_args_kwargs(printf_str):
-        """Get dummy args and kwargs of a printf string
-        e.g. printf_str = '%s %d'
-            dummy args = ('', 0)
-        e.g. printf_str = '%(var1)s %(var2)d'
-            dummy kwargs = {'var1': '', 'var2': 0}
-        return args or kwargs
-        Motivation to use printf_str % (args or kwargs)
-        and validate if it was parsed correctly
-        """
-        args = []
-        kwargs = {}
-
-        # Remove all escaped %%
-        printf_str = re.sub("%%", "", printf_str)
-        for line in printf_str.splitlines():
-            for match in PRINTF_PATTERN.finditer(line):
-                match_items = match.groupdict()
-                var = "" if match_items["type"] == "s" else 0
-                if match_items["key"] is None:
-                    args.append(var)
-                else:
-                    kwargs[match_items["key"]] = var
-        return tuple(args) or kwargs
-
     @utils.only_required_for_messages("except-pass")
     def visit_try(self, node):
         """Visit block try except"""
@@ -2039,18 +2334,38 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         return odoo_module
 
     def check_odoo_relative_import(self, node):
-        if not self.linter.is_message_enabled("odoo-addons-relative-import", node.lineno):
+        """Check the odoo modules imported with "odoo.addons" (odoo-addons-relative-import)
+        and that they are in the depends of the module (missing-manifest-dependency)"""
+        check_relative_import = self.linter.is_message_enabled("odoo-addons-relative-import", node.lineno)
+        check_missing_depends = self.linter.is_message_enabled("missing-manifest-dependency", node.lineno)
+        if not check_relative_import and not check_missing_depends:
             return
         node_dirpath = os.path.dirname(node.root().file)
         if os.path.basename(os.path.dirname(node_dirpath)) == "migrations":
             return
 
-        manifest_path = misc.walk_up(node_dirpath, tuple(misc.MANIFEST_FILES), misc.top_path(node_dirpath))
+        manifest_path = self.addon_index.get_manifest_path(node_dirpath)
         if not manifest_path:
             return
-        odoo_module_name = os.path.basename(os.path.dirname(manifest_path))
-        if odoo_module_name in self._get_odoo_module_imported(node, manifest_path):
+        odoo_modules_imported = self._get_odoo_module_imported(node, manifest_path)
+        if not odoo_modules_imported:
+            return
+        odoo_module_name = self.addon_index.get_manifest(manifest_path).module_name
+        if check_relative_import and odoo_module_name in odoo_modules_imported:
             self.add_message("odoo-addons-relative-import", node=node, args=(odoo_module_name,))
+        if not check_missing_depends:
+            return
+        module_root = os.path.dirname(manifest_path)
+        addons_dir = os.path.dirname(module_root)
+        for odoo_module_imported in odoo_modules_imported:
+            if (
+                odoo_module_imported != odoo_module_name
+                # Only the modules of the same addons directory are known
+                # since the depends of the other ones (e.g. odoo) are not resolved
+                and self.dependency_graph.get_module_root(addons_dir, odoo_module_imported)
+                and odoo_module_imported not in self.dependency_graph.get_closure(module_root)
+            ):
+                self.add_message("missing-manifest-dependency", node=node, args=(odoo_module_imported,))
 
     def check_folder_test_imported(self, node):
         if not self.linter.is_message_enabled("test-folder-imported", node.lineno):
@@ -2078,9 +2393,7 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         for node_function_def in node.nodes_of_class(nodes.FunctionDef):
             if node_function_def.name not in self.odoo_computes:
                 continue
-            for node_compute_call in node_function_def.nodes_of_class(nodes.Call):
-                if self.get_func_name(node_compute_call.func) != "write":
-                    continue
+            for node_compute_call in self._get_function_info(node_function_def)["write_calls"]:
                 if not self.linter.is_message_enabled("no-write-in-compute", node_compute_call.lineno):
                     continue
                 if self.get_func_lib(node_compute_call.func) == "self":
@@ -2129,6 +2442,17 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         return self._get_root_method_assignation(new_node, new_libname)
 
     def get_odoo_models_class(self, node):
+        """Get the odoo model class base of the class e.g. ("Model", Attribute(models.Model))
+        resolved the first time and cached in the class node until leave_module
+        since it is used for the class and for each method and search call of the class
+        """
+        odoo_models_class = getattr(node, "odoo_models_class", False)
+        if odoo_models_class is False:
+            odoo_models_class = node.odoo_models_class = self._get_odoo_models_class(node)
+            self._cached_nodes.append((node, "odoo_models_class"))
+        return odoo_models_class
+
+    def _get_odoo_models_class(self, node):
         for class_base in node.bases:
             attr = class_base
             while True:
@@ -2161,12 +2485,60 @@ class OdooAddons(OdooBaseChecker, BaseChecker):
         self.class_odoo_models = self.get_odoo_models_class(node)
         self.odoo_computes = set()
 
-    @utils.only_required_for_messages(
-        "no-wizard-in-models",
-        "no-write-in-compute",
-        "deprecated-self-cr",
-    )
+    @staticmethod
+    def _get_odoo_inherits(value_node):
+        """Get the models of the _inherit value for both the string and the list forms
+        e.g. _inherit = "res.partner" or _inherit = ["mail.thread", "mail.activity.mixin"]
+        """
+        if isinstance(value_node, nodes.Const):
+            value_nodes = [value_node]
+        elif isinstance(value_node, (nodes.List, nodes.Tuple)):
+            value_nodes = value_node.elts
+        else:
+            return ()
+        return tuple(
+            item.value for item in value_nodes if isinstance(item, nodes.Const) and isinstance(item.value, str)
+        )
+
+    def _get_class_record(self, node):
+        """Get the record of the odoo model class for the model registry
+        reading its _name, _inherit, fields and methods from the body of the class
+        :return: Tuple (addon, modname, path, lineno, odoo_name, odoo_inherits, field_names, method_names)
+            or None if the class is not of an odoo module or does not have _name nor _inherit
+        """
+        odoo_name = None
+        odoo_inherits = ()
+        field_names = []
+        method_names = []
+        for stmt in node.body:
+            if isinstance(stmt, nodes.FunctionDef):
+                method_names.append(stmt.name)
+                continue
+            if not isinstance(stmt, nodes.Assign) or not isinstance(stmt.targets[0], nodes.AssignName):
+                continue
+            target_name = stmt.targets[0].name
+            if target_name == "_name":
+                if isinstance(stmt.value, nodes.Const) and isinstance(stmt.value.value, str):
+                    odoo_name = stmt.value.value
+            elif target_name == "_inherit":
+                odoo_inherits = self._get_odoo_inherits(stmt.value)
+            elif isinstance(stmt.value, nodes.Call) and self.get_func_lib(stmt.value.func) == "fields":
+                field_names.append(target_name)
+        if not odoo_name and not odoo_inherits:
+            return None
+        path = node.root().file
+        manifest_path = path and self.addon_index.get_manifest_path(os.path.dirname(path))
+        if not manifest_path:
+            return None
+        addon = self.addon_index.get_manifest(manifest_path).module_name
+        return (addon, node.root().name, path, node.lineno, odoo_name, odoo_inherits, field_names, method_names)
+
     def leave_classdef(self, node):
+        # The model registry has all the classes if a message using it is enabled
+        # and the rest of the checks only if visit_classdef was called for them
+        if self._collect_class_records and (class_record := self._get_class_record(node)):
+            self._class_records.append(class_record)
+            self._module_class_records.append(class_record)
         if self.class_odoo_models:
             if self.odoo_computes:
                 self.check_no_write_compute(node)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import warnings
+from types import MappingProxyType
 
 import pylint
 from pylint.checkers import BaseChecker
@@ -16,6 +17,31 @@ class OdooBaseChecker(BaseChecker):
     #   }
     checks_maxmin_odoo_version: dict[str, str] = {}
 
+    def __init__(self, linter, result_cache=None, profiler=None):
+        super().__init__(linter)
+        # Shared by all the odoolint checkers. See result_cache.ResultCache
+        self.result_cache = result_cache
+        # Shared by all the odoolint checkers. See profiler.Profiler
+        self.profiler = profiler
+        # msgid and symbol of the messages of the checker: enabled for the odoo version
+        self._odoo_msgs_enabled = MappingProxyType({})
+
+    def open(self):
+        super().open()
+        self._odoo_msgs_enabled = MappingProxyType(self._get_odoo_msgs_enabled())
+        if self.profiler is not None:
+            # Before the result cache to time only the methods not skipped by the cache
+            self.profiler.open_checker(self)
+        if self.result_cache is not None:
+            self.result_cache.open(self)
+
+    def close(self):
+        super().close()
+        if self.result_cache is not None:
+            self.result_cache.flush()
+        if self.profiler is not None:
+            self.profiler.close_checker(self)
+
     def msgid_or_symbol2symbol(self, msgid_or_symbol):
         try:
             msgid = self.linter.msgs_store.message_id_store.get_active_msgids(msgid_or_symbol)[0]
@@ -23,14 +49,12 @@ class OdooBaseChecker(BaseChecker):
         except (pylint.exceptions.UnknownMessageError, IndexError):
             return None
 
-    def is_odoo_message_enabled(self, msgid):
+    def _get_odoo_version(self):
+        """Get the odoo version parsed only if one valid_odoo_versions is configured"""
         valid_odoo_versions = self.linter.config.valid_odoo_versions
         if len(valid_odoo_versions) != 1:
             # It should be defined only one version
-            return True
-        msg_symbol = self.msgid_or_symbol2symbol(msgid)
-        if msg_symbol is None:
-            return True
+            return None
         odoo_version = valid_odoo_versions[0]
         odoo_version_tuple = misc.version_parse(odoo_version)
         if not odoo_version_tuple:
@@ -38,20 +62,48 @@ class OdooBaseChecker(BaseChecker):
                 f"Invalid manifest versions format {odoo_version}. "
                 "It was not possible to supress checks based on particular odoo version",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
-            return True
+            return None
+        return odoo_version_tuple
+
+    def _is_symbol_odoo_version(self, msg_symbol, odoo_version_tuple):
         required_odoo_versions = self.checks_maxmin_odoo_version.get(msg_symbol) or {}
         odoo_minversion = required_odoo_versions.get("odoo_minversion") or misc.DFTL_VALID_ODOO_VERSIONS[0]
         odoo_maxversion = required_odoo_versions.get("odoo_maxversion") or misc.DFTL_VALID_ODOO_VERSIONS[-1]
-        return (
-            misc.version_parse(odoo_minversion)
-            <= misc.version_parse(odoo_version)
-            <= misc.version_parse(odoo_maxversion)
-        )
+        return misc.version_parse(odoo_minversion) <= odoo_version_tuple <= misc.version_parse(odoo_maxversion)
+
+    def _get_odoo_msgs_enabled(self):
+        """Compute once per run if the messages of the checker are enabled
+        for the valid_odoo_versions configured indexed by msgid and symbol"""
+        odoo_version_tuple = self._get_odoo_version()
+        odoo_msgs_enabled = {}
+        for msgid, msg_attrs in self.msgs.items():
+            msg_symbol = msg_attrs[1]
+            odoo_msgs_enabled[msgid] = odoo_msgs_enabled[msg_symbol] = (
+                odoo_version_tuple is None or self._is_symbol_odoo_version(msg_symbol, odoo_version_tuple)
+            )
+        return odoo_msgs_enabled
+
+    def is_odoo_message_enabled(self, msgid):
+        try:
+            return self._odoo_msgs_enabled[msgid]
+        except KeyError:
+            pass
+        # Message of other checker or checker not opened
+        # e.g. reduce_map_data is called in the main process of the parallel mode (--jobs)
+        odoo_version_tuple = self._get_odoo_version()
+        if odoo_version_tuple is None:
+            return True
+        msg_symbol = self.msgid_or_symbol2symbol(msgid)
+        if msg_symbol is None:
+            return True
+        return self._is_symbol_odoo_version(msg_symbol, odoo_version_tuple)
 
     def add_message(self, msgid, *args, **kwargs):
         """Emit translation-not-lazy instead of logging-not-lazy"""
         if not self.is_odoo_message_enabled(msgid):
             return
+        if self.result_cache is not None:
+            self.result_cache.record_message(msgid, *args, **kwargs)
         return super().add_message(msgid, *args, **kwargs)
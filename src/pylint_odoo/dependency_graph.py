@@ -0,0 +1,149 @@
+import os
+
+
+class DependencyGraph:
+    """Dependencies of the odoo modules from the "depends" of their manifests
+
+    The depends are resolved in the addons directory of the module (e.g. the repository)
+    and the ones not found there (e.g. base) are leaves of the graph.
+    The circular dependencies and the transitive closures are computed the first time
+    for all the modules reachable at once (Tarjan's strongly connected components
+    in topological order) so each module and depend is visited only once per run
+    """
+
+    def __init__(self, addon_index):
+        self.addon_index = addon_index
+        # Module root: tuple of (depend, depend module root or None if it is not found)
+        self._depends = {}
+        # Module root: frozenset of the names of all the depends, direct and transitive
+        self._closures = {}
+        # Module root: sorted tuple of the names of the modules of its circular dependency
+        self._cycles = {}
+
+    def refresh(self):
+        """Forget the depends resolved e.g. between the requests of a long-running server"""
+        self._depends = {}
+        self._closures = {}
+        self._cycles = {}
+
+    def get_module_root(self, addons_dir, module_name):
+        """Get the root directory of the module in the addons directory or None if it is not found"""
+        module_root = os.path.join(addons_dir, module_name)
+        manifest_path = self.addon_index.get_manifest_path(module_root)
+        if not manifest_path or os.path.dirname(manifest_path) != module_root:
+            return None
+        return module_root
+
+    def get_depends(self, module_root):
+        """Get the direct depends of the module as (depend, depend module root or None) items"""
+        try:
+            return self._depends[module_root]
+        except KeyError:
+            pass
+        manifest_path = self.addon_index.get_manifest_path(module_root)
+        manifest_dict = (self.addon_index.get_manifest(manifest_path).data if manifest_path else None) or {}
+        depends = manifest_dict.get("depends")
+        if not isinstance(depends, (list, tuple)):
+            depends = []
+        addons_dir = os.path.dirname(module_root)
+        self._depends[module_root] = depends = tuple(
+            (depend, self.get_module_root(addons_dir, depend)) for depend in depends if isinstance(depend, str)
+        )
+        return depends
+
+    def get_closure(self, module_root):
+        """Get the names of all the depends of the module, direct and transitive"""
+        if module_root not in self._closures:
+            self._resolve(module_root)
+        return self._closures[module_root]
+
+    def get_cycle(self, module_root):
+        """Get the names of the modules of the circular dependency of the module or an empty tuple"""
+        if module_root not in self._cycles:
+            self._resolve(module_root)
+        return self._cycles[module_root]
+
+    def get_redundant_depends(self, module_root):
+        """Get the direct depends already depended by other direct depend of the module
+        Only the depends of the run are reported since the ones not found (e.g. base)
+        are depended by almost all the modules. The depends of the same circular dependency
+        are not redundant between them
+        :return: List of (depend, other depend) items
+        """
+        depends = self.get_depends(module_root)
+        redundant_depends = []
+        for depend, depend_root in depends:
+            if depend_root is None:
+                continue
+            via_depend = next(
+                (
+                    other_depend
+                    for other_depend, other_depend_root in depends
+                    if other_depend != depend
+                    and other_depend_root is not None
+                    and depend in self.get_closure(other_depend_root)
+                    and other_depend not in self.get_closure(depend_root)
+                ),
+                None,
+            )
+            if via_depend:
+                redundant_depends.append((depend, via_depend))
+        return redundant_depends
+
+    def _resolve(self, module_root):
+        """Compute the closures and cycles of the modules reachable from the module
+        (Tarjan's algorithm with an explicit stack for the long chains of depends)"""
+        indexes = {}
+        lowlinks = {}
+        stack = []
+        on_stack = set()
+        # (module root, iterator of its depends not visited yet) of the modules being visited
+        visiting = []
+
+        def visit(root):
+            indexes[root] = lowlinks[root] = len(indexes)
+            stack.append(root)
+            on_stack.add(root)
+            visiting.append((root, iter(self.get_depends(root))))
+
+        visit(module_root)
+        while visiting:
+            root, depends = visiting[-1]
+            for _depend, depend_root in depends:
+                if depend_root is None or depend_root in self._closures:
+                    continue
+                if depend_root not in indexes:
+                    # Continue with the rest of the depends of "root" once it is resolved
+                    visit(depend_root)
+                    break
+                if depend_root in on_stack:
+                    lowlinks[root] = min(lowlinks[root], indexes[depend_root])
+            else:
+                visiting.pop()
+                if visiting:
+                    parent_root = visiting[-1][0]
+                    lowlinks[parent_root] = min(lowlinks[parent_root], lowlinks[root])
+                if lowlinks[root] == indexes[root]:
+                    self._add_component(root, stack, on_stack)
+
+    def _add_component(self, root, stack, on_stack):
+        """Save the closure and the cycle of the modules of the strongly connected component of "root"
+        The modules of the circular dependency, if any, are the last ones of the stack
+        and the depends outside of them are already resolved
+        """
+        component = set()
+        while root not in component:
+            component.add(stack.pop())
+        on_stack.difference_update(component)
+        closure = set()
+        for member in component:
+            for depend, depend_root in self.get_depends(member):
+                closure.add(depend)
+                if depend_root is not None and depend_root not in component:
+                    closure.update(self._closures[depend_root])
+        closure = frozenset(closure)
+        is_cycle = len(component) > 1 or os.path.basename(root) in closure
+        cycle = tuple(sorted(os.path.basename(member) for member in component)) if is_cycle else ()
+        for member in component:
+            self._closures[member] = closure
+            self._cycles[member] = cycle
@@ -0,0 +1,62 @@
+import os
+import tokenize
+
+from astroid import nodes
+from pylint.lint import PyLinter, Run
+from pylint.utils import FileState, utils
+
+from . import misc
+from .checkers.odoo_addons import OdooAddons
+
+
+class ManifestLinter(PyLinter):
+    """Linter checking only the manifest files with the rules of OdooAddons.visit_dict
+    (pylint-odoo --manifests-only)
+
+    The files to lint are expanded the same way than pylint but only the manifests are
+    parsed. Their dictionary is sent directly to the checker without walking the other
+    nodes and without running the other checkers so the messages and the output are
+    the same than linting the manifests with pylint
+    """
+
+    def check(self, files_or_modules):
+        self.initialize()
+        if self.config.recursive:
+            files_or_modules = tuple(self._discover_files(files_or_modules))
+        checker = next(checker for checker in self.get_checkers() if isinstance(checker, OdooAddons))
+        self.open()
+        checker.open()
+        try:
+            for file_item in self._iterate_file_descrs(files_or_modules):
+                if os.path.basename(file_item.filepath) in misc.MANIFEST_FILES:
+                    self._check_manifest(checker, file_item)
+        finally:
+            checker.close()
+
+    def _check_manifest(self, checker, file_item):
+        """Same as PyLinter._check_file for the manifest dictionary only"""
+        self.set_current_module(file_item.name, file_item.filepath)
+        module_node = self.get_ast(file_item.filepath, file_item.name)
+        if module_node is None:
+            return
+        self._ignore_file = False
+        self.file_state = FileState(file_item.modpath, self.msgs_store, module_node)
+        self.current_file = module_node.file
+        try:
+            # Parse module/block level option pragma's
+            self.process_tokens(utils.tokenize_module(module_node))
+        except tokenize.TokenError:
+            return
+        if self._ignore_file:
+            return
+        for node in module_node.body:
+            if isinstance(node, nodes.Expr) and isinstance(node.value, nodes.Dict):
+                checker.visit_dict(node.value)
+        for msgid, line, args in self.file_state.iter_spurious_suppression_messages(self.msgs_store):
+            self.add_message(msgid, line, None, args)
+
+
+class ManifestRun(Run):
+    """Same as pylint.lint.Run using ManifestLinter"""
+
+    LinterClass = ManifestLinter
@@ -157,6 +157,16 @@ def full_norm_path(path):
     return Path(os.path.expandvars(str(path).strip())).expanduser().resolve()
 
 
+def _get_dir_filenames(path, filenames):
+    """Get the "filenames" that are files (or links to files) in the directory "path"
+    scanning it once"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.name in filenames and entry.is_file()}
+    except OSError:
+        return set()
+
+
 # Cache of the results already resolved by path, filenames and top and the
 # parent paths where one of the filenames was already found by filenames
 _walk_up_cache = {}
@@ -186,10 +196,11 @@ def walk_up(path, filenames, top):
         top_norm_path = full_norm_path(top)
         current_path = path_obj
         while full_norm_path(current_path) != top_norm_path:
+            # One directory listing instead of checking each filename in the filesystem
+            found_filenames = _get_dir_filenames(current_path, filenames)
             for filename in filenames:
-                path_filename = current_path / filename
-                if full_norm_path(path_filename).is_file():
-                    result = str(path_filename)
+                if filename in found_filenames:
+                    result = str(current_path / filename)
                     known_dirs[(str(current_path), top)] = result
                     break
             if result is not None or current_path.parent == current_path:
@@ -199,6 +210,45 @@ def walk_up(path, filenames, top):
     return result
 
 
+def set_checked_module(linter, modname, filepath):
+    """Set the current module of the linter to add the messages of a module already checked
+    e.g. from reduce_map_data, keeping its stats (e.g. statements) instead of initializing
+    them again as PyLinter.set_current_module does"""
+    module_stats = linter.stats.by_module.get(modname)
+    linter.set_current_module(modname, filepath)
+    if module_stats is not None:
+        linter.stats.by_module[modname] = module_stats
+
+
+def get_path_caches():
+    """Get a copy of the caches of top_path and walk_up to warm-start other process
+    e.g. the workers of the parallel mode (--jobs)"""
+    return {
+        "top_path": dict(_top_path_cache),
+        "known_top_paths": set(_known_top_paths),
+        "walk_up": dict(_walk_up_cache),
+        "known_walk_up_dirs": {filenames: dict(known_dirs) for filenames, known_dirs in _known_walk_up_dirs.items()},
+    }
+
+
+def update_path_caches(path_caches):
+    """Update the caches of top_path and walk_up with the ones of get_path_caches"""
+    _top_path_cache.update(path_caches["top_path"])
+    _known_top_paths.update(path_caches["known_top_paths"])
+    _walk_up_cache.update(path_caches["walk_up"])
+    for filenames, known_dirs in path_caches["known_walk_up_dirs"].items():
+        _known_walk_up_dirs.setdefault(filenames, {}).update(known_dirs)
+
+
+def clear_path_caches():
+    """Forget the paths resolved by top_path and walk_up to find the files added or removed since then
+    e.g. between the requests of a long-running server (pylint-odoo --serve)"""
+    _top_path_cache.clear()
+    _known_top_paths.clear()
+    _walk_up_cache.clear()
+    _known_walk_up_dirs.clear()
+
+
 class InvalidVersion(Exception):
     pass
 
@@ -0,0 +1,47 @@
+class ModelRegistry:
+    """Odoo models of all the modules linted in the run
+
+    Built from the class records collected by "OdooAddons" for each odoo model class
+    with "_name" or "_inherit" (merged from all the workers in parallel mode (--jobs))
+    only if a message using it is enabled (MODEL_REGISTRY_MSGS), so the checks needing
+    the models of other files or odoo modules (e.g. the odoo module defining an inherited
+    model for missing-model-dependency) can be computed at once at the end of the run.
+
+    A class record is the tuple:
+        (addon, modname, path, lineno, odoo_name, odoo_inherits, field_names, method_names)
+    where "odoo_inherits" are the models of "_inherit" for both the string and the list forms
+    """
+
+    def __init__(self, class_records=()):
+        self.models = {}
+        for class_record in class_records:
+            self.add_class(class_record)
+
+    def add_class(self, class_record):
+        """Add the record of the class defining (_name) or extending (_inherit) the models"""
+        addon, _modname, path, lineno, odoo_name, odoo_inherits, field_names, method_names = class_record
+        for model_name in [odoo_name] if odoo_name else odoo_inherits:
+            model = self.models.setdefault(
+                model_name, {"addons": set(), "classes": [], "fields": set(), "methods": set()}
+            )
+            if odoo_name and odoo_name not in odoo_inherits:
+                # _name='model.name' _inherit='other.model' defines a new model too
+                model["addons"].add(addon)
+            model["classes"].append((addon, path, lineno))
+            model["fields"].update(field_names)
+            model["methods"].update(method_names)
+
+    def get_defining_addons(self, model_name):
+        """Get the odoo modules defining the model (_name) or an empty set if it is not known"""
+        model = self.models.get(model_name)
+        return model["addons"] if model else set()
+
+    def get_fields(self, model_name):
+        """Get the fields of the model added by all the classes defining or extending it"""
+        model = self.models.get(model_name)
+        return model["fields"] if model else set()
+
+    def get_methods(self, model_name):
+        """Get the methods of the model added by all the classes defining or extending it"""
+        model = self.models.get(model_name)
+        return model["methods"] if model else set()
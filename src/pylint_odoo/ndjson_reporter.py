@@ -0,0 +1,64 @@
+import json
+import os
+
+from pylint.reporters import BaseReporter, JSONReporter
+
+from .checkers.odoo_addons import OdooAddons
+from .checkers.odoo_base_checker import OdooBaseChecker
+
+
+class NDJSONReporter(BaseReporter):
+    """Stream the odoolint messages as newline-delimited JSON (--output-format=odoolint-ndjson)
+
+    Each message is written and flushed as soon as it is emitted (or as soon as the file
+    is linted by a worker of the parallel mode) with the same keys of the pylint JSON
+    reporter plus the odoo module of the file and the odoo versions where the check applies
+    """
+
+    name = "odoolint-ndjson"
+    extension = "ndjson"
+
+    def __init__(self, output=None):
+        super().__init__(output)
+        self._odoo_msgs = None
+        self._addon_index = None
+
+    def _get_odoo_msgs(self):
+        """Get the odoo versions of each odoolint message symbol computed only the first time"""
+        if self._odoo_msgs is None:
+            self._odoo_msgs = {}
+            for checker in self.linter.get_checkers():
+                if not isinstance(checker, OdooBaseChecker):
+                    continue
+                if isinstance(checker, OdooAddons):
+                    self._addon_index = checker.addon_index
+                for msg_attrs in checker.msgs.values():
+                    versions = checker.checks_maxmin_odoo_version.get(msg_attrs[1]) or {}
+                    self._odoo_msgs[msg_attrs[1]] = (versions.get("odoo_minversion"), versions.get("odoo_maxversion"))
+        return self._odoo_msgs
+
+    def _get_addon(self, path):
+        if self._addon_index is None or not path:
+            return None
+        manifest_path = self._addon_index.get_manifest_path(os.path.dirname(os.path.abspath(path)))
+        return self._addon_index.get_manifest(manifest_path).module_name if manifest_path else None
+
+    def handle_message(self, msg):
+        odoo_versions = self._get_odoo_msgs().get(msg.symbol)
+        if odoo_versions is None:
+            # Not an odoolint message
+            return
+        msg_json = dict(JSONReporter.serialize(msg))
+        msg_json["addon"] = self._get_addon(msg.abspath)
+        msg_json["odoo_minversion"], msg_json["odoo_maxversion"] = odoo_versions
+        self.writeln(json.dumps(msg_json))
+        self.out.flush()
+
+    def display_messages(self, layout):
+        """Don't do anything since the messages are written as they are emitted"""
+
+    def display_reports(self, layout):
+        """Don't do anything in this reporter"""
+
+    def _display(self, layout):
+        """Do nothing"""
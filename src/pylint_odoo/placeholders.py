@@ -0,0 +1,118 @@
+import functools
+import re
+import string
+
+from pylint.checkers import utils
+
+# The same strings (e.g. _("%s %s")) are repeated in many files and odoo modules
+# so the placeholders are parsed only once per string keeping at most this number
+# of different strings for each parser. The results must not be modified by the callers
+PLACEHOLDERS_CACHE_SIZE = 4096
+
+# Regex used from https://github.com/translate/translate/blob/9de0d72437/translate/filters/checks.py#L50-L62  # noqa
+PRINTF_PATTERN = re.compile(
+    r"""
+        %(                          # initial %
+        (?P<boost_ord>\d+)%         # boost::format style variable order, like %1%
+        |
+              (?:(?P<ord>\d+)\$|    # variable order, like %1$s
+              \((?P<key>\w+)\))?    # Python style variables, like %(var)s
+        (?P<fullvar>
+            [+#-]*                  # flags
+            (?:\d+)?                # width
+            (?:\.\d+)?              # precision
+            (hh\|h\|l\|ll)?         # length formatting
+            (?P<type>[\w@]))        # type (%s, %d, etc.)
+        )""",
+    re.VERBOSE,
+)
+
+
+@functools.lru_cache(maxsize=PLACEHOLDERS_CACHE_SIZE)
+def get_format_str_args_kwargs(format_str):
+    """Get dummy args and kwargs of a format string
+    e.g. format_str = '{} {} {variable}'
+        dummy args = (0, 0)
+        kwargs = {'variable': 0}
+    return args, kwargs
+    Motivation to use format_str.format(*args, **kwargs)
+    and validate if it was parsed correctly
+    """
+    format_str_args = []
+    format_str_kwargs = {}
+    placeholders = []
+    formatter = string.Formatter()
+    for line in format_str.splitlines():
+        try:
+            placeholders.extend(name for _, name, _, _ in formatter.parse(line) if name is not None)
+        except ValueError:
+            continue
+        for placeholder in placeholders:
+            if not placeholder:
+                # unnumbered "{} {}"
+                # append 0 to use max(0, 0, ...) == 0
+                # and identify that all args are unnumbered vs numbered
+                format_str_args.append(0)
+            elif placeholder.isdigit():
+                # numbered "{0} {1} {2} {0}"
+                # append +1 to use max(1, 2) and know the quantity of args
+                # and identify that the args are numbered
+                format_str_args.append(int(placeholder) + 1)
+            else:
+                # named "{var0} {var1} {var2} {var0}"
+                format_str_kwargs[placeholder] = 0
+    if format_str_args:
+        format_str_args = range(len(format_str_args)) if not max(format_str_args) else range(max(format_str_args))
+    return format_str_args, format_str_kwargs
+
+
+@functools.lru_cache(maxsize=PLACEHOLDERS_CACHE_SIZE)
+def get_printf_str_args_kwargs(printf_str):
+    """Get dummy args and kwargs of a printf string
+    e.g. printf_str = '%s %d'
+        dummy args = ('', 0)
+    e.g. printf_str = '%(var1)s %(var2)d'
+        dummy kwargs = {'var1': '', 'var2': 0}
+    return args or kwargs
+    Motivation to use printf_str % (args or kwargs)
+    and validate if it was parsed correctly
+    """
+    args = []
+    kwargs = {}
+
+    # Remove all escaped %%
+    printf_str = printf_str.replace("%%", "")
+    for line in printf_str.splitlines():
+        for match in PRINTF_PATTERN.finditer(line):
+            match_items = match.groupdict()
+            var = "" if match_items["type"] == "s" else 0
+            if match_items["key"] is None:
+                args.append(var)
+            else:
+                kwargs[match_items["key"]] = var
+    return tuple(args) or kwargs
+
+
+@functools.lru_cache(maxsize=PLACEHOLDERS_CACHE_SIZE)
+def parse_logging_format_string(format_string, format_style):
+    """Parse the format string of a logging call the same way as
+    pylint.checkers.logging.LoggingChecker._check_format_string of pylint 4.0
+    (scheduler.SUPPORTED_PYLINT_VERSIONS) to skip calling it when there is nothing to report
+
+    :param format_style: "old" for printf strings or "new" for format strings (--logging-format-style)
+    :return: Tuple (required_num_args, has_keyword_args, unsupported_char_index, truncated)
+        unsupported_char_index is None if all the format characters are supported
+    """
+    try:
+        if format_style == "old":
+            keyword_args, required_num_args, _, _ = utils.parse_format_string(format_string)
+            return required_num_args, bool(keyword_args), None, False
+        if format_style == "new":
+            keyword_arguments, implicit_pos_args, explicit_pos_args = utils.parse_format_method_string(format_string)
+            keyword_args_cnt = len({k for k, _ in keyword_arguments if not isinstance(k, int)})
+            return keyword_args_cnt + implicit_pos_args + explicit_pos_args, False, None, False
+    except utils.UnsupportedFormatCharacter as ex:
+        return 0, False, ex.index, False
+    except utils.IncompleteFormatString:
+        return 0, False, None, True
+    return 0, False, None, False
@@ -1,4 +1,14 @@
-from . import checkers, misc
+from . import (
+    addon_index,
+    changed_files,
+    checkers,
+    dependency_graph,
+    misc,
+    ndjson_reporter,
+    profiler,
+    result_cache,
+    scheduler,
+)
 from .augmentations.main import apply_augmentations
 
 
@@ -10,13 +20,36 @@ def register(linter):
         # keeping the checkers already registered, and then pylint re-loads the
         # plugins over it calling this method again ("load_plugin_modules" with
         # "force=True"). Registering the checkers twice would duplicate every message
+        # The paths already resolved by the main process are re-used by the worker
+        path_caches = getattr(linter, "odoolint_path_caches", None)
+        if path_caches:
+            misc.update_path_caches(path_caches)
         return
-    linter.register_checker(checkers.odoo_addons.OdooAddons(linter))
-    linter.register_checker(checkers.vim_comment.VimComment(linter))
-    linter.register_checker(checkers.custom_logging.CustomLoggingChecker(linter))
+    # Shared to scan the odoo modules only once per run
+    index = addon_index.AddonIndex()
+    # Shared to resolve the depends of the odoo modules only once per run
+    graph = dependency_graph.DependencyGraph(index)
+    # Shared by the checkers to skip the modules already cached (--odoolint-cache-dir)
+    cache = result_cache.ResultCache(linter, index, graph)
+    # Shared by the checkers to time their methods (--odoolint-profile)
+    odoo_profiler = profiler.Profiler(linter)
+    linter.register_checker(odoo_profiler)
+    linter.register_checker(checkers.odoo_addons.OdooAddons(linter, cache, index, odoo_profiler, graph))
+    linter.register_checker(checkers.vim_comment.VimComment(linter, cache, odoo_profiler))
+    linter.register_checker(checkers.custom_logging.CustomLoggingChecker(linter, cache, odoo_profiler))
+    # Skip the files not changed since a git reference (--odoolint-changed-since)
+    changed_files.ChangedFiles(linter, index).install()
+    # Stream the messages as newline-delimited JSON (--output-format=odoolint-ndjson)
+    linter.register_reporter(ndjson_reporter.NDJSONReporter)
 
     # register any checking fiddlers
-    apply_augmentations(linter)
+    apply_augmentations(linter, odoo_profiler)
+
+
+def load_configuration(linter):
+    """Hook called by pylint after loading the options of the plugins"""
+    # Send the files to the workers in batches by odoo module (--odoolint-jobs-by-addon)
+    scheduler.install(linter)
 
 
 def get_all_messages():
@@ -31,7 +64,7 @@ def get_all_messages():
 def messages2md():
     all_msgs = get_all_messages()
     md_msgs = "Short Name | Description | Code\n--- | --- | ---"
-    for msg_code, (title, name_key, _description) in sorted(all_msgs.items(), key=lambda v: v[1][1]):
+    for msg_code, (title, name_key, _description, *_options) in sorted(all_msgs.items(), key=lambda v: v[1][1]):
         md_msgs += f"\n{name_key} | {title} | {msg_code}"
     md_msgs += "\n"
     return md_msgs
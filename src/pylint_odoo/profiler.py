@@ -0,0 +1,168 @@
+import functools
+import heapq
+import json
+import time
+
+from astroid import nodes
+from pylint.checkers import BaseChecker
+
+# Methods of the checkers timed
+PROFILED_METHODS_PREFIXES = ("visit_", "leave_", "process_tokens")
+
+# Slowest nodes saved by method
+SLOWEST_NODES = 10
+
+
+class Profiler(BaseChecker):
+    """Opt-in timing of the odoolint checks saved as JSON (--odoolint-profile)
+
+    The "visit_*", "leave_*" and "process_tokens" methods of the odoolint checkers,
+    the "visit_call" sub-checks and the augmentation predicates are timed recording
+    the calls, the cumulative time and the slowest nodes of each one and of each
+    message symbol that they can emit.
+
+    It is a checker without messages only to merge the timings of the workers
+    of the parallel mode (--jobs) using get_map_data and reduce_map_data
+    """
+
+    name = "odoolint_profile"
+    msgs = {}
+
+    def __init__(self, linter):
+        super().__init__(linter)
+        self._timings = {}
+        self._open_checkers = 0
+
+    @property
+    def path(self):
+        return getattr(self.linter.config, "odoolint_profile", "")
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    def open_checker(self, checker):
+        """Time the methods of the checker"""
+        self._open_checkers += 1
+        if not self.enabled or getattr(checker, "_profiler_installed", False):
+            # parallel mode (--jobs) opens the checkers again for each file
+            return
+        checker_msgs = [msg_attrs[1] for msg_attrs in checker.msgs.values()]
+        for method_name in dir(checker):
+            if not method_name.startswith(PROFILED_METHODS_PREFIXES):
+                continue
+            method = getattr(checker, method_name)
+            if callable(method):
+                msgs = getattr(method, "checks_msgs", None) or checker_msgs
+                setattr(checker, method_name, self.wrap(method, f"{type(checker).__name__}.{method_name}", msgs))
+        checker._profiler_installed = True
+
+    def close_checker(self, checker):
+        """Save the timings after closing the last checker"""
+        self._open_checkers -= 1
+        if self._open_checkers or not self.enabled:
+            return
+        if self.linter.config.jobs > 1 and not self.linter.config.from_stdin:
+            # Saved by reduce_map_data in the main process
+            return
+        self.save(self._timings)
+
+    def wrap(self, func, name, msgs, check_enabled=False):
+        """Time the calls of "func" recording the node of its first argument
+
+        :param check_enabled: Check if the profiler is enabled for each call
+            e.g. for functions wrapped before the options are loaded
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if check_enabled and not self.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(name, msgs, time.perf_counter() - start, args[0] if args else None)
+
+        return wrapper
+
+    def _record(self, name, msgs, seconds, node):
+        try:
+            timing = self._timings[name]
+        except KeyError:
+            timing = self._timings[name] = {"calls": 0, "seconds": 0.0, "msgs": sorted(msgs), "slowest": []}
+        timing["calls"] += 1
+        timing["seconds"] += seconds
+        slowest = timing["slowest"]
+        if len(slowest) >= SLOWEST_NODES and seconds <= slowest[0][0]:
+            return
+        if isinstance(node, nodes.NodeNG):
+            node_item = (seconds, node.root().file or "", node.fromlineno or 0, type(node).__name__)
+        else:
+            # e.g. process_tokens
+            node_item = (seconds, self.linter.current_file or "", 0, "")
+        if len(slowest) >= SLOWEST_NODES:
+            heapq.heapreplace(slowest, node_item)
+        else:
+            heapq.heappush(slowest, node_item)
+
+    def get_map_data(self):
+        """Send the timings of the file checked in a worker of the parallel mode (--jobs)"""
+        if not self.enabled or not self._timings:
+            return None
+        timings, self._timings = self._timings, {}
+        return timings
+
+    def reduce_map_data(self, linter, data):
+        """Merge the timings of all the workers and save them"""
+        if not self.enabled:
+            return
+        timings = {}
+        for worker_timings in data:
+            for name, worker_timing in worker_timings.items():
+                timing = timings.setdefault(
+                    name, {"calls": 0, "seconds": 0.0, "msgs": worker_timing["msgs"], "slowest": []}
+                )
+                timing["calls"] += worker_timing["calls"]
+                timing["seconds"] += worker_timing["seconds"]
+                timing["slowest"] = heapq.nlargest(
+                    SLOWEST_NODES, timing["slowest"] + [tuple(item) for item in worker_timing["slowest"]]
+                )
+        self.save(timings)
+
+    @staticmethod
+    def _get_report_timing(timing):
+        return {
+            "calls": timing["calls"],
+            "seconds": timing["seconds"],
+            "slowest": [
+                {"seconds": seconds, "path": path, "line": line, "node": node_type}
+                for seconds, path, line, node_type in heapq.nlargest(SLOWEST_NODES, timing["slowest"])
+            ],
+        }
+
+    def save(self, timings):
+        """Save the timings by method and by message symbol sorted by cumulative time
+
+        The timings of a message symbol are the sum of the methods that can emit it
+        """
+        msgs_timings = {}
+        for timing in timings.values():
+            for msg in timing["msgs"]:
+                msg_timing = msgs_timings.setdefault(msg, {"calls": 0, "seconds": 0.0, "slowest": []})
+                msg_timing["calls"] += timing["calls"]
+                msg_timing["seconds"] += timing["seconds"]
+                msg_timing["slowest"] = heapq.nlargest(SLOWEST_NODES, msg_timing["slowest"] + timing["slowest"])
+        report = {
+            "methods": {
+                name: dict(self._get_report_timing(timing), msgs=timing["msgs"])
+                for name, timing in sorted(timings.items(), key=lambda item: item[1]["seconds"], reverse=True)
+            },
+            "msgs": {
+                msg: self._get_report_timing(timing)
+                for msg, timing in sorted(msgs_timings.items(), key=lambda item: item[1]["seconds"], reverse=True)
+            },
+        }
+        with open(self.path, "w", encoding="UTF-8") as f_profile:
+            json.dump(report, f_profile, indent=4)
+        self._timings = {}
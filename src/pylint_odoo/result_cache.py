@@ -0,0 +1,259 @@
+import functools
+import hashlib
+import json
+import os
+from glob import glob
+
+import astroid
+import pylint
+from astroid import nodes
+from pylint import interfaces
+from pylint.constants import WarningScope
+
+from . import misc
+from .addon_index import AddonIndex
+from .dependency_graph import DependencyGraph
+
+# Methods of the checkers skipped for the modules replayed from the cache
+CACHED_METHODS_PREFIXES = ("visit_", "leave_", "process_tokens")
+
+# Options of the checkers not changing the messages of a module
+NOT_CACHED_OPTIONS = ("odoolint-cache-dir", "odoolint-changed-since", "odoolint-jobs-by-addon", "odoolint-profile")
+
+# Frames used by pylint to build the "obj" of the messages (e.g. "Class.method")
+FRAME_CLASSES = (nodes.ClassDef, nodes.FunctionDef, nodes.Lambda)
+
+
+def get_plugin_hash():
+    """Hash of the source code of the plugin to invalidate the cache for any new
+    version of the plugin, including the development ones without version bump"""
+    plugin_hash = hashlib.sha256()
+    for source_path in sorted(glob(os.path.join(os.path.dirname(__file__), "**", "*.py"), recursive=True)):
+        with open(source_path, "rb") as f_source:
+            plugin_hash.update(f_source.read())
+    return plugin_hash.hexdigest()
+
+
+class ResultCache:
+    """On-disk cache of the messages emitted by the odoolint checkers for each module
+
+    The entries are keyed by the plugin source, the pylint and astroid versions (the checks
+    use the inference), the resolved options of the checkers, the enabled messages and
+    the path and source hash of the module.
+    The modules imported by the module are not part of the key so changing them
+    (e.g. a helper of other package) does not invalidate the messages inferred from them.
+    For a module already cached the "visit_*", "leave_*" and "process_tokens" methods
+    of the odoolint checkers are skipped and the stored messages are replayed instead.
+
+    The "consider-merging-classes-inherited" records and the class records of the
+    model registry of "OdooAddons.get_map_data" are stored too since they are
+    computed from all the modules together.
+
+    Manifest files are not cached since their messages depend on the files of the
+    module (e.g. resource-not-exist, missing-readme and manifest-behind-migrations)
+    and the python files are cached by the depends of their module too
+    """
+
+    def __init__(self, linter, addon_index=None, dependency_graph=None):
+        self.linter = linter
+        self.addon_index = addon_index or AddonIndex()
+        self.dependency_graph = dependency_graph or DependencyGraph(self.addon_index)
+        self.cache_dir = None
+        self.hits = 0
+        self.misses = 0
+        self._config_key = None
+        self._current_path = None
+        self._current_entry_path = None
+        self._replayed = False
+        self._recording = None
+        self._map_records = None
+        self._replayed_map_records = []
+        self._class_records = None
+        self._replayed_class_records = []
+
+    @property
+    def enabled(self):
+        return bool(self.cache_dir)
+
+    def open(self, checker):
+        """Compute once per run the config part of the key and skip the methods
+        of the checker for the modules replayed from the cache"""
+        self.cache_dir = getattr(self.linter.config, "odoolint_cache_dir", "")
+        if not self.enabled:
+            return
+        if self._config_key is None:
+            self._config_key = self._get_config_key()
+        if getattr(checker, "_result_cache_installed", False):
+            # parallel mode (--jobs) opens the checkers again for each file
+            return
+        for method_name in dir(checker):
+            if not method_name.startswith(CACHED_METHODS_PREFIXES):
+                continue
+            method = getattr(checker, method_name)
+            if callable(method):
+                setattr(checker, method_name, self._skip_replayed(method))
+        checker._result_cache_installed = True
+
+    def _get_config_key(self):
+        options = {}
+        enabled_msgs = set()
+        for checker in self.linter.get_checkers():
+            if checker.name != "odoolint":
+                continue
+            for option_name, _option in checker.options:
+                if option_name in NOT_CACHED_OPTIONS:
+                    continue
+                options[option_name] = getattr(self.linter.config, option_name.replace("-", "_"), None)
+            enabled_msgs.update(msg[1] for msg in checker.msgs.values() if self.linter.is_message_enabled(msg[1]))
+        return json.dumps(
+            [
+                get_plugin_hash(),
+                pylint.__version__,
+                astroid.__version__,
+                sorted(options.items()),
+                sorted(enabled_msgs),
+            ],
+            default=str,
+        )
+
+    def _skip_replayed(self, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if self.linter.current_file != self._current_path:
+                self._start_module()
+            if self._replayed:
+                return None
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    def _get_entry_path(self, path):
+        if os.path.basename(path) in misc.MANIFEST_FILES:
+            return None
+        try:
+            with open(path, "rb") as f_src:
+                source_hash = hashlib.sha256(f_src.read()).hexdigest()
+        except OSError:
+            return None
+        manifest_path = self.addon_index.get_manifest_path(os.path.dirname(path))
+        # The odoo modules imported are checked against the depends (missing-manifest-dependency)
+        depends = sorted(self.dependency_graph.get_closure(os.path.dirname(manifest_path))) if manifest_path else []
+        key = json.dumps([self._config_key, path, manifest_path, depends, source_hash])
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode("UTF-8")).hexdigest() + ".json")
+
+    def _start_module(self):
+        self.flush()
+        self._current_path = self.linter.current_file
+        self._current_entry_path = self._get_entry_path(self._current_path) if self._current_path else None
+        self._replayed = False
+        if not self._current_entry_path:
+            return
+        try:
+            with open(self._current_entry_path, encoding="UTF-8") as f_entry:
+                entry = json.load(f_entry)
+        except (OSError, ValueError):
+            self.misses += 1
+            self._recording = []
+            self._map_records = []
+            self._class_records = []
+            return
+        self.hits += 1
+        self._replayed = True
+        self._replay(entry)
+
+    def _replay(self, entry):
+        module_node = self.linter.file_state._module
+        frames = None
+        for msgid, line, col_offset, end_lineno, end_col_offset, args, confidence, frame_loc in entry["messages"]:
+            node = None
+            if frame_loc is not None:
+                if frames is None:
+                    frames = {
+                        (frame.lineno, frame.col_offset): frame for frame in module_node.nodes_of_class(FRAME_CLASSES)
+                    }
+                node = frames.get(tuple(frame_loc)) or module_node
+            elif self.linter.msgs_store.get_message_definitions(msgid)[0].scope == WarningScope.NODE:
+                node = module_node
+            self.linter.add_message(
+                msgid,
+                line=line,
+                node=node,
+                args=tuple(args) if isinstance(args, list) else args,
+                confidence=interfaces.CONFIDENCE_MAP.get(confidence),
+                col_offset=col_offset,
+                end_lineno=end_lineno,
+                end_col_offset=end_col_offset,
+            )
+        self._replayed_map_records.extend(tuple(record) for record in entry["map_records"])
+        self._replayed_class_records.extend(tuple(record) for record in entry["class_records"])
+
+    def record_message(self, msgid, line=None, node=None, args=None, confidence=None, **kwargs):
+        """Save a message emitted by the checkers for the module being linted
+        using the same location resolved by pylint from the node"""
+        if self._recording is None:
+            return
+        col_offset = kwargs.get("col_offset")
+        end_lineno = kwargs.get("end_lineno")
+        end_col_offset = kwargs.get("end_col_offset")
+        frame_loc = None
+        if node is not None:
+            position = node.position or node
+            if line is None:
+                line = position.lineno if node.position else node.fromlineno
+            if col_offset is None:
+                col_offset = position.col_offset
+            if end_lineno is None:
+                end_lineno = position.end_lineno
+            if end_col_offset is None:
+                end_col_offset = position.end_col_offset
+            frame = node.frame()
+            if isinstance(frame, FRAME_CLASSES):
+                frame_loc = (frame.lineno, frame.col_offset)
+        self._recording.append(
+            (
+                msgid,
+                line,
+                col_offset,
+                end_lineno,
+                end_col_offset,
+                args,
+                confidence.name if confidence else None,
+                frame_loc,
+            )
+        )
+
+    def record_map_data(self, records):
+        """Save the map records of the module being linted"""
+        if self._map_records is not None:
+            self._map_records.extend(records)
+
+    def pop_replayed_map_records(self):
+        records, self._replayed_map_records = self._replayed_map_records, []
+        return records
+
+    def record_class_records(self, records):
+        """Save the class records of the model registry of the module being linted"""
+        if self._class_records is not None:
+            self._class_records.extend(records)
+
+    def pop_replayed_class_records(self):
+        records, self._replayed_class_records = self._replayed_class_records, []
+        return records
+
+    def flush(self):
+        """Write the entry of the module linted without cache"""
+        recording, map_records, class_records = self._recording, self._map_records, self._class_records
+        self._recording = self._map_records = self._class_records = None
+        self._current_path = None
+        if recording is None or not self._current_entry_path:
+            return
+        try:
+            content = json.dumps({"messages": recording, "map_records": map_records, "class_records": class_records})
+        except TypeError:
+            # Message arguments not serializable so the module is linted again next time
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self._current_entry_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="UTF-8") as f_entry:
+            f_entry.write(content)
+        os.replace(tmp_path, self._current_entry_path)
@@ -0,0 +1,143 @@
+import functools
+import os
+import warnings
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import dill
+from pylint.__pkginfo__ import numversion as PYLINT_VERSION
+from pylint.lint import parallel, pylinter
+from pylint.utils import merge_stats
+
+from . import misc
+
+# Batches by process of the parallel mode (--jobs) to balance the load of the
+# workers when the odoo modules have very different sizes
+BATCHES_BY_JOB = 4
+
+# Private functions of pylint.lint.parallel re-used by check_parallel
+PARALLEL_PRIVATE_FUNCTIONS = ("_worker_check_single_file", "_worker_initialize", "_merge_mapreduce_data")
+
+# Versions (major, minor) of pylint whose private functions above have the signatures expected
+SUPPORTED_PYLINT_VERSIONS = ((4, 0),)
+
+
+def get_addon_root(path):
+    """Get the root directory of the odoo module of "path" found by misc.walk_up
+    or the directory of "path" if it is not part of an odoo module"""
+    dirpath = os.path.dirname(path)
+    manifest_path = misc.walk_up(dirpath, tuple(misc.MANIFEST_FILES), misc.top_path(dirpath))
+    return os.path.dirname(manifest_path) if manifest_path else dirpath
+
+
+def partition_by_addon(file_items, jobs):
+    """Split the files in batches of the same odoo module balanced by byte size
+
+    The modules bigger than the ideal size of a batch are split in several batches.
+    The batches are sorted from the biggest to the smallest one so the smaller ones
+    fill the gaps of the workers at the end
+    """
+    addons = defaultdict(list)
+    for file_item in file_items:
+        try:
+            size = os.path.getsize(file_item.filepath)
+        except OSError:
+            size = 0
+        addons[get_addon_root(file_item.filepath)].append((size, file_item))
+    total_size = sum(size for addon_files in addons.values() for size, _file_item in addon_files)
+    max_batch_size = max(total_size // (max(jobs, 1) * BATCHES_BY_JOB), 1)
+    batches = []
+    for addon_files in addons.values():
+        batch, batch_size = [], 0
+        for size, file_item in addon_files:
+            if batch and batch_size + size > max_batch_size:
+                batches.append((batch_size, batch))
+                batch, batch_size = [], 0
+            batch.append(file_item)
+            batch_size += size
+        if batch:
+            batches.append((batch_size, batch))
+    batches.sort(key=lambda size_batch: size_batch[0], reverse=True)
+    return [batch for _batch_size, batch in batches]
+
+
+def warm_path_caches(linter, file_items):
+    """Resolve the top path and the odoo module of all the files in the main process
+    saving the caches in the linter to be restored in the workers by plugin.register"""
+    for file_item in file_items:
+        get_addon_root(file_item.filepath)
+    linter.odoolint_path_caches = misc.get_path_caches()
+
+
+def _worker_check_batch(file_items):
+    """Check the files of a batch in the same worker keeping the caches of their module warm"""
+    return [parallel._worker_check_single_file(file_item) for file_item in file_items]
+
+
+def check_parallel(linter, jobs, files, extra_packages_paths=None):
+    """Same as pylint.lint.parallel.check_parallel but sending the files to the workers
+    in batches by odoo module (--odoolint-jobs-by-addon)
+
+    The workers start with the paths of all the files already resolved
+    """
+    if not getattr(linter.config, "odoolint_jobs_by_addon", False) or not is_supported():
+        # Other linters of the same process (e.g. the server) without the option
+        parallel.check_parallel(linter, jobs, files, extra_packages_paths)
+        return
+    files = list(files)
+    warm_path_caches(linter, files)
+    batches = partition_by_addon(files, jobs)
+    initializer = functools.partial(parallel._worker_initialize, extra_packages_paths=extra_packages_paths)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=(dill.dumps(linter),)) as executor:
+        linter.open()
+        all_stats = []
+        all_mapreduce_data = defaultdict(list)
+        for results in executor.map(_worker_check_batch, batches):
+            for (
+                worker_idx,
+                module,
+                file_path,
+                base_name,
+                messages,
+                stats,
+                msg_status,
+                mapreduce_data,
+            ) in results:
+                linter.file_state.base_name = base_name
+                linter.file_state._is_base_filestate = False
+                linter.set_current_module(module, file_path)
+                for msg in messages:
+                    linter.reporter.handle_message(msg)
+                all_stats.append(stats)
+                all_mapreduce_data[worker_idx].append(mapreduce_data)
+                linter.msg_status |= msg_status
+
+    parallel._merge_mapreduce_data(linter, all_mapreduce_data)
+    linter.stats = merge_stats([linter.stats, *all_stats])
+
+
+def is_supported():
+    """Check the private functions of pylint used by check_parallel are available
+    since they can change even in a patch release of pylint"""
+    return PYLINT_VERSION[:2] in SUPPORTED_PYLINT_VERSIONS and all(
+        callable(getattr(parallel, name, None)) for name in PARALLEL_PRIVATE_FUNCTIONS
+    )
+
+
+def install(linter):
+    """Use check_parallel for the parallel mode (--jobs) of pylint if --odoolint-jobs-by-addon is enabled
+
+    pylint does not have a hook to schedule the files of the workers or to initialize them
+    so its function is replaced only if the option is enabled and the private functions
+    of pylint used are available, otherwise the original one of pylint is used
+    """
+    if not getattr(linter.config, "odoolint_jobs_by_addon", False):
+        return
+    if not is_supported():
+        warnings.warn(
+            f"--odoolint-jobs-by-addon is not supported by pylint {'.'.join(map(str, PYLINT_VERSION))}"
+            " so the files are sent to the workers by pylint",
+            stacklevel=2,
+        )
+        return
+    pylinter.check_parallel = check_parallel
@@ -0,0 +1,153 @@
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+
+from astroid import MANAGER
+from astroid.inference_tip import clear_inference_tip_cache
+from pylint.lint import Run
+from pylint.utils import LinterStats
+
+from . import misc
+from .checkers.odoo_addons import OdooAddons
+
+# Exit status of the requests that could not be linted (same as pylint usage errors)
+ERROR_STATUS = 32
+
+
+class LintServer:
+    """Linter kept in memory to lint the files sent by the clients (pylint-odoo --serve)
+
+    The linter is built with the options of the server the first time, so the next
+    requests re-use the checkers registered, the astroid cache of the modules already
+    inferred (e.g. odoo) and the path caches of the plugin.
+    The modules of the astroid cache whose file changed and the files of the odoo
+    modules scanned are refreshed before each request
+    """
+
+    def __init__(self, pylint_args):
+        self.pylint_args = ["--load-plugins=pylint_odoo", *pylint_args]
+        self.linter = None
+        self._mtimes = {}
+
+    @staticmethod
+    def _get_mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh_caches(self):
+        """Drop the modules of the astroid cache changed since the last request
+        and the odoo modules and paths resolved since the tree could have changed"""
+        changed_modnames = [
+            modname
+            for modname, module in MANAGER.astroid_cache.items()
+            if module.file and self._mtimes.get(module.file) != self._get_mtime(module.file)
+        ]
+        for modname in changed_modnames:
+            del MANAGER.astroid_cache[modname]
+        if changed_modnames:
+            # The values inferred from the modules dropped
+            clear_inference_tip_cache()
+        misc.clear_path_caches()
+        for checker in self.linter.get_checkers():
+            if isinstance(checker, OdooAddons):
+                checker.addon_index.refresh()
+                checker.dependency_graph.refresh()
+
+    def _save_mtimes(self):
+        self._mtimes = {
+            module.file: self._get_mtime(module.file) for module in MANAGER.astroid_cache.values() if module.file
+        }
+
+    def lint(self, files):
+        """Lint the files returning the output of the reporter and the exit status of pylint"""
+        if not files:
+            return "No files to lint: exiting.\n", ERROR_STATUS
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            if self.linter is None:
+                try:
+                    run = Run([*self.pylint_args, *files], exit=False)
+                except SystemExit as exit_exc:
+                    # e.g. invalid options or no files to lint
+                    return output.getvalue(), exit_exc.code
+                self.linter = run.linter
+                score = self.linter.stats.global_note if self.linter.config.score else None
+            else:
+                self._refresh_caches()
+                self.linter.stats = LinterStats()
+                self.linter.msg_status = 0
+                # New reporters writing to the output of the request (e.g. text reporter headers)
+                self.linter._load_reporters(self.linter.config.output_format or "text")
+                self.linter.check(files)
+                score = self.linter.generate_reports()
+        self._save_mtimes()
+        return output.getvalue(), self._get_status(score)
+
+    def _get_status(self, score):
+        """Same exit status of pylint.lint.Run"""
+        linter = self.linter
+        if linter.config.exit_zero:
+            return 0
+        if linter.any_fail_on_issues() or (score is not None and score < linter.config.fail_under):
+            return linter.msg_status or 1
+        return linter.msg_status
+
+    def handle_request(self, request):
+        """Lint the files of the request from its current working directory"""
+        cwd = os.getcwd()
+        try:
+            os.chdir(request.get("cwd") or cwd)
+            output, status = self.lint(request["files"])
+        except Exception:  # pylint: disable=broad-except
+            return {"output": traceback.format_exc(), "status": ERROR_STATUS}
+        finally:
+            os.chdir(cwd)
+        return {"output": output, "status": status}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.read().decode("UTF-8"))
+        except ValueError as request_exc:
+            # Including UnicodeDecodeError
+            response = {"output": f"Invalid request: {request_exc}\n", "status": ERROR_STATUS}
+        else:
+            response = self.server.lint_server.handle_request(request)
+        self.wfile.write(json.dumps(response).encode("UTF-8"))
+
+
+def serve(socket_path, pylint_args):
+    """Serve the requests of the clients in the Unix socket "socket_path" one by one"""
+    if os.path.exists(socket_path):
+        with contextlib.suppress(OSError), socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            raise RuntimeError(f"Other server is already running in {socket_path}")
+        # Socket of a server not running anymore
+        os.remove(socket_path)
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: sys.exit(0))
+    with socketserver.UnixStreamServer(socket_path, _RequestHandler) as server:
+        server.lint_server = LintServer(pylint_args)
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def send_request(socket_path, files):
+    """Send the files to lint to the server returning its output and exit status"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps({"files": files, "cwd": os.getcwd()}).encode("UTF-8"))
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile("rb") as f_response:
+            response = json.loads(f_response.read().decode("UTF-8"))
+    return response["output"], response["status"]
@@ -0,0 +1,11 @@
+{
+    'name': 'Depends module A for tests',
+    'license': 'AGPL-3',
+    'author': 'Odoo Community Association (OCA)',
+    'version': '17.0.1.0.0',
+    # Circular dependency with depends_module_b
+    'depends': [
+        'base',
+        'depends_module_b',
+    ],
+}
@@ -0,0 +1,9 @@
+{
+    'name': 'Depends module B for tests',
+    'license': 'AGPL-3',
+    'author': 'Odoo Community Association (OCA)',
+    'version': '17.0.1.0.0',
+    'depends': [
+        'depends_module_a',
+    ],
+}
@@ -0,0 +1,13 @@
+{
+    'name': 'Depends module C for tests',
+    'license': 'AGPL-3',
+    'author': 'Odoo Community Association (OCA)',
+    'version': '17.0.1.0.0',
+    # depends_module_e is redundant since depends_module_d depends on it
+    # but base is not reported since it is not a module of the run
+    'depends': [
+        'base',
+        'depends_module_d',
+        'depends_module_e',
+    ],
+}
@@ -0,0 +1,5 @@
+# Transitive depend
+from odoo.addons.depends_module_e import models as e_models
+
+# Module not in the depends of the manifest
+from odoo.addons.depends_module_a import models as a_models
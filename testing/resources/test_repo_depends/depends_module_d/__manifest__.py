@@ -0,0 +1,10 @@
+{
+    'name': 'Depends module D for tests',
+    'license': 'AGPL-3',
+    'author': 'Odoo Community Association (OCA)',
+    'version': '17.0.1.0.0',
+    'depends': [
+        'base',
+        'depends_module_e',
+    ],
+}
@@ -0,0 +1,9 @@
+{
+    'name': 'Depends module E for tests',
+    'license': 'AGPL-3',
+    'author': 'Odoo Community Association (OCA)',
+    'version': '17.0.1.0.0',
+    'depends': [
+        'base',
+    ],
+}
@@ -0,0 +1,271 @@
+"""Benchmark of the odoolint checks over synthetic odoo modules
+
+Generate odoo modules of configurable size and time the check families in serial
+and parallel (--jobs) mode saving the results as JSON to compare them later
+
+    python tests/benchmark.py --models=50 --fields=20 --jobs=4 --output=after.json --compare=before.json
+"""
+
+import argparse
+import functools
+import json
+import os
+import platform
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+import pylint
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+from pylint_odoo import __version__ as version, misc
+from pylint_odoo.checkers import custom_logging, odoo_addons, vim_comment
+
+# (name, checker class, method) of the check families timed in serial mode
+CHECK_FAMILIES = (
+    ("OdooAddons.visit_call", odoo_addons.OdooAddons, "visit_call"),
+    ("OdooAddons.visit_dict", odoo_addons.OdooAddons, "visit_dict"),
+    ("OdooAddons.visit_functiondef", odoo_addons.OdooAddons, "visit_functiondef"),
+    ("CustomLoggingChecker.visit_call", custom_logging.CustomLoggingChecker, "visit_call"),
+    ("VimComment.process_tokens", vim_comment.VimComment, "process_tokens"),
+)
+
+MANIFEST_TMPL = """{{
+    "name": "Benchmark {addon}",
+    "version": "17.0.1.0.0",
+    "author": "Odoo Community Association (OCA)",
+    "license": "AGPL-3",
+    "website": "https://github.com/OCA/pylint-odoo",
+    "depends": ["base"],
+    "data": [
+{data}
+    ],
+}}
+"""
+
+MODEL_TMPL = """# vim:expandtab
+import logging
+
+from odoo import _, api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class BenchModel{model}(models.Model):
+    _name = "bench.model{model}"
+    _description = "Benchmark Model {model}"
+
+{fields}
+
+    @api.depends("field0")
+    def _compute_name(self):
+        for record in self:
+            record.name = _("Name %s") % record.field0
+{executes}
+"""
+
+FIELD_TMPL = '    field{field} = fields.Char("Field {field}", help="Help of the field {field}")'
+
+EXECUTE_TMPL = """
+    def _execute{execute}(self, value):
+        self.env.cr.execute("SELECT id FROM bench_model{execute} WHERE name = '%s'" % value)
+        _logger.info("Executed %s", value)
+        return self.env.cr.fetchall()
+"""
+
+INHERIT_TMPL = """from odoo import models
+
+
+class ResPartner{inherit}(models.Model):
+    _inherit = "res.partner"
+
+    def write(self, vals):
+        return super().write(vals)
+"""
+
+
+def write_file(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="UTF-8") as f_file:
+        f_file.write(content)
+
+
+def generate_addons(path, *, addons=2, models=20, fields=10, executes=5, inherits=3, data=50):
+    """Generate the odoo modules in "path" and return the paths of their python files
+
+    :param models: Number of models by module with "fields" fields and "executes" cr.execute calls
+    :param inherits: Number of files inheriting the same model by module
+    :param data: Number of files in the "data" key of the manifest (the odd ones do not exist)
+    """
+    py_paths = []
+    for addon in range(addons):
+        addon_path = os.path.join(path, f"bench_addon{addon}")
+        data_lines = []
+        for data_index in range(data):
+            data_relpath = f"views/view{data_index}.xml"
+            data_lines.append(f"        {data_relpath!r},")
+            if not data_index % 2:
+                write_file(os.path.join(addon_path, data_relpath), "<odoo/>\n")
+        files = {
+            "__manifest__.py": MANIFEST_TMPL.format(addon=addon, data="\n".join(data_lines)),
+            "__init__.py": "from . import models\n",
+            "README.rst": "Benchmark\n",
+        }
+        model_names = [f"model{model}" for model in range(models)] + [
+            f"inherit{inherit}" for inherit in range(inherits)
+        ]
+        files[os.path.join("models", "__init__.py")] = "".join(f"from . import {name}\n" for name in model_names)
+        for model in range(models):
+            files[os.path.join("models", f"model{model}.py")] = MODEL_TMPL.format(
+                model=model,
+                fields="\n".join(FIELD_TMPL.format(field=field) for field in range(fields)),
+                executes="".join(EXECUTE_TMPL.format(execute=execute) for execute in range(executes)),
+            )
+        for inherit in range(inherits):
+            files[os.path.join("models", f"inherit{inherit}.py")] = INHERIT_TMPL.format(inherit=inherit)
+        for relpath, content in files.items():
+            write_file(os.path.join(addon_path, relpath), content)
+            if relpath.endswith(".py"):
+                py_paths.append(os.path.join(addon_path, relpath))
+    return py_paths
+
+
+def timed(method, timings):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timings["calls"] += 1
+            timings["seconds"] += time.perf_counter() - start
+
+    return wrapper
+
+
+def run_pylint(paths, jobs=1):
+    """Lint the paths with only the odoolint checks enabled and return the wall time
+    and the number of messages"""
+    reporter = CollectingReporter()
+    args = [
+        "--load-plugins=pylint_odoo",
+        "--disable=all",
+        "--enable=odoolint",
+        "--persistent=no",
+        "--score=no",
+        f"--jobs={jobs}",
+        *paths,
+    ]
+    start = time.perf_counter()
+    Run(args, reporter=reporter, exit=False)
+    return time.perf_counter() - start, len(reporter.messages)
+
+
+def time_walk_up(paths, repeat=5):
+    """Time looking for the manifest of each directory of the python files with the caches
+    of misc.walk_up cleared (e.g. the first file of a directory or a server request after a refresh)
+    returning the best time of "repeat" runs"""
+    dirpaths = sorted({os.path.dirname(path) for path in paths})
+    tops = {dirpath: misc.top_path(dirpath) for dirpath in dirpaths}
+    manifest_files = tuple(misc.MANIFEST_FILES)
+    best_seconds = None
+    for _ in range(repeat):
+        misc.clear_path_caches()
+        start = time.perf_counter()
+        for dirpath in dirpaths:
+            misc.walk_up(dirpath, manifest_files, tops[dirpath])
+        seconds = time.perf_counter() - start
+        best_seconds = seconds if best_seconds is None else min(best_seconds, seconds)
+    misc.clear_path_caches()
+    return {"calls": len(dirpaths), "seconds": best_seconds}
+
+
+def benchmark(paths, jobs=0):
+    """Time the check families in serial mode, the whole run in serial and parallel mode
+    and the lookup of the manifests with cold caches"""
+    families = {}
+    originals = []
+    for name, checker_class, method_name in CHECK_FAMILIES:
+        families[name] = {"calls": 0, "seconds": 0.0}
+        originals.append((checker_class, method_name, checker_class.__dict__.get(method_name)))
+        setattr(checker_class, method_name, timed(getattr(checker_class, method_name), families[name]))
+    try:
+        serial_seconds, serial_messages = run_pylint(paths)
+    finally:
+        for checker_class, method_name, original in originals:
+            if original is None:
+                delattr(checker_class, method_name)
+            else:
+                setattr(checker_class, method_name, original)
+    results = {"serial": {"seconds": serial_seconds, "messages": serial_messages, "checks": families}}
+    if jobs > 1:
+        jobs_seconds, jobs_messages = run_pylint(paths, jobs)
+        results["jobs"] = {"jobs": jobs, "seconds": jobs_seconds, "messages": jobs_messages}
+    results["walk_up"] = time_walk_up(paths)
+    return results
+
+
+def compare(results, baseline):
+    """Get the lines of the ratio of the times of the results against the baseline"""
+    lines = []
+
+    def add_line(name, seconds, baseline_seconds):
+        if baseline_seconds:
+            lines.append(f"{name}: {baseline_seconds:.4f}s -> {seconds:.4f}s ({seconds / baseline_seconds:.2f}x)")
+
+    add_line("serial", results["serial"]["seconds"], baseline["results"]["serial"]["seconds"])
+    for name, timings in results["serial"]["checks"].items():
+        baseline_timings = baseline["results"]["serial"]["checks"].get(name) or {}
+        add_line(f"  {name}", timings["seconds"], baseline_timings.get("seconds"))
+    if "jobs" in results and "jobs" in baseline["results"]:
+        add_line("jobs", results["jobs"]["seconds"], baseline["results"]["jobs"]["seconds"])
+    if "walk_up" in results and "walk_up" in baseline["results"]:
+        add_line("walk_up", results["walk_up"]["seconds"], baseline["results"]["walk_up"]["seconds"])
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--addons", type=int, default=2, help="Number of odoo modules")
+    parser.add_argument("--models", type=int, default=20, help="Number of models by module")
+    parser.add_argument("--fields", type=int, default=10, help="Number of fields by model")
+    parser.add_argument("--executes", type=int, default=5, help="Number of cr.execute calls by model")
+    parser.add_argument("--inherits", type=int, default=3, help="Number of files inheriting the same model")
+    parser.add_argument("--data", type=int, default=50, help="Number of files in the manifest data key")
+    parser.add_argument("--jobs", type=int, default=2, help="Processes of the parallel mode. 0 or 1 to skip it")
+    parser.add_argument("--output", help="Path of the JSON file to save the results")
+    parser.add_argument("--compare", help="Path of a JSON file of a previous run to compare the results")
+    args = parser.parse_args(argv)
+
+    params = {
+        "addons": args.addons,
+        "models": args.models,
+        "fields": args.fields,
+        "executes": args.executes,
+        "inherits": args.inherits,
+        "data": args.data,
+    }
+    with TemporaryDirectory() as tmp_dir:
+        paths = generate_addons(tmp_dir, **params)
+        results = benchmark(paths, args.jobs)
+    report = {
+        "params": params,
+        "python": platform.python_version(),
+        "pylint": pylint.__version__,
+        "pylint_odoo": version,
+        "results": results,
+    }
+    report_json = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as f_output:
+            f_output.write(report_json)
+    print(report_json)
+    if args.compare:
+        with open(args.compare, encoding="UTF-8") as f_baseline:
+            print("\n".join(compare(results, json.load(f_baseline))))
+    return report
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
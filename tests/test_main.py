@@ -2,25 +2,44 @@ from __future__ import annotations
 
 import ast as ast_mod
 import inspect
+import json
 import os
 import re
+import socket
 import stat
+import subprocess
 import sys
 import textwrap
+import time
 from collections import Counter, defaultdict
 from glob import glob
 from io import StringIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
+from unittest.mock import patch
 
 import astroid
 import dill
 import pytest
+from pylint.lint import PyLinter, pylinter
 from pylint.reporters.text import TextReporter
 from pylint.testutils._run import _Run as Run
 from pylint.testutils.utils import _patch_streams
-
-from pylint_odoo import __version__ as version, misc, plugin
+from pylint.typing import FileItem
+
+from pylint_odoo import (
+    __version__ as version,
+    addon_index,
+    dependency_graph,
+    manifest_linter,
+    misc,
+    ndjson_reporter,
+    placeholders,
+    plugin,
+    profiler,
+    scheduler,
+    server,
+)
 from pylint_odoo.checkers import custom_logging, odoo_addons, vim_comment
 
 RE_CHECK_OUTPUT = re.compile(r"\- \[(?P<check>[\w|-]+)\]")
@@ -527,6 +546,34 @@ def fstring_no_sqli(self):
         real_errors = pylint_res.linter.stats.by_msg
         self.assert_dict_equal(real_errors, {"sql-injection": 4})
 
+    def test_146_sqli_cursor_expr(self):
+        """sql-injection is checked only for the cursors of --cursor-expr and not in test files"""
+        extra_params = ["--disable=all", "--enable=sql-injection"]
+        queries = """
+def sqli(self, cr):
+   cr.execute("SELECT * FROM %s" % self.name)
+   self.env.cr.execute("SELECT * FROM %s" % self.name)
+   self.env.cr.executemany("SELECT * FROM %s" % self.name)
+   self.env.cr.execute("SELECT * FROM %s WHERE id = %s" % self.name, [1])
+   execute("SELECT * FROM %s" % self.name)
+   cursor = self.env.cr
+   cursor.execute("SELECT * FROM %s" % self.name)
+           """
+        with TemporaryDirectory() as tmp_dir:
+            for fname, cursor_expr, expected_sqli in (
+                ("sqli.py", None, 3),
+                ("sqli.py", "cr", 1),
+                # Custom cursor names are checked only if they are configured
+                ("sqli.py", "cr,self.env.cr,cursor", 4),
+                ("test_sqli.py", None, 0),
+            ):
+                fpath = os.path.join(tmp_dir, fname)
+                with open(fpath, "w", encoding="UTF-8") as f_py:
+                    f_py.write(queries)
+                params = extra_params + ([f"--cursor-expr={cursor_expr}"] if cursor_expr else [])
+                pylint_res = self.run_pylint([fpath], params)
+                assert pylint_res.linter.stats.by_msg.get("sql-injection", 0) == expected_sqli
+
     @pytest.mark.parametrize("expected_error_name", EXPECTED_ERRORS)
     def test_150_check_only_enabled_one_check(self, expected_error_name):
         """Checking -d all -e ONLY-ONE-CHECK"""
@@ -709,9 +756,14 @@ def fstring_no_sqli(self):
 
         # Registering the plugin again over the same linter must be skipped
         # like in a parallel worker restoring the linter with the checkers
+        # but re-using the paths resolved by the main process
+        scheduler.warm_path_caches(linter, [FileItem("model_inhe1", paths[0], "model_inhe1")])
+        misc.clear_path_caches()
         checkers_before = len(list(linter.get_checkers()))
         plugin.register(linter)
         assert checkers_before == len(list(linter.get_checkers()))
+        assert misc.get_path_caches() == linter.odoolint_path_caches
+        assert (os.path.dirname(paths[0]), tuple(misc.MANIFEST_FILES), misc.top_path(paths[0])) in misc._walk_up_cache
 
         checker = next(
             checker for checker in linter.get_checkers() if isinstance(checker, plugin.checkers.odoo_addons.OdooAddons)
@@ -739,7 +791,8 @@ def fstring_no_sqli(self):
         assert checker._odoo_inherit_items
 
         data = checker.get_map_data()
-        assert len(data) == 2
+        assert data["paths"][0] == "fake_module/__manifest__.py"
+        assert len(data["groups"][(0, "res.company")]) == 2
         assert not checker._odoo_inherit_items
 
         errors_before = linter.stats.by_msg.get("consider-merging-classes-inherited", 0)
@@ -747,6 +800,562 @@ def fstring_no_sqli(self):
         errors_after = linter.stats.by_msg.get("consider-merging-classes-inherited", 0)
         assert errors_after == errors_before + 1
 
+    def test_186_jobs_map_data_payload(self):
+        """The inherit records of a file are dropped from the payload of the workers
+        if the module has no other python file that could inherit the same model"""
+        checker = odoo_addons.OdooAddons(PyLinter())
+        with TemporaryDirectory() as tmp_dir:
+            manifest_path = os.path.join(tmp_dir, "module1", "__manifest__.py")
+            model_path = os.path.join(tmp_dir, "module1", "models", "res_partner.py")
+            os.makedirs(os.path.join(tmp_dir, "module1", "node_modules", "lib"))
+            os.makedirs(os.path.dirname(model_path))
+            for path in (
+                manifest_path,
+                model_path,
+                os.path.join(tmp_dir, "module1", "__init__.py"),
+                os.path.join(tmp_dir, "module1", "models", "__init__.py"),
+                os.path.join(tmp_dir, "module1", "node_modules", "lib", "setup.py"),
+            ):
+                with open(path, "w", encoding="UTF-8") as f_py:
+                    f_py.write("_inherit = 'res.partner'\n" if path == model_path else "{}\n")
+            records = [(manifest_path, "res.partner", "module1.models.res_partner", model_path, 1, 0)]
+            assert checker._get_inherit_payload(records) is None
+            assert checker._get_inherit_payload(records * 2)["groups"] == {(0, "res.partner"): [(1, 1, 0)] * 2}
+
+            # Any other python file could inherit the same model without reading it
+            other_checker = odoo_addons.OdooAddons(PyLinter())
+            with open(model_path.replace("res_partner", "res_users"), "w", encoding="UTF-8") as f_py:
+                f_py.write("_inherit = 'res.users'\n")
+            assert other_checker._get_inherit_payload(records) == {
+                "paths": [manifest_path, model_path],
+                "modnames": {1: "module1.models.res_partner"},
+                "groups": {(0, "res.partner"): [(1, 1, 0)]},
+            }
+
+    @pytest.mark.skipif(
+        not dill_supports_code_objects(),
+        reason="pylint parallel mode crashes since dill is not able to serialize code objects"
+        " for this python version (e.g. py3.15 removed code.co_lnotab)",
+    )
+    def test_187_jobs_by_addon(self):
+        """Using --odoolint-jobs-by-addon must generate the same messages sending the files
+        to the workers in batches of the same odoo module"""
+        file_items = [
+            FileItem(os.path.basename(path), path, os.path.basename(path)) for path in sorted(self.paths_modules)
+        ]
+        batches = scheduler.partition_by_addon(file_items, 10)
+        assert sorted(file_item for batch in batches for file_item in batch) == sorted(file_items)
+        for batch in batches:
+            assert len({scheduler.get_addon_root(file_item.filepath) for file_item in batch}) == 1
+        batch_sizes = [sum(os.path.getsize(file_item.filepath) for file_item in batch) for batch in batches]
+        assert batch_sizes == sorted(batch_sizes, reverse=True)
+
+        # The check_parallel of pylint is replaced only if the option is enabled
+        # and its private functions are available
+        original_check_parallel = pylinter.check_parallel
+        linter = PyLinter()
+        linter.config.odoolint_jobs_by_addon = False
+        scheduler.install(linter)
+        assert pylinter.check_parallel is original_check_parallel
+        linter.config.odoolint_jobs_by_addon = True
+        with patch.object(scheduler, "PARALLEL_PRIVATE_FUNCTIONS", ("_not_existing_function",)):
+            with pytest.warns(UserWarning, match="odoolint-jobs-by-addon is not supported"):
+                scheduler.install(linter)
+        assert pylinter.check_parallel is original_check_parallel
+
+        self.default_extra_params += ["--jobs=4", "--odoolint-jobs-by-addon=y"]
+        try:
+            pylint_res = self.run_pylint(self.paths_modules)
+            assert pylinter.check_parallel is scheduler.check_parallel
+        finally:
+            pylinter.check_parallel = original_check_parallel
+        jobs_messages = self._get_messages_from_output(pylint_res)
+        assert self.expected_errors == {check: len(lines) for check, lines in jobs_messages.items()}
+
+    def test_188_model_registry(self):
+        """The model registry must have the models of all the modules linted sequentially,
+        replayed from the cache or merged from the workers in parallel mode"""
+
+        def get_models(pylint_res):
+            checker = next(
+                checker for checker in pylint_res.linter.get_checkers() if isinstance(checker, odoo_addons.OdooAddons)
+            )
+            return {
+                model_name: dict(model, classes=sorted(model["classes"]))
+                for model_name, model in checker.model_registry.models.items()
+            }
+
+        models = get_models(self.run_pylint(self.paths_modules, list(self.default_extra_params)))
+        assert models["test.model"]["addons"] == {"broken_module"}
+        assert "length" in models["test.model"]["fields"]
+        assert "_compute_name" in models["test.model"]["methods"]
+        # _inherit only extends the model defined by other module
+        assert not models["res.company"]["addons"]
+        assert len(models["res.company"]["classes"]) >= 3
+
+        with TemporaryDirectory() as tmp_dir:
+            cache_params = self.default_extra_params + [f"--odoolint-cache-dir={tmp_dir}"]
+            assert get_models(self.run_pylint(self.paths_modules, list(cache_params))) == models
+            assert get_models(self.run_pylint(self.paths_modules, list(cache_params))) == models
+        if dill_supports_code_objects():
+            jobs_params = self.default_extra_params + ["--jobs=2"]
+            assert get_models(self.run_pylint(self.paths_modules, jobs_params)) == models
+        # The classes are not collected if no message uses the model registry
+        disabled_params = self.default_extra_params + ["--disable=missing-model-dependency"]
+        assert not get_models(self.run_pylint(self.paths_modules, disabled_params))
+
+        # The models are registered only with missing-model-dependency enabled and the
+        # model inherited must be defined by the module or by its depends
+        with TemporaryDirectory() as tmp_dir:
+            addons_dir = os.path.realpath(tmp_dir)
+            for module_name, depends, model_source in (
+                (
+                    "module_a",
+                    ["base"],
+                    "class ModelA(models.Model):\n    _name = 'model.a'\n    name = fields.Char()\n",
+                ),
+                (
+                    "module_b",
+                    ["base"],
+                    "class ModelA(models.Model):\n    _inherit = ['model.a', 'mail.thread']\n\n\n"
+                    "class ResPartner(models.Model):\n    _inherit = 'res.partner'\n",
+                ),
+                ("module_c", ["module_a"], "class ModelA(models.Model):\n    _inherit = ('model.a',)\n"),
+            ):
+                os.makedirs(os.path.join(addons_dir, module_name, "models"))
+                with open(os.path.join(addons_dir, module_name, "__manifest__.py"), "w", encoding="UTF-8") as f_py:
+                    f_py.write(repr({"name": module_name, "depends": depends}))
+                with open(os.path.join(addons_dir, module_name, "models", "model.py"), "w", encoding="UTF-8") as f_py:
+                    f_py.write("from odoo import fields, models\n\n\n" + model_source)
+            model_paths = [
+                os.path.join(addons_dir, module_name) for module_name in ("module_a", "module_b", "module_c")
+            ]
+            extra_params = ["--disable=all", "--enable=missing-model-dependency"]
+            all_params = [extra_params, extra_params + [f"--odoolint-cache-dir={tmp_dir}"] * 2]
+            if dill_supports_code_objects():
+                all_params.append(extra_params + ["--jobs=2"])
+            for params in all_params:
+                pylint_res = self.run_pylint(model_paths, list(params))
+                (message,) = self._get_messages_from_output(pylint_res)["missing-model-dependency"]
+                assert message.startswith(os.path.join(addons_dir, "module_b", "models", 'model.py:4 Model "model.a"'))
+                models = get_models(pylint_res)
+                assert models["model.a"]["addons"] == {"module_a"}
+                assert models["model.a"]["fields"] == {"name"}
+                assert sorted(addon for addon, _path, _lineno in models["model.a"]["classes"]) == [
+                    "module_a",
+                    "module_b",
+                    "module_c",
+                ]
+                assert "mail.thread" in models and "res.partner" in models
+
+    def test_189_dependency_graph(self):
+        """The depends of the modules are resolved once with their circular dependencies"""
+        with TemporaryDirectory() as tmp_dir:
+            addons_dir = os.path.realpath(tmp_dir)
+            for module_name, depends in {
+                "module_a": ["base", "module_b"],
+                "module_b": ["module_c"],
+                "module_c": ["module_a", "mail"],
+                "module_d": ["base", "module_a", "module_c", "sale"],
+                "module_e": ["module_e"],
+                "module_f": ["base", "module_g", "module_h"],
+                "module_g": ["base", "module_h"],
+                "module_h": ["base"],
+            }.items():
+                os.makedirs(os.path.join(addons_dir, module_name))
+                with open(
+                    os.path.join(addons_dir, module_name, "__manifest__.py"), "w", encoding="UTF-8"
+                ) as f_manifest:
+                    f_manifest.write(repr({"name": module_name, "depends": depends}))
+            graph = dependency_graph.DependencyGraph(addon_index.AddonIndex())
+            module_d = os.path.join(addons_dir, "module_d")
+            assert graph.get_closure(module_d) == {"base", "mail", "module_a", "module_b", "module_c", "sale"}
+            assert not graph.get_cycle(module_d)
+            # module_a and module_c are in the same circular dependency
+            # and base is not a module of the run
+            assert not graph.get_redundant_depends(module_d)
+            # The modules reachable are resolved at once
+            assert set(graph._closures) == {
+                os.path.join(addons_dir, module_name)
+                for module_name in ("module_a", "module_b", "module_c", "module_d")
+            }
+            for module_name in ("module_a", "module_b", "module_c"):
+                assert graph.get_cycle(os.path.join(addons_dir, module_name)) == ("module_a", "module_b", "module_c")
+            assert graph.get_cycle(os.path.join(addons_dir, "module_e")) == ("module_e",)
+            assert graph.get_module_root(addons_dir, "base") is None
+            assert graph.get_redundant_depends(os.path.join(addons_dir, "module_f")) == [("module_h", "module_g")]
+
+        # The long chains of depends are resolved without recursion
+        with TemporaryDirectory() as tmp_dir:
+            addons_dir = os.path.realpath(tmp_dir)
+            chain_length = sys.getrecursionlimit() + 100
+            for module_index in range(chain_length):
+                module_path = os.path.join(addons_dir, f"module_{module_index}")
+                os.makedirs(module_path)
+                with open(os.path.join(module_path, "__manifest__.py"), "w", encoding="UTF-8") as f_manifest:
+                    f_manifest.write(repr({"name": "Chain", "depends": [f"module_{module_index + 1}"]}))
+            graph = dependency_graph.DependencyGraph(addon_index.AddonIndex())
+            assert len(graph.get_closure(os.path.join(addons_dir, "module_0"))) == chain_length
+            assert not graph.get_cycle(os.path.join(addons_dir, "module_0"))
+
+        # Dedicated modules since the depends of the modules of test_repo are shared by the other tests
+        paths = glob(
+            os.path.join(os.path.dirname(self.root_path_modules), "test_repo_depends", "**", "*.py"), recursive=True
+        )
+        extra_params = [
+            "--disable=all",
+            "--enable=manifest-circular-dependency,manifest-redundant-depends,missing-manifest-dependency",
+        ]
+        pylint_res = self.run_pylint(paths, extra_params)
+        self.assert_dict_equal(
+            pylint_res.linter.stats.by_msg,
+            {"manifest-circular-dependency": 2, "manifest-redundant-depends": 1, "missing-manifest-dependency": 1},
+        )
+
+    def test_190_result_cache(self):
+        """Using --odoolint-cache-dir must generate the same messages replaying the cached
+        modules and checking only the changed ones"""
+        with TemporaryDirectory() as tmp_dir:
+            self.default_extra_params += [f"--odoolint-cache-dir={tmp_dir}"]
+            cold_pylint_res = self.run_pylint(self.paths_modules, list(self.default_extra_params))
+            cold_cache = next(
+                checker.result_cache
+                for checker in cold_pylint_res.linter.get_checkers()
+                if isinstance(checker, odoo_addons.OdooAddons)
+            )
+            assert not cold_cache.hits
+            assert cold_cache.misses
+            assert self.expected_errors == cold_pylint_res.linter.stats.by_msg
+
+            warm_pylint_res = self.run_pylint(self.paths_modules, list(self.default_extra_params))
+            warm_cache = next(
+                checker.result_cache
+                for checker in warm_pylint_res.linter.get_checkers()
+                if isinstance(checker, odoo_addons.OdooAddons)
+            )
+            assert warm_cache.hits == cold_cache.misses
+            assert not warm_cache.misses
+            assert self.expected_errors == warm_pylint_res.linter.stats.by_msg
+            cold_messages = self._get_messages_from_output(cold_pylint_res)
+            warm_messages = self._get_messages_from_output(warm_pylint_res)
+            assert {check: sorted(lines) for check, lines in cold_messages.items()} == {
+                check: sorted(lines) for check, lines in warm_messages.items()
+            }
+            # The messages added at the end of the run keep the stats of the modules already checked
+            modname = "broken_module.models.model_inhe2"
+            assert cold_pylint_res.linter.stats.by_module[modname]["statement"]
+            assert (
+                cold_pylint_res.linter.stats.by_module[modname]["statement"]
+                == warm_pylint_res.linter.stats.by_module[modname]["statement"]
+            )
+
+            # A different option value invalidates the cached modules
+            changed_pylint_res = self.run_pylint(self.paths_modules, self.default_extra_params + ["--cursor-expr=cr"])
+            changed_cache = next(
+                checker.result_cache
+                for checker in changed_pylint_res.linter.get_checkers()
+                if isinstance(checker, odoo_addons.OdooAddons)
+            )
+            assert not changed_cache.hits
+
+            # Other astroid version invalidates the cached modules since the checks use the inference
+            with patch.object(astroid, "__version__", "0.0.0"):
+                changed_pylint_res = self.run_pylint(self.paths_modules, list(self.default_extra_params))
+            changed_cache = next(
+                checker.result_cache
+                for checker in changed_pylint_res.linter.get_checkers()
+                if isinstance(checker, odoo_addons.OdooAddons)
+            )
+            assert not changed_cache.hits
+
+    def test_195_call_checks_index(self):
+        """Only the visit_call sub-checks with messages enabled are indexed by callee name"""
+        pylint_res = self.run_pylint(self.paths_modules, ["--disable=all", "--enable=invalid-commit,sql-injection"])
+        checker = next(
+            checker for checker in pylint_res.linter.get_checkers() if isinstance(checker, odoo_addons.OdooAddons)
+        )
+        assert {
+            callee_name: [check_call.__name__ for check_call in check_calls]
+            for callee_name, check_calls in checker._call_checks_by_name.items()
+        } == {
+            "commit": ["_check_invalid_commit"],
+            "execute": ["_check_sql_injection"],
+            "executemany": ["_check_sql_injection"],
+        }
+        assert not checker._call_checks_any
+        self.assert_dict_equal(
+            pylint_res.linter.stats.by_msg,
+            {
+                "invalid-commit": self.expected_errors["invalid-commit"],
+                "sql-injection": self.expected_errors["sql-injection"],
+            },
+        )
+
+        # Checks not applicable for the odoo version are not indexed
+        pylint_res = self.run_pylint(
+            self.paths_modules, ["--disable=all", "--enable=prefer-env-translation", "--valid-odoo-versions=17.0"]
+        )
+        checker = next(
+            checker for checker in pylint_res.linter.get_checkers() if isinstance(checker, odoo_addons.OdooAddons)
+        )
+        assert not checker._call_checks_by_name
+
+    def test_196_odoo_msgs_enabled(self):
+        """The messages enabled for the valid_odoo_versions are computed once per run by msgid and symbol"""
+        pylint_res = self.run_pylint(
+            self.paths_modules, ["--disable=all", "--enable=prefer-env-translation", "--valid-odoo-versions=17.0"]
+        )
+        checker = next(
+            checker for checker in pylint_res.linter.get_checkers() if isinstance(checker, odoo_addons.OdooAddons)
+        )
+        assert checker._odoo_msgs_enabled["prefer-env-translation"] is False
+        assert checker._odoo_msgs_enabled["W8161"] is False
+        assert checker._odoo_msgs_enabled["deprecated-name-get"] is True
+        assert set(checker._odoo_msgs_enabled) == set(checker.msgs) | {msg[1] for msg in checker.msgs.values()}
+        with pytest.raises(TypeError):
+            checker._odoo_msgs_enabled["deprecated-name-get"] = False
+        assert not pylint_res.linter.stats.by_msg
+
+        pylint_res = self.run_pylint(self.paths_modules, ["--disable=all", "--enable=prefer-env-translation"])
+        checker = next(
+            checker for checker in pylint_res.linter.get_checkers() if isinstance(checker, odoo_addons.OdooAddons)
+        )
+        assert all(checker._odoo_msgs_enabled.values())
+
+    @pytest.mark.skipif(
+        not dill_supports_code_objects(),
+        reason="pylint parallel mode crashes since dill is not able to serialize code objects"
+        " for this python version (e.g. py3.15 removed code.co_lnotab)",
+    )
+    def test_197_profile(self):
+        """Using --odoolint-profile must save the timings of the checks without changing the messages
+        merging the timings of the workers in parallel mode (--jobs)"""
+        extra_params = ["--disable=all", "--enable=odoolint,pointless-statement"]
+        with TemporaryDirectory() as tmp_dir:
+            profile_path = os.path.join(tmp_dir, "profile.json")
+            pylint_res = self.run_pylint(self.paths_modules, [*extra_params, f"--odoolint-profile={profile_path}"])
+            self.assert_dict_equal(pylint_res.linter.stats.by_msg, self.expected_errors)
+            with open(profile_path, encoding="UTF-8") as f_profile:
+                profile = json.load(f_profile)
+            visit_call = profile["methods"]["OdooAddons.visit_call"]
+            assert visit_call["calls"] > 0
+            assert 0 < len(visit_call["slowest"]) <= profiler.SLOWEST_NODES
+            assert visit_call["slowest"][0]["node"] == "Call"
+            assert "sql-injection" in visit_call["msgs"]
+            assert profile["methods"]["OdooAddons._check_sql_injection"]["calls"] > 0
+            assert profile["methods"]["VimComment.process_tokens"]["calls"] == len(self.paths_modules)
+            assert profile["methods"]["augmentations.is_manifest_file(pointless-statement)"]["calls"] > 0
+            assert profile["msgs"]["sql-injection"]["seconds"] >= visit_call["seconds"]
+            seconds = [timing["seconds"] for timing in profile["methods"].values()]
+            assert seconds == sorted(seconds, reverse=True)
+
+            os.remove(profile_path)
+            pylint_res = self.run_pylint(
+                self.paths_modules, [*extra_params, f"--odoolint-profile={profile_path}", "--jobs=2"]
+            )
+            with open(profile_path, encoding="UTF-8") as f_profile:
+                jobs_profile = json.load(f_profile)
+            assert {name: timing["calls"] for name, timing in jobs_profile["methods"].items()} == {
+                name: timing["calls"] for name, timing in profile["methods"].items()
+            }
+
+    def test_198_transform_tl_call(self):
+        """The translation calls are transformed re-using the existing nodes without re-parsing them"""
+        checker = custom_logging.CustomLoggingChecker(PyLinter())
+        format_node = astroid.extract_node('msg = _(\n    "Hello {}",\n    "ctx",\n).format(name + "!")').value
+        first_arg = format_node.func.expr.args[0]
+        first_arg_position = (first_arg.lineno, first_arg.col_offset, first_arg.parent)
+        tl_call = checker.transform_formatcall2tlcall(format_node)
+        assert tl_call.as_string() == "_('Hello {}', 'ctx'.format(name + '!'))"
+        assert tl_call.args[0] is first_arg
+        assert (first_arg.lineno, first_arg.col_offset, first_arg.parent) == first_arg_position
+        assert tl_call.args[1].args == format_node.args
+        assert format_node.func.expr.args[-1].parent is format_node.func.expr
+        assert tl_call.args[-1].lineno == format_node.lineno
+        assert tl_call.args[-1].parent is tl_call
+
+        format_node = astroid.extract_node('_("Hello {}").format(name)')
+        tl_call = checker.transform_formatcall2tlcall(format_node)
+        assert tl_call.as_string() == "_('Hello {}'.format(name))"
+        assert (tl_call.args[0].lineno, tl_call.args[0].col_offset) == (format_node.lineno, format_node.col_offset)
+
+        binop_node = astroid.extract_node('_("Hello %s " + prefix) % name')
+        tl_call = checker.transform_binop2call(binop_node)
+        assert tl_call.as_string() == "_(('Hello %s ' + prefix) % name)"
+        assert tl_call.args[0].left is binop_node.left.args[0]
+        assert binop_node.left.args[0].parent is binop_node.left
+        assert tl_call.lineno == binop_node.lineno
+
+        # Starred arguments are still re-parsed
+        tl_call = checker.transform_binop2call(astroid.extract_node('_(*("Hello %s",)) % name'))
+        assert tl_call.as_string() == "_(*('Hello %s', ) % name)"
+
+        # The translation calls are checked by pylint the same way as its logging convenience functions
+        assert custom_logging.LOGGING_EQUIVALENT_FUNCTION in custom_logging.logging.CHECKED_CONVENIENCE_FUNCTIONS
+
+    def test_199_assignation_index(self):
+        """The assignations of a function are indexed once and released when leaving the module"""
+        checker = odoo_addons.OdooAddons(PyLinter())
+        module = astroid.parse("""
+def query(self, cr):
+    sql = "SELECT * FROM %s"
+    where = " WHERE id = %s" % self.id
+    sql = sql + where
+    cr.execute(sql)
+    cr.execute(where)
+""")
+        function = module.body[0]
+        sql_name, where_name = (call.args[0] for call in function.nodes_of_class(astroid.nodes.Call))
+        assert [value.as_string() for value in checker._get_assignation_nodes(sql_name)] == [
+            "'SELECT * FROM %s'",
+            "sql + where",
+        ]
+        assignations = function.odoo_assignations
+        assert [value.as_string() for value in checker._get_assignation_nodes(where_name)] == [
+            "' WHERE id = %s' % self.id"
+        ]
+        assert function.odoo_assignations is assignations
+        checker.leave_module(module)
+        assert not hasattr(function, "odoo_assignations")
+
+    def test_200_function_info(self):
+        """The methods are traversed once for the super calls, returns and write calls"""
+        checker = odoo_addons.OdooAddons(PyLinter())
+        module = astroid.parse("""
+class Model:
+    def write(self, vals):
+        super().write(vals)
+        self.child_ids.write(vals)
+        def nested():
+            return self.write({})
+        super(Model, self).write(vals)
+""")
+        function = module.body[0].body[0]
+        info = checker._get_function_info(function)
+        assert info["super"] and not info["return"]
+        assert info["super_attrnames"] == ["write", "write"]
+        assert [call.lineno for call in info["write_calls"]] == [4, 5, 7, 8]
+        assert checker._get_function_info(function) is info
+        checker.leave_module(module)
+        assert not hasattr(function, "odoo_function_info")
+
+    def test_201_odoo_models_class(self):
+        """The odoo model class of each class is resolved once until leaving the module"""
+        checker = odoo_addons.OdooAddons(PyLinter())
+        module = astroid.parse("""
+from odoo import models
+class Wizard(models.TransientModel):
+    pass
+class Other(object):
+    pass
+""")
+        wizard, other = module.body[1:]
+        odoo_models_class = checker.get_odoo_models_class(wizard)
+        assert odoo_models_class == ("TransientModel", wizard.bases[0])
+        assert checker.get_odoo_models_class(other) is None
+        wizard.bases = []
+        other.bases = []
+        assert checker.get_odoo_models_class(wizard) is odoo_models_class
+        assert checker.get_odoo_models_class(other) is None
+        checker.leave_module(module)
+        assert not hasattr(wizard, "odoo_models_class") and not hasattr(other, "odoo_models_class")
+
+    def test_202_manifest_options_compiled(self):
+        """The options of the manifest checks are compiled again only if they change"""
+        pylint_res = self.run_pylint(self.paths_modules)
+        checker = next(
+            checker for checker in pylint_res.linter.get_checkers() if isinstance(checker, odoo_addons.OdooAddons)
+        )
+        version_rgx = checker._manifest_version_rgx
+        checker.open()
+        assert checker._manifest_version_rgx is version_rgx
+        assert checker.formatversion("16.0.1.0.0")[0]
+        pylint_res.linter.config.license_allowed = ["LGPL-3"]
+        pylint_res.linter.config.valid_odoo_versions = ["17.0"]
+        checker.open()
+        assert checker._license_allowed == {"LGPL-3"}
+        assert checker._manifest_version_rgx is not version_rgx
+        assert not checker.formatversion("16.0.1.0.0")[0]
+        assert checker.formatversion("17.0.1.0.0")[0]
+
+    def test_203_placeholders_memoized(self):
+        """The placeholders of the same string are parsed only once for all the checkers"""
+        for parser in (
+            placeholders.get_format_str_args_kwargs,
+            placeholders.get_printf_str_args_kwargs,
+            placeholders.parse_logging_format_string,
+        ):
+            parser.cache_clear()
+        extra_params = [
+            "--disable=all",
+            "--enable=translation-positional-used,translation-too-few-args,translation-too-many-args",
+        ]
+        pylint_res = self.run_pylint(self.paths_modules, extra_params)
+        real_errors = pylint_res.linter.stats.by_msg
+        expected_errors = {
+            msg: EXPECTED_ERRORS[msg]
+            for msg in ("translation-positional-used", "translation-too-few-args", "translation-too-many-args")
+        }
+        self.assert_dict_equal(real_errors, expected_errors)
+        for parser, has_hits in (
+            (placeholders.get_format_str_args_kwargs, True),
+            (placeholders.get_printf_str_args_kwargs, True),
+            (placeholders.parse_logging_format_string, False),
+        ):
+            cache_info = parser.cache_info()
+            assert cache_info.misses and (cache_info.hits or not has_hits), cache_info
+        assert placeholders.get_format_str_args_kwargs("{} {} {var}") == (range(2), {"var": 0})
+        assert placeholders.get_printf_str_args_kwargs("%s %d %%s") == ("", 0)
+        assert placeholders.get_printf_str_args_kwargs("%(var)s") == {"var": ""}
+        assert placeholders.parse_logging_format_string("%s %s", "old") == (2, False, None, False)
+        assert placeholders.parse_logging_format_string("{} {var}", "new") == (2, False, None, False)
+        assert placeholders.parse_logging_format_string("%y", "old") == (0, False, 1, False)
+        assert placeholders.parse_logging_format_string("%(", "old") == (0, False, None, True)
+
+    def test_204_translation_format_upstream(self):
+        """The format strings of the translation calls with arguments must emit the same messages
+        as pylint's own logging checker (renamed translation-*) for both format styles"""
+        tl_calls = []
+        for path in glob(os.path.join(self.root_path_modules, "**", "*.py"), recursive=True):
+            try:
+                module = astroid.MANAGER.ast_from_file(path)
+            except astroid.AstroidBuildingError:
+                continue
+            tl_calls.extend(
+                call
+                for call in module.nodes_of_class(astroid.nodes.Call)
+                if odoo_addons.OdooAddons.get_func_name(call.func) == "_"
+                and call.args
+                and isinstance(call.args[0], astroid.nodes.Const)
+            )
+        for call_src in (
+            '_("%s %s", a)',
+            '_("%s", a, b)',
+            '_("%y", a)',
+            '_("%(", a)',
+            '_("%(key)s", a)',
+            '_("{} {}", a)',
+            '_("{0} {key}", a, b, c)',
+            '_("{", a)',
+            '_(b"%s", a)',
+            "_(1, a)",
+        ):
+            tl_calls.append(astroid.extract_node(call_src))
+        tl_calls = [call for call in tl_calls if custom_logging.logging._count_supplied_tokens(call.args[1:])]
+        assert len(tl_calls) > 10
+
+        checker = custom_logging.CustomLoggingChecker(PyLinter())
+        upstream_checker = custom_logging.logging.LoggingChecker(PyLinter())
+        for format_style in ("old", "new"):
+            checker._format_style = upstream_checker._format_style = format_style
+            for tl_call in tl_calls:
+                with patch.object(checker, "add_message") as add_message, patch.object(
+                    upstream_checker, "add_message"
+                ) as upstream_add_message:
+                    checker._check_format_string(tl_call, 0)
+                    upstream_checker._check_format_string(tl_call, 0)
+                assert add_message.call_args_list == upstream_add_message.call_args_list, tl_call.as_string()
+
     def test_format_version_value_error(self):
         """Test --valid-odoo-versions to force a value error exception"""
         extra_params = [
@@ -854,6 +1463,310 @@ def fstring_no_sqli(self):
             no_module_path = os.path.join(repo_path, "no_module")
             os.makedirs(no_module_path)
             assert misc.walk_up(no_module_path, tuple(misc.MANIFEST_FILES), top) is None
+            # A directory with the name of a manifest is not a manifest but a link to a file is
+            dir_module_path = os.path.join(repo_path, "dir_module")
+            os.makedirs(os.path.join(dir_module_path, "__manifest__.py"))
+            assert misc.walk_up(dir_module_path, tuple(misc.MANIFEST_FILES), top) is None
+            link_module_path = os.path.join(repo_path, "link_module")
+            os.makedirs(link_module_path)
+            os.symlink(manifest_path, os.path.join(link_module_path, "__openerp__.py"))
+            assert misc.walk_up(link_module_path, tuple(misc.MANIFEST_FILES), top) == os.path.join(
+                link_module_path, "__openerp__.py"
+            )
+
+    def test_addon_index(self):
+        """Test the files of the odoo modules are scanned once per module"""
+        with TemporaryDirectory() as tmp_dir:
+            repo_path = os.path.join(tmp_dir, "repo")
+            module_path = os.path.join(repo_path, "module")
+            views_path = os.path.join(module_path, "views")
+            os.makedirs(views_path)
+            os.makedirs(os.path.join(repo_path, ".git"))
+            os.makedirs(os.path.join(module_path, "migrations", "17.0.1.0.1"))
+            os.makedirs(os.path.join(module_path, "nested_module"))
+            manifest_path = os.path.join(module_path, "__manifest__.py")
+            for file_path in (
+                manifest_path,
+                os.path.join(module_path, "README.rst"),
+                os.path.join(views_path, "views.xml"),
+                os.path.join(module_path, "nested_module", "__manifest__.py"),
+            ):
+                with open(file_path, "w", encoding="utf-8") as f_file:
+                    f_file.write("{}")
+
+            index = addon_index.AddonIndex()
+            assert index.get_manifest_path(views_path) == manifest_path
+            addon = index.get_addon(module_path)
+            assert addon.migrations == ("17.0.1.0.1",)
+            assert addon.isfile("README.rst")
+            assert addon.isfile("views/views.xml")
+            assert addon.isfile("./views/../views/views.xml")
+            assert not addon.isfile("views")
+            assert not addon.isfile("views/missing.xml")
+            # Created after the scan, so it is not found
+            with open(os.path.join(views_path, "new.xml"), "w", encoding="utf-8") as f_file:
+                f_file.write("")
+            assert not addon.isfile("views/new.xml")
+            # The nested modules are not scanned so they are checked in the filesystem
+            with open(os.path.join(module_path, "nested_module", "new.xml"), "w", encoding="utf-8") as f_file:
+                f_file.write("")
+            assert addon.isfile("nested_module/new.xml")
+            assert index.get_manifest_path(os.path.join(module_path, "migrations", "17.0.1.0.1")) == manifest_path
+            assert index.get_manifest_path(repo_path) is None
+
+            # The VCS directories (even in the root of the module) and the vendored ones are not scanned
+            skipped_dirs = (
+                ".git",
+                ".hg",
+                os.path.join("views", ".svn"),
+                "node_modules",
+                os.path.join("static", "lib"),
+            )
+            for skipped_dir in skipped_dirs:
+                os.makedirs(os.path.join(module_path, skipped_dir, "sub"))
+                with open(os.path.join(module_path, skipped_dir, "sub", "file.js"), "w", encoding="utf-8") as f_file:
+                    f_file.write("")
+            addon = addon_index.Addon(module_path)
+            for skipped_dir in skipped_dirs:
+                assert skipped_dir in addon.unscanned_dirs
+                assert not any(relpath.startswith(skipped_dir + os.sep) for relpath in addon.files)
+                assert not any(reldir.startswith(skipped_dir) for reldir in addon.dirs)
+                assert addon.isfile(os.path.join(skipped_dir, "sub", "file.js"))
+            assert "views/views.xml" in addon.files
+
+    def test_addon_index_manifest(self):
+        """Test the manifest is parsed only once from the astroid node or the file"""
+        manifest_src = '{"name": "Module", "version": -1.5, "depends": ["base"], "data": ("a.xml",), "x": {None}}'
+        dict_node = astroid.extract_node(manifest_src)
+        assert addon_index.literal_eval_node(dict_node) == ast_mod.literal_eval(manifest_src)
+        for invalid_src in ('{"key": "" or ""}', '{**{"key": 1}}', '{"key": f"{1}"}'):
+            with pytest.raises(ValueError):
+                addon_index.literal_eval_node(astroid.extract_node(invalid_src))
+
+        with TemporaryDirectory() as tmp_dir:
+            manifest_path = os.path.join(tmp_dir, "module", "__manifest__.py")
+            os.makedirs(os.path.dirname(manifest_path))
+            with open(manifest_path, "w", encoding="utf-8") as f_manifest:
+                f_manifest.write(f"# Comment\n{manifest_src}\n")
+            index = addon_index.AddonIndex()
+            manifest = index.get_manifest(manifest_path)
+            assert manifest.module_name == "module"
+            assert manifest.data == ast_mod.literal_eval(manifest_src)
+            assert index.get_manifest(manifest_path) is manifest
+            # Parsed again from the node or if the file is modified
+            manifest_node = index.get_manifest(manifest_path, dict_node)
+            assert manifest_node is not manifest
+            assert index.get_manifest(manifest_path) is manifest_node
+            with open(manifest_path, "w", encoding="utf-8") as f_manifest:
+                f_manifest.write("{'key': '' or ''}")
+            os.utime(manifest_path, ns=(0, 0))
+            assert index.get_manifest(manifest_path).data is None
+
+    def test_benchmark(self):
+        """Test the benchmark harness with small synthetic modules"""
+        from . import benchmark  # pylint: disable=import-outside-toplevel
+
+        with TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "benchmark.json")
+            argv = ["--addons=1", "--models=2", "--fields=2", "--executes=1", "--inherits=2", "--data=3", "--jobs=0"]
+            with _patch_streams(StringIO()):
+                report = benchmark.main([*argv, f"--output={output_path}"])
+            with open(output_path, encoding="UTF-8") as f_output:
+                assert json.load(f_output) == json.loads(json.dumps(report))
+            serial = report["results"]["serial"]
+            assert serial["messages"]
+            assert "jobs" not in report["results"]
+            assert {name: timings["calls"] > 0 for name, timings in serial["checks"].items()} == {
+                name: True for name, _checker_class, _method_name in benchmark.CHECK_FAMILIES
+            }
+            # The check methods are restored
+            assert "visit_call" in custom_logging.CustomLoggingChecker.__dict__
+            assert not hasattr(odoo_addons.OdooAddons.visit_call, "__wrapped__")
+            assert report["results"]["walk_up"]["calls"] == 2
+            assert len(benchmark.compare(report["results"], report)) == len(benchmark.CHECK_FAMILIES) + 2
+
+    def test_changed_since(self):
+        """Test only the files changed since a git reference and the files depending on them are checked"""
+        with TemporaryDirectory() as tmp_dir:
+            repo_path = os.path.realpath(tmp_dir)
+            module_files = {
+                "__manifest__.py": "{'name': 'Module', 'license': 'AGPL-3', 'author': 'Odoo Community Association (OCA)'}",
+                "__init__.py": "",
+                os.path.join("models", "__init__.py"): "",
+                os.path.join("models", "partner.py"): "class Partner:\n    _inherit = 'res.partner'\n",
+                os.path.join("models", "partner2.py"): "class Partner2:\n    _inherit = 'res.partner'\n",
+                os.path.join("models", "user.py"): "class User:\n    _inherit = 'res.users'\n",
+                os.path.join(
+                    "models", "partner3.py"
+                ): "class Partner3:\n    _inherit = ['mail.thread', 'res.partner']\n",
+            }
+            paths = []
+            for module_name in ("module", "other_module"):
+                for relpath, content in module_files.items():
+                    path = os.path.join(repo_path, module_name, relpath)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "w", encoding="utf-8") as f_file:
+                        f_file.write(content)
+                    paths.append(path)
+            git_cmd = ["git", "-C", repo_path, "-c", "user.name=test", "-c", "user.email=test@test.com"]
+            subprocess.run([*git_cmd, "init", "-q"], check=True)
+            subprocess.run([*git_cmd, "add", "."], check=True)
+            subprocess.run([*git_cmd, "commit", "-q", "-m", "init"], check=True)
+            with open(os.path.join(repo_path, "module", "models", "partner.py"), "a", encoding="utf-8") as f_file:
+                f_file.write("\n")
+
+            extra_params = ["--disable=all", "--enable=consider-merging-classes-inherited,missing-readme"]
+            pylint_res = self.run_pylint(paths, [*extra_params, "--odoolint-changed-since=HEAD"])
+            # by_module includes the rcfile too
+            assert sorted(modname for modname in pylint_res.linter.stats.by_module if "module" in modname) == [
+                "module.__manifest__",
+                "module.models.partner",
+                "module.models.partner2",
+                "module.models.partner3",
+            ]
+            self.assert_dict_equal(
+                pylint_res.linter.stats.by_msg, {"consider-merging-classes-inherited": 1, "missing-readme": 1}
+            )
+
+            # Changing the manifest without changing "depends" checks only the manifest
+            other_manifest_path = os.path.join(repo_path, "other_module", "__manifest__.py")
+            with open(other_manifest_path, "w", encoding="utf-8") as f_file:
+                f_file.write(module_files["__manifest__.py"][:-1] + ", 'version': '17.0.1.0.0'}")
+            pylint_res = self.run_pylint(paths, [*extra_params, "--odoolint-changed-since=HEAD"])
+            assert sorted(modname for modname in pylint_res.linter.stats.by_module if "other_module" in modname) == [
+                "other_module.__manifest__"
+            ]
+            # Changing "depends" checks all the python files of the module
+            with open(other_manifest_path, "w", encoding="utf-8") as f_file:
+                f_file.write(module_files["__manifest__.py"][:-1] + ", 'depends': ['mail']}")
+            pylint_res = self.run_pylint(paths, [*extra_params, "--odoolint-changed-since=HEAD"])
+            assert sorted(modname for modname in pylint_res.linter.stats.by_module if "other_module" in modname) == [
+                "other_module.__init__",
+                "other_module.__manifest__",
+                "other_module.models.__init__",
+                "other_module.models.partner",
+                "other_module.models.partner2",
+                "other_module.models.partner3",
+                "other_module.models.user",
+            ]
+
+            # Invalid reference so all the files are checked
+            with pytest.warns(UserWarning, match="It was not possible to get the files changed since"):
+                pylint_res = self.run_pylint(paths, [*extra_params, "--odoolint-changed-since=invalid-ref"])
+            self.assert_dict_equal(
+                pylint_res.linter.stats.by_msg, {"consider-merging-classes-inherited": 2, "missing-readme": 2}
+            )
+
+    def test_manifests_only(self):
+        """Linting only the manifests must emit the same messages than linting all the files"""
+        extra_params = ["--disable=all", "--enable=odoolint"]
+        pylint_res = self.run_pylint(self.paths_modules, extra_params)
+        expected_messages = {
+            check: sorted(line for line in lines if os.path.basename(line.split(":", 1)[0]) in misc.MANIFEST_FILES)
+            for check, lines in self._get_messages_from_output(pylint_res).items()
+        }
+        expected_messages = {check: lines for check, lines in expected_messages.items() if lines}
+
+        manifest_res = TextReporter(StringIO())
+        run = manifest_linter.ManifestRun(
+            self.default_options + extra_params + [self.root_path_modules], reporter=manifest_res, exit=False
+        )
+        manifest_messages = {
+            check: sorted(lines) for check, lines in self._get_messages_from_output(manifest_res).items()
+        }
+        assert manifest_messages == expected_messages
+        assert "manifest-required-author" in manifest_messages
+        assert "resource-not-exist" in manifest_messages
+        # The python files are not checked
+        assert not [modname for modname in run.linter.stats.by_module if ".models." in modname]
+
+    def test_ndjson_reporter(self):
+        """The odoolint-ndjson reporter must write a JSON line for each odoolint message"""
+        pylint_res = self.run_pylint(self.paths_modules)
+        expected_messages = {check: len(lines) for check, lines in self._get_messages_from_output(pylint_res).items()}
+
+        reporter = ndjson_reporter.NDJSONReporter(StringIO())
+        cmd = self.default_options + self.default_extra_params + ["--enable=missing-module-docstring"]
+        cmd += self.paths_modules
+        with open(os.devnull, "w", encoding="UTF-8") as f_dummy:
+            self._run_pylint(cmd, f_dummy, reporter=reporter)
+        msgs_json = [json.loads(line) for line in reporter.out.getvalue().splitlines()]
+        assert dict(Counter(msg_json["symbol"] for msg_json in msgs_json)) == expected_messages
+        msg_json = next(msg_json for msg_json in msgs_json if msg_json["symbol"] == "manifest-required-author")
+        assert msg_json["message-id"] == "C8101"
+        assert os.path.basename(msg_json["path"]) in misc.MANIFEST_FILES
+        assert msg_json["line"] and msg_json["column"] is not None
+        assert msg_json["addon"] == os.path.basename(os.path.dirname(msg_json["path"]))
+        msg_json = next(msg_json for msg_json in msgs_json if msg_json["symbol"] == "no-raise-unlink")
+        assert (msg_json["odoo_minversion"], msg_json["odoo_maxversion"]) == ("15.0", None)
+        # Not odoolint messages are not written
+        assert reporter.linter.stats.by_msg["missing-module-docstring"]
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available")
+    def test_serve(self):
+        """The server must lint again only the files sent re-using the linter
+        but refreshing the files changed between the requests"""
+        with TemporaryDirectory() as tmp_dir:
+            module_path = os.path.join(os.path.realpath(tmp_dir), "module")
+            model_path = os.path.join(module_path, "models", "res_partner.py")
+            os.makedirs(os.path.dirname(model_path))
+            with open(os.path.join(module_path, "__manifest__.py"), "w", encoding="UTF-8") as f_manifest:
+                f_manifest.write(
+                    "{'name': 'Module', 'license': 'AGPL-3', 'author': 'Odoo Community Association (OCA)'}"
+                )
+            with open(model_path, "w", encoding="UTF-8") as f_model:
+                f_model.write("from odoo import _\n\n\ndef f(value):\n    return _('Value %s') % value\n")
+            request = {"files": [model_path, os.path.join(module_path, "__manifest__.py")], "cwd": tmp_dir}
+            lint_server = server.LintServer(
+                ["--disable=all", "--enable=translation-not-lazy,missing-readme", "--score=no", "--persistent=no"]
+            )
+            response = lint_server.handle_request(request)
+            assert "(translation-not-lazy)" in response["output"]
+            assert "(missing-readme)" in response["output"]
+            assert response["status"] == 20
+            linter = lint_server.linter
+
+            with open(model_path, "w", encoding="UTF-8") as f_model:
+                f_model.write("from odoo import _\n\n\ndef f(value):\n    return _('Value %s', value)\n")
+            os.utime(model_path, ns=(0, 0))
+            with open(os.path.join(module_path, "README.rst"), "w", encoding="UTF-8") as f_readme:
+                f_readme.write("Module\n")
+            # The paths resolved before the changes of the tree are forgotten
+            stale_key = (module_path, tuple(misc.MANIFEST_FILES), "/stale-top")
+            misc._walk_up_cache[stale_key] = None
+            response = lint_server.handle_request(request)
+            assert lint_server.linter is linter
+            assert response == {"output": "", "status": 0}
+            assert stale_key not in misc._walk_up_cache
+
+            response = lint_server.handle_request({"files": [], "cwd": tmp_dir})
+            assert response["status"] == server.ERROR_STATUS
+
+            # The server and the client in other processes
+            socket_path = os.path.join(tmp_dir, "pylint-odoo.sock")
+            server_args = ["--disable=all", "--enable=translation-not-lazy", "--score=no", "--persistent=no"]
+            with subprocess.Popen(
+                [sys.executable, "-m", "pylint_odoo", "--serve", f"--socket={socket_path}", *server_args]
+            ) as server_process:
+                try:
+                    for _retry in range(100):
+                        if os.path.exists(socket_path) or server_process.poll() is not None:
+                            break
+                        time.sleep(0.1)
+                    output, status = server.send_request(socket_path, [model_path])
+                    assert (output, status) == ("", 0)
+                    for invalid_request in (b"not json", b"\xff"):
+                        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                            client.connect(socket_path)
+                            client.sendall(invalid_request)
+                            client.shutdown(socket.SHUT_WR)
+                            with client.makefile("rb") as f_response:
+                                response = json.loads(f_response.read().decode("UTF-8"))
+                        assert response["status"] == server.ERROR_STATUS
+                        assert response["output"].startswith("Invalid request: ")
+                finally:
+                    server_process.terminate()
+            assert not os.path.exists(socket_path)
 
     @pytest.mark.skipif(
         sys.platform.startswith("win"),